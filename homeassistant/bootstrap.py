@@ -10,7 +10,7 @@ import os
 import sys
 import threading
 from time import monotonic
-from typing import TYPE_CHECKING, Any
+from typing import TYPE_CHECKING, Any, cast
 
 import voluptuous as vol
 import yarl
@@ -19,7 +19,12 @@ from homeassistant import config as conf_util, config_entries, core, loader
 from homeassistant.components import http
 from homeassistant.const import REQUIRED_NEXT_PYTHON_DATE, REQUIRED_NEXT_PYTHON_VER
 from homeassistant.exceptions import HomeAssistantError
-from homeassistant.helpers import area_registry, device_registry, entity_registry
+from homeassistant.helpers import (
+    area_registry,
+    device_registry,
+    entity_registry,
+    storage,
+)
 from homeassistant.helpers.typing import ConfigType
 from homeassistant.setup import (
     DATA_SETUP,
@@ -40,11 +45,17 @@ ERROR_LOG_FILENAME = "home-assistant.log"
 
 # hass.data key for logging information.
 DATA_LOGGING = "logging"
+# hass.data key for the timeline of the integration setups
+DATA_SETUP_TIMELINE = "setup_timeline"
+
+SETUP_TIMELINE_KEY = "core.setup_timeline"
+SETUP_TIMELINE_VERSION = 1
+# Seconds an integration has to be slower than on the previous start to be logged
+SLOWER_SETUP_THRESHOLD = 1
 
 LOG_SLOW_STARTUP_INTERVAL = 60
 
-STAGE_1_TIMEOUT = 120
-STAGE_2_TIMEOUT = 300
+SETUP_TIMEOUT = 420
 WRAP_UP_TIMEOUT = 300
 COOLDOWN_TIME = 60
 
@@ -423,6 +434,141 @@ async def async_setup_multi_components(
         )
 
 
+async def async_setup_scheduled_components(
+    hass: core.HomeAssistant,
+    domains: list[str],
+    wait_for: dict[str, set[str]],
+    config: dict[str, Any],
+    setup_started: dict[str, datetime],
+    timeline: dict[str, dict[str, Any]],
+) -> None:
+    """Set up each domain as soon as the domains it waits for are done.
+
+    The offset from the start and the duration of each setup is recorded
+    in the timeline.
+    """
+    start = monotonic()
+    done = {domain: asyncio.Event() for domain in domains}
+    started: dict[str, float] = {}
+
+    async def async_setup_when_ready(domain: str) -> bool:
+        """Wait for the domains this domain depends on and set it up."""
+        waiting = [done[dep].wait() for dep in wait_for[domain]]
+        if waiting:
+            await asyncio.gather(*waiting)
+
+        setup_start = started[domain] = monotonic()
+        success = False
+        try:
+            success = await async_setup_component(hass, domain, config)
+            return success
+        finally:
+            timeline[domain] = {
+                "start": setup_start - start,
+                "duration": monotonic() - setup_start,
+                "success": success,
+            }
+            done[domain].set()
+
+    futures = {
+        domain: hass.async_create_task(async_setup_when_ready(domain))
+        for domain in domains
+    }
+    log_task = asyncio.create_task(
+        _async_log_pending_setups(hass, set(domains), setup_started)
+    )
+    try:
+        await asyncio.wait(futures.values())
+    finally:
+        log_task.cancel()
+        # Setups still pending when the stage timed out did not succeed
+        # in time, they update their entry if they finish later
+        now = monotonic()
+        for domain in domains:
+            if domain not in timeline:
+                setup_start = started.get(domain, now)
+                timeline[domain] = {
+                    "start": setup_start - start,
+                    "duration": now - setup_start,
+                    "success": False,
+                }
+
+    for domain, future in futures.items():
+        if future.cancelled():
+            continue
+        exception = future.exception()
+        if exception is None:
+            continue
+        _LOGGER.error(
+            "Error setting up integration %s - received exception",
+            domain,
+            exc_info=(type(exception), exception, exception.__traceback__),
+        )
+
+
+def _get_critical_path(
+    timeline: dict[str, dict[str, Any]], wait_for: dict[str, set[str]]
+) -> list[str]:
+    """Return the chain of setups that determined when the last one finished."""
+
+    def end(domain: str) -> float:
+        return cast(float, timeline[domain]["start"] + timeline[domain]["duration"])
+
+    if not timeline:
+        return []
+
+    path = [max(timeline, key=end)]
+    while True:
+        deps = [dep for dep in wait_for.get(path[-1], ()) if dep in timeline]
+        if not deps:
+            break
+        path.append(max(deps, key=end))
+
+    return path[::-1]
+
+
+async def _async_save_setup_timeline(
+    hass: core.HomeAssistant,
+    timeline: dict[str, dict[str, Any]],
+    wait_for: dict[str, set[str]],
+) -> None:
+    """Log the critical path of the setup and store it to compare on next start."""
+    critical_path = _get_critical_path(timeline, wait_for)
+    data = hass.data[DATA_SETUP_TIMELINE] = {
+        "integrations": timeline,
+        "critical_path": critical_path,
+    }
+    if not critical_path:
+        return
+
+    _LOGGER.info(
+        "Setup critical path: %s",
+        " -> ".join(
+            f"{domain} ({timeline[domain]['duration']:.2f}s)"
+            for domain in critical_path
+        ),
+    )
+
+    store = storage.Store(hass, SETUP_TIMELINE_VERSION, SETUP_TIMELINE_KEY)
+    previous = await store.async_load()
+
+    if isinstance(previous, dict):
+        before = previous["integrations"]
+        slower = [
+            f"{domain} ({info['duration']:.2f}s, was {before[domain]['duration']:.2f}s)"
+            for domain, info in timeline.items()
+            if domain in before
+            and info["duration"] - before[domain]["duration"] > SLOWER_SETUP_THRESHOLD
+        ]
+        if slower:
+            _LOGGER.info(
+                "Integrations that took longer to set up than on the previous start: %s",
+                ", ".join(slower),
+            )
+
+    await store.async_save(data)
+
+
 async def _async_set_up_integrations(
     hass: core.HomeAssistant, config: dict[str, Any]
 ) -> None:
@@ -509,6 +655,23 @@ async def _async_set_up_integrations(
             deps_promotion.update(dep_itg.all_dependencies)
 
     stage_2_domains = domains_to_setup - logging_domains - debuggers - stage_1_domains
+    scheduled_domains = stage_1_domains | stage_2_domains
+
+    # Stage 1 integrations ignore their after dependencies so they are not
+    # delayed by stage 2. Other integrations wait for both kinds.
+    wait_for: dict[str, set[str]] = {}
+    stage_1_after_dependencies: set[str] = set()
+    for domain in scheduled_domains:
+        itg = integration_cache.get(domain)
+        if itg is None:
+            wait_for[domain] = set()
+        elif domain in stage_1_domains:
+            wait_for[domain] = set(itg.dependencies) & scheduled_domains
+            stage_1_after_dependencies.update(itg.after_dependencies)
+        else:
+            wait_for[domain] = (
+                set(itg.dependencies) | set(itg.after_dependencies)
+            ) & scheduled_domains
 
     # Load the registries
     await asyncio.gather(
@@ -517,33 +680,30 @@ async def _async_set_up_integrations(
         area_registry.async_load(hass),
     )
 
-    # Start setup
-    if stage_1_domains:
-        _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
-        try:
-            async with hass.timeout.async_timeout(
-                STAGE_1_TIMEOUT, cool_down=COOLDOWN_TIME
-            ):
-                await async_setup_multi_components(
-                    hass, stage_1_domains, config, setup_started
-                )
-        except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 1 - moving forward")
-
     # Enables after dependencies
-    async_set_domains_to_be_loaded(hass, stage_2_domains)
+    async_set_domains_to_be_loaded(hass, stage_2_domains - stage_1_after_dependencies)
+
+    timeline: dict[str, dict[str, Any]] = {}
 
-    if stage_2_domains:
+    # Start setup
+    if scheduled_domains:
+        _LOGGER.info("Setting up stage 1: %s", stage_1_domains)
         _LOGGER.info("Setting up stage 2: %s", stage_2_domains)
         try:
             async with hass.timeout.async_timeout(
-                STAGE_2_TIMEOUT, cool_down=COOLDOWN_TIME
+                SETUP_TIMEOUT, cool_down=COOLDOWN_TIME
             ):
-                await async_setup_multi_components(
-                    hass, stage_2_domains, config, setup_started
+                await async_setup_scheduled_components(
+                    hass,
+                    # Start stage 1 first as it contains the frontend
+                    [*stage_1_domains, *stage_2_domains],
+                    wait_for,
+                    config,
+                    setup_started,
+                    timeline,
                 )
         except asyncio.TimeoutError:
-            _LOGGER.warning("Setup timed out for stage 2 - moving forward")
+            _LOGGER.warning("Setup timed out - moving forward")
 
     # Wrap up startup
     _LOGGER.debug("Waiting for startup to wrap up")
@@ -552,3 +712,5 @@ async def _async_set_up_integrations(
             await hass.async_block_till_done()
     except asyncio.TimeoutError:
         _LOGGER.warning("Setup timed out for bootstrap - moving forward")
+
+    await _async_save_setup_timeline(hass, timeline, wait_for)
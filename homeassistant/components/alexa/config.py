@@ -10,6 +10,8 @@ class AbstractConfig(ABC):
     """Hold the configuration for Alexa."""
 
     _unsub_proactive_report = None
+    # Batcher of the last time proactive mode was enabled, holds its metrics
+    report_batcher = None
 
     def __init__(self, hass):
         """Initialize abstract config."""
@@ -10,6 +10,7 @@ import async_timeout
 
 from homeassistant.const import HTTP_ACCEPTED, MATCH_ALL, STATE_ON
 from homeassistant.core import HomeAssistant, State, callback
+from homeassistant.helpers.report_batcher import ReportBatcher
 from homeassistant.helpers.significant_change import create_checker
 import homeassistant.util.dt as dt_util
 
@@ -19,6 +20,8 @@ from .messages import AlexaResponse
 
 _LOGGER = logging.getLogger(__name__)
 DEFAULT_TIMEOUT = 10
+# Time to collect state changes before reporting them
+CHANGE_REPORT_WINDOW = 1
 
 
 async def async_enable_proactive_mode(hass, smart_home_config):
@@ -44,6 +47,34 @@ async def async_enable_proactive_mode(hass, smart_home_config):
 
     checker = await create_checker(hass, DOMAIN, extra_significant_check)
 
+    async def async_send_changereports(reports):
+        """Send the latest ChangeReport of each changed entity."""
+        # A ChangeReport event describes a single endpoint
+        results = await asyncio.gather(
+            *(
+                async_send_changereport_message(
+                    hass, smart_home_config, alexa_entity, alexa_properties
+                )
+                for alexa_entity, alexa_properties in reports.values()
+            ),
+            return_exceptions=True,
+        )
+
+        failed = []
+        for entity_id, result in zip(reports, results):
+            if isinstance(result, Exception):
+                _LOGGER.error(
+                    "Error sending ChangeReport for %s",
+                    entity_id,
+                    exc_info=result,
+                )
+                failed.append(entity_id)
+        return failed
+
+    batcher = smart_home_config.report_batcher = ReportBatcher(
+        hass, _LOGGER, delay=CHANGE_REPORT_WINDOW, function=async_send_changereports
+    )
+
     async def async_entity_state_listener(
         changed_entity: str,
         old_state: State | None,
@@ -95,14 +126,19 @@ async def async_enable_proactive_mode(hass, smart_home_config):
         ):
             return
 
-        await async_send_changereport_message(
-            hass, smart_home_config, alexa_changed_entity, alexa_properties
-        )
+        batcher.async_add(changed_entity, (alexa_changed_entity, alexa_properties))
 
-    return hass.helpers.event.async_track_state_change(
+    unsub = hass.helpers.event.async_track_state_change(
         MATCH_ALL, async_entity_state_listener
     )
 
+    @callback
+    def unsub_all():
+        unsub()
+        batcher.async_cancel()
+
+    return unsub_all
+
 
 async def async_send_changereport_message(
     hass, config, alexa_entity, alexa_properties, *, invalidate_access_token=True
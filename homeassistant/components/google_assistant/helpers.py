@@ -91,6 +91,8 @@ class AbstractConfig(ABC):
     """Hold the configuration for Google Assistant."""
 
     _unsub_report_state = None
+    # Batcher of the last time report state was enabled, holds its metrics
+    report_batcher = None
 
     def __init__(self, hass):
         """Initialize abstract config."""
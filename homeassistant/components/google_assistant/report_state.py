@@ -4,6 +4,7 @@ import logging
 from homeassistant.const import MATCH_ALL
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.helpers.event import async_call_later
+from homeassistant.helpers.report_batcher import ReportBatcher
 from homeassistant.helpers.significant_change import create_checker
 
 from .const import DOMAIN
@@ -14,6 +15,9 @@ from .helpers import AbstractConfig, GoogleEntity, async_get_entities
 # https://github.com/actions-on-google/smart-home-nodejs/issues/196#issuecomment-439156639
 INITIAL_REPORT_DELAY = 60
 
+# Time to collect state changes to report in one request
+REPORT_STATE_WINDOW = 1
+
 
 _LOGGER = logging.getLogger(__name__)
 
@@ -23,7 +27,16 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
     """Enable state reporting."""
     checker = None
 
-    async def async_entity_state_listener(changed_entity, old_state, new_state):
+    async def async_report_states(states):
+        """Report the collected states in one request."""
+        await google_config.async_report_state_all({"devices": {"states": states}})
+
+    batcher = google_config.report_batcher = ReportBatcher(
+        hass, _LOGGER, delay=REPORT_STATE_WINDOW, function=async_report_states
+    )
+
+    @callback
+    def async_entity_state_listener(changed_entity, old_state, new_state):
         if not hass.is_running:
             return
 
@@ -49,9 +62,7 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
 
         _LOGGER.debug("Reporting state for %s: %s", changed_entity, entity_data)
 
-        await google_config.async_report_state_all(
-            {"devices": {"states": {changed_entity: entity_data}}}
-        )
+        batcher.async_add(changed_entity, entity_data)
 
     @callback
     def extra_significant_check(
@@ -102,5 +113,9 @@ def async_enable_report_state(hass: HomeAssistant, google_config: AbstractConfig
 
     unsub = async_call_later(hass, INITIAL_REPORT_DELAY, inital_report)
 
-    # pylint: disable=unnecessary-lambda
-    return lambda: unsub()
+    @callback
+    def unsub_all():
+        unsub()
+        batcher.async_cancel()
+
+    return unsub_all
@@ -1,11 +1,13 @@
 """Provide pre-made queries on top of the recorder component."""
 from __future__ import annotations
 
+import asyncio
 from collections import defaultdict
 from datetime import datetime as dt, timedelta
-from itertools import groupby
+from itertools import chain, groupby
 import json
 import logging
+import threading
 import time
 from typing import Iterable, cast
 
@@ -16,7 +18,9 @@ import voluptuous as vol
 
 from homeassistant.components import recorder
 from homeassistant.components.http import HomeAssistantView
+from homeassistant.components.recorder import statistics
 from homeassistant.components.recorder.models import (
+    StateAttributes,
     States,
     process_timestamp,
     process_timestamp_to_utc_isoformat,
@@ -27,6 +31,7 @@ from homeassistant.const import (
     CONF_ENTITIES,
     CONF_EXCLUDE,
     CONF_INCLUDE,
+    CONTENT_TYPE_JSON,
     HTTP_BAD_REQUEST,
 )
 from homeassistant.core import Context, State, split_entity_id
@@ -35,6 +40,7 @@ from homeassistant.helpers.entityfilter import (
     CONF_ENTITY_GLOBS,
     INCLUDE_EXCLUDE_BASE_FILTER_SCHEMA,
 )
+from homeassistant.helpers.json import JSONEncoder
 from homeassistant.helpers.typing import HomeAssistantType
 import homeassistant.util.dt as dt_util
 
@@ -48,6 +54,11 @@ CONF_ORDER = "use_include_order"
 STATE_KEY = "state"
 LAST_CHANGED_KEY = "last_changed"
 
+COMPACT_ENTITY_ID_KEY = "entity_id"
+COMPACT_LAST_UPDATED_KEY = "last_updated"
+COMPACT_STATE_KEY = "state"
+COMPACT_ATTRIBUTES_KEY = "attributes"
+
 GLOB_TO_SQL_CHARS = {
     42: "%",  # *
     46: "_",  # .
@@ -82,13 +93,25 @@ QUERY_STATES = [
     States.domain,
     States.entity_id,
     States.state,
-    States.attributes,
+    # Older rows store the attributes in the states table
+    func.coalesce(States.attributes, StateAttributes.shared_attrs).label("attributes"),
     States.last_changed,
     States.last_updated,
 ]
 
 HISTORY_BAKERY = "history_bakery"
 
+# Rows fetched per round trip and entities buffered when streaming
+STREAM_BATCH_SIZE = 1000
+STREAM_QUEUE_SIZE = 4
+
+
+def _query_states(session):
+    """Return a query for QUERY_STATES with the shared attributes joined."""
+    return session.query(*QUERY_STATES).outerjoin(
+        StateAttributes, States.attributes_id == StateAttributes.attributes_id
+    )
+
 
 def get_significant_states(hass, *args, **kwargs):
     """Wrap _get_significant_states with a sql session."""
@@ -106,6 +129,7 @@ def _get_significant_states(
     include_start_time_state=True,
     significant_changes_only=True,
     minimal_response=False,
+    compact_response=False,
 ):
     """
     Return states changes during UTC period start_time - end_time.
@@ -116,10 +140,47 @@ def _get_significant_states(
     """
     timer_start = time.perf_counter()
 
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
+    states = execute(
+        _significant_states_query(
+            hass,
+            session,
+            start_time,
+            end_time,
+            entity_ids,
+            filters,
+            significant_changes_only,
+        )
     )
 
+    if _LOGGER.isEnabledFor(logging.DEBUG):
+        elapsed = time.perf_counter() - timer_start
+        _LOGGER.debug("get_significant_states took %fs", elapsed)
+
+    return _sorted_states_to_json(
+        hass,
+        session,
+        states,
+        start_time,
+        entity_ids,
+        filters,
+        include_start_time_state,
+        minimal_response,
+        compact_response,
+    )
+
+
+def _significant_states_query(
+    hass,
+    session,
+    start_time,
+    end_time,
+    entity_ids,
+    filters,
+    significant_changes_only,
+):
+    """Return the query for the significant states ordered by entity_id."""
+    baked_query = hass.data[HISTORY_BAKERY](lambda session: _query_states(session))
+
     if significant_changes_only:
         baked_query += lambda q: q.filter(
             (
@@ -145,34 +206,73 @@ def _get_significant_states(
 
     baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
 
-    states = execute(
-        baked_query(session).params(
-            start_time=start_time, end_time=end_time, entity_ids=entity_ids
-        )
+    return baked_query(session).params(
+        start_time=start_time, end_time=end_time, entity_ids=entity_ids
     )
 
-    if _LOGGER.isEnabledFor(logging.DEBUG):
-        elapsed = time.perf_counter() - timer_start
-        _LOGGER.debug("get_significant_states took %fs", elapsed)
 
-    return _sorted_states_to_json(
+def _stream_significant_states(
+    hass,
+    session,
+    start_time,
+    end_time=None,
+    entity_ids=None,
+    filters=None,
+    include_start_time_state=True,
+    significant_changes_only=True,
+    minimal_response=False,
+    compact_response=False,
+):
+    """Yield the significant states of one entity at a time.
+
+    The rows are read in batches of STREAM_BATCH_SIZE from a server side
+    cursor so only the states of a single entity are held in memory.
+    Entities are yielded in the order of their entity_id, followed by the
+    entities that only have a state at the start time.
+    """
+    initial_states = {}
+    if include_start_time_state:
+        run = recorder.run_information_from_instance(hass, start_time)
+        for state in _get_states_with_session(
+            hass, session, start_time, entity_ids, run=run, filters=filters
+        ):
+            state.last_changed = start_time
+            state.last_updated = start_time
+            initial_states[state.entity_id] = state
+
+    states = _significant_states_query(
         hass,
         session,
-        states,
         start_time,
+        end_time,
         entity_ids,
         filters,
-        include_start_time_state,
-        minimal_response,
-    )
+        significant_changes_only,
+    ).with_post_criteria(lambda q: q.yield_per(STREAM_BATCH_SIZE))
+
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        ent_results = []
+        if ent_id in initial_states:
+            ent_results.append(initial_states.pop(ent_id))
+        if compact_response:
+            yield _entity_states_to_compact(
+                ent_id, ent_results, group, minimal_response
+            )
+            continue
+        _entity_states_to_json(ent_results, ent_id, group, minimal_response)
+        yield ent_results
+
+    for ent_id, state in initial_states.items():
+        if compact_response:
+            yield _entity_states_to_compact(ent_id, [state], (), minimal_response)
+        else:
+            yield [state]
 
 
 def state_changes_during_period(hass, start_time, end_time=None, entity_id=None):
     """Return states changes during UTC period start_time - end_time."""
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](lambda session: _query_states(session))
 
         baked_query += lambda q: q.filter(
             (States.last_changed == States.last_updated)
@@ -185,7 +285,9 @@ def state_changes_during_period(hass, start_time, end_time=None, entity_id=None)
             )
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(States.entity_id, States.last_updated)
@@ -206,13 +308,13 @@ def get_last_state_changes(hass, number_of_states, entity_id):
     start_time = dt_util.utcnow()
 
     with session_scope(hass=hass) as session:
-        baked_query = hass.data[HISTORY_BAKERY](
-            lambda session: session.query(*QUERY_STATES)
-        )
+        baked_query = hass.data[HISTORY_BAKERY](lambda session: _query_states(session))
         baked_query += lambda q: q.filter(States.last_changed == States.last_updated)
 
         if entity_id is not None:
-            baked_query += lambda q: q.filter_by(entity_id=bindparam("entity_id"))
+            baked_query += lambda q: q.filter(
+                States.entity_id == bindparam("entity_id")
+            )
             entity_id = entity_id.lower()
 
         baked_query += lambda q: q.order_by(
@@ -273,7 +375,7 @@ def _get_states_with_session(
     # We have more than one entity to look at (most commonly we want
     # all entities,) so we need to do a search on all states since the
     # last recorder run started.
-    query = session.query(*QUERY_STATES)
+    query = _query_states(session)
 
     most_recent_states_by_date = session.query(
         States.entity_id.label("max_entity_id"),
@@ -321,9 +423,7 @@ def _get_states_with_session(
 def _get_single_entity_states_with_session(hass, session, utc_point_in_time, entity_id):
     # Use an entirely different (and extremely fast) query if we only
     # have a single entity id
-    baked_query = hass.data[HISTORY_BAKERY](
-        lambda session: session.query(*QUERY_STATES)
-    )
+    baked_query = hass.data[HISTORY_BAKERY](lambda session: _query_states(session))
     baked_query += lambda q: q.filter(
         States.last_updated < bindparam("utc_point_in_time"),
         States.entity_id == bindparam("entity_id"),
@@ -347,11 +447,13 @@ def _sorted_states_to_json(
     filters=None,
     include_start_time_state=True,
     minimal_response=False,
+    compact_response=False,
 ):
     """Convert SQL results into JSON friendly data structure.
 
     This takes our state list and turns it into a JSON friendly data
     structure {'entity_id': [list of states], 'entity_id2': [list of states]}
+    or with compact_response {'entity_id': {compact states}}
 
     States must be sorted by entity_id and last_updated
 
@@ -380,51 +482,136 @@ def _sorted_states_to_json(
         elapsed = time.perf_counter() - timer_start
         _LOGGER.debug("getting %d first datapoints took %fs", len(result), elapsed)
 
+    if compact_response:
+        for ent_id, group in groupby(states, lambda state: state.entity_id):
+            result[ent_id] = _entity_states_to_compact(
+                ent_id, result[ent_id], group, minimal_response
+            )
+        # Entities without changes only have their state at the start time
+        return {
+            key: val
+            if isinstance(val, dict)
+            else _entity_states_to_compact(key, val, (), minimal_response)
+            for key, val in result.items()
+            if val
+        }
+
+    # Append all changes to it
+    for ent_id, group in groupby(states, lambda state: state.entity_id):
+        _entity_states_to_json(result[ent_id], ent_id, group, minimal_response)
+
+    # Filter out the empty lists if some states had 0 results.
+    return {key: val for key, val in result.items() if val}
+
+
+def _entity_states_to_json(ent_results, ent_id, group, minimal_response):
+    """Append the sorted states of a single entity to ent_results."""
     # Called in a tight loop so cache the function
     # here
     _process_timestamp_to_utc_isoformat = process_timestamp_to_utc_isoformat
 
-    # Append all changes to it
-    for ent_id, group in groupby(states, lambda state: state.entity_id):
-        domain = split_entity_id(ent_id)[0]
-        ent_results = result[ent_id]
-        if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
-            ent_results.extend(LazyState(db_state) for db_state in group)
-
-        # With minimal response we only provide a native
-        # State for the first and last response. All the states
-        # in-between only provide the "state" and the
-        # "last_changed".
-        if not ent_results:
-            ent_results.append(LazyState(next(group)))
-
-        prev_state = ent_results[-1]
-        initial_state_count = len(ent_results)
-
-        for db_state in group:
-            # With minimal response we do not care about attribute
-            # changes so we can filter out duplicate states
-            if db_state.state == prev_state.state:
-                continue
+    domain = split_entity_id(ent_id)[0]
+    if not minimal_response or domain in NEED_ATTRIBUTE_DOMAINS:
+        ent_results.extend(LazyState(db_state) for db_state in group)
+
+    # With minimal response we only provide a native
+    # State for the first and last response. All the states
+    # in-between only provide the "state" and the
+    # "last_changed".
+    if not ent_results:
+        ent_results.append(LazyState(next(group)))
+
+    prev_state = ent_results[-1]
+    initial_state_count = len(ent_results)
+
+    for db_state in group:
+        # With minimal response we do not care about attribute
+        # changes so we can filter out duplicate states
+        if db_state.state == prev_state.state:
+            continue
+
+        ent_results.append(
+            {
+                STATE_KEY: db_state.state,
+                LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
+                    db_state.last_changed
+                ),
+            }
+        )
+        prev_state = db_state
 
-            ent_results.append(
-                {
-                    STATE_KEY: db_state.state,
-                    LAST_CHANGED_KEY: _process_timestamp_to_utc_isoformat(
-                        db_state.last_changed
-                    ),
-                }
-            )
-            prev_state = db_state
+    if prev_state and len(ent_results) != initial_state_count:
+        # There was at least one state change
+        # replace the last minimal state with
+        # a full state
+        ent_results[-1] = LazyState(prev_state)
 
-        if prev_state and len(ent_results) != initial_state_count:
-            # There was at least one state change
-            # replace the last minimal state with
-            # a full state
-            ent_results[-1] = LazyState(prev_state)
 
-    # Filter out the empty lists if some states had 0 results.
-    return {key: val for key, val in result.items() if val}
+def _entity_states_to_compact(ent_id, initial_states, group, minimal_response):
+    """Return the sorted states of a single entity as parallel arrays.
+
+    Timestamps are the last_updated time in seconds since the epoch.
+    Attributes are listed as [index, attributes] only where they changed
+    and are left out entirely with minimal_response, in which case
+    repeated states are dropped as well. Like the JSON response, the
+    domains in NEED_ATTRIBUTE_DOMAINS always keep their attributes.
+    """
+    # Called in a tight loop so cache the function
+    # here
+    _process_timestamp = process_timestamp
+
+    minimal_response = (
+        minimal_response and split_entity_id(ent_id)[0] not in NEED_ATTRIBUTE_DOMAINS
+    )
+
+    points = chain(
+        (
+            # pylint: disable=protected-access
+            (state.last_updated, state.state, state._row.attributes)
+            for state in initial_states
+        ),
+        (
+            (
+                _process_timestamp(db_state.last_updated),
+                db_state.state or "",
+                db_state.attributes,
+            )
+            for db_state in group
+        ),
+    )
+
+    timestamps = []
+    states = []
+    attributes = []
+    prev_state = prev_attributes = None
+    for last_updated, state, shared_attrs in points:
+        if minimal_response:
+            if state == prev_state:
+                continue
+        elif shared_attrs != prev_attributes:
+            attributes.append([len(states), _attributes_from_json(shared_attrs)])
+            prev_attributes = shared_attrs
+        timestamps.append(last_updated.timestamp())
+        states.append(state)
+        prev_state = state
+
+    result = {
+        COMPACT_ENTITY_ID_KEY: ent_id,
+        COMPACT_LAST_UPDATED_KEY: timestamps,
+        COMPACT_STATE_KEY: states,
+    }
+    if not minimal_response:
+        result[COMPACT_ATTRIBUTES_KEY] = attributes
+    return result
+
+
+def _attributes_from_json(shared_attrs):
+    """Decode the attributes of a row."""
+    try:
+        return json.loads(shared_attrs)
+    except (TypeError, ValueError):
+        _LOGGER.exception("Error converting attributes: %s", shared_attrs)
+        return {}
 
 
 def get_state(hass, utc_point_in_time, entity_id, run=None):
@@ -444,6 +631,7 @@ async def async_setup(hass, config):
     use_include_order = conf.get(CONF_ORDER)
 
     hass.http.register_view(HistoryPeriodView(filters, use_include_order))
+    hass.http.register_view(HistoryStatisticsView())
     hass.components.frontend.async_register_built_in_panel(
         "history", "history", "hass:poll-box"
     )
@@ -504,6 +692,7 @@ class HistoryPeriodView(HomeAssistantView):
         )
 
         minimal_response = "minimal_response" in request.query
+        compact_response = "compact" in request.query
 
         hass = request.app["hass"]
 
@@ -514,6 +703,18 @@ class HistoryPeriodView(HomeAssistantView):
         ):
             return self.json([])
 
+        if "stream" in request.query:
+            return await self._async_stream_significant_states(
+                request,
+                start_time,
+                end_time,
+                entity_ids,
+                include_start_time_state,
+                significant_changes_only,
+                minimal_response,
+                compact_response,
+            )
+
         return cast(
             web.Response,
             await hass.async_add_executor_job(
@@ -525,6 +726,7 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                compact_response,
             ),
         )
 
@@ -537,6 +739,7 @@ class HistoryPeriodView(HomeAssistantView):
         include_start_time_state,
         significant_changes_only,
         minimal_response,
+        compact_response,
     ):
         """Fetch significant stats from the database as json."""
         timer_start = time.perf_counter()
@@ -552,28 +755,191 @@ class HistoryPeriodView(HomeAssistantView):
                 include_start_time_state,
                 significant_changes_only,
                 minimal_response,
+                compact_response,
             )
 
-        result = list(result.values())
         if _LOGGER.isEnabledFor(logging.DEBUG):
             elapsed = time.perf_counter() - timer_start
-            _LOGGER.debug("Extracted %d states in %fs", sum(map(len, result)), elapsed)
+            _LOGGER.debug("Extracted %d entities in %fs", len(result), elapsed)
 
         # Optionally reorder the result to respect the ordering given
         # by any entities explicitly included in the configuration.
         if self.filters and self.use_include_order:
-            sorted_result = []
-            for order_entity in self.filters.included_entities:
-                for state_list in result:
-                    if state_list[0].entity_id == order_entity:
-                        sorted_result.append(state_list)
-                        result.remove(state_list)
-                        break
-            sorted_result.extend(result)
+            sorted_result = [
+                result.pop(order_entity)
+                for order_entity in self.filters.included_entities
+                if order_entity in result
+            ]
+            sorted_result.extend(result.values())
             result = sorted_result
+        else:
+            result = list(result.values())
 
         return self.json(result)
 
+    async def _async_stream_significant_states(
+        self,
+        request,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        compact_response,
+    ):
+        """Stream the history one entity at a time as a chunked response.
+
+        The body is the same JSON list as the regular response, but the
+        entities are not reordered by use_include_order.
+        """
+        hass = request.app["hass"]
+        queue = asyncio.Queue(maxsize=STREAM_QUEUE_SIZE)
+        cancel = threading.Event()
+
+        response = web.StreamResponse()
+        response.content_type = CONTENT_TYPE_JSON
+        response.enable_chunked_encoding()
+        response.enable_compression()
+        await response.prepare(request)
+
+        job = hass.async_add_executor_job(
+            self._stream_significant_states_json,
+            hass,
+            queue,
+            cancel,
+            start_time,
+            end_time,
+            entity_ids,
+            include_start_time_state,
+            significant_changes_only,
+            minimal_response,
+            compact_response,
+        )
+        try:
+            while True:
+                chunk = await queue.get()
+                if chunk is None:
+                    break
+                await response.write(chunk)
+        finally:
+            cancel.set()
+            # Unblock the executor job if it is waiting for room in the queue
+            while not queue.empty():
+                queue.get_nowait()
+
+        # Raise any database error that ended the stream early
+        await job
+        await response.write_eof()
+        return response
+
+    def _stream_significant_states_json(
+        self,
+        hass,
+        queue,
+        cancel,
+        start_time,
+        end_time,
+        entity_ids,
+        include_start_time_state,
+        significant_changes_only,
+        minimal_response,
+        compact_response,
+    ):
+        """Fetch significant states and hand them to the loop as JSON chunks."""
+        timer_start = time.perf_counter()
+        count = 0
+
+        def _put(chunk):
+            asyncio.run_coroutine_threadsafe(queue.put(chunk), hass.loop).result()
+
+        try:
+            with session_scope(hass=hass) as session:
+                separator = b"["
+                for ent_results in _stream_significant_states(
+                    hass,
+                    session,
+                    start_time,
+                    end_time,
+                    entity_ids,
+                    self.filters,
+                    include_start_time_state,
+                    significant_changes_only,
+                    minimal_response,
+                    compact_response,
+                ):
+                    if cancel.is_set():
+                        return
+                    _put(
+                        separator
+                        + json.dumps(
+                            ent_results, cls=JSONEncoder, allow_nan=False
+                        ).encode("UTF-8")
+                    )
+                    separator = b","
+                    count += 1
+                _put(b"[]" if separator == b"[" else b"]")
+        finally:
+            _put(None)
+
+        if _LOGGER.isEnabledFor(logging.DEBUG):
+            elapsed = time.perf_counter() - timer_start
+            _LOGGER.debug("Streamed %d entities in %fs", count, elapsed)
+
+
+class HistoryStatisticsView(HomeAssistantView):
+    """Handle hourly statistics requests."""
+
+    url = "/api/history/statistics"
+    name = "api:history:view-statistics"
+    extra_urls = ["/api/history/statistics/{datetime}"]
+
+    async def get(
+        self, request: web.Request, datetime: str | None = None
+    ) -> web.Response:
+        """Return the hourly statistics over a period of time."""
+        datetime_ = None
+        if datetime:
+            datetime_ = dt_util.parse_datetime(datetime)
+
+            if datetime_ is None:
+                return self.json_message("Invalid datetime", HTTP_BAD_REQUEST)
+
+        now = dt_util.utcnow()
+
+        if datetime_:
+            start_time = dt_util.as_utc(datetime_)
+        else:
+            start_time = now - timedelta(days=1)
+
+        if start_time > now:
+            return self.json({})
+
+        end_time = None
+        end_time_str = request.query.get("end_time")
+        if end_time_str:
+            end_time = dt_util.parse_datetime(end_time_str)
+            if end_time:
+                end_time = dt_util.as_utc(end_time)
+            else:
+                return self.json_message("Invalid end_time", HTTP_BAD_REQUEST)
+
+        statistic_ids = None
+        statistic_ids_str = request.query.get("statistic_ids")
+        if statistic_ids_str:
+            statistic_ids = statistic_ids_str.lower().split(",")
+
+        hass = request.app["hass"]
+        return self.json(
+            await hass.async_add_executor_job(
+                statistics.statistics_during_period,
+                hass,
+                start_time,
+                end_time,
+                statistic_ids,
+            )
+        )
+
 
 def sqlalchemy_filter_from_include_exclude_conf(conf):
     """Build a sql filter from config."""
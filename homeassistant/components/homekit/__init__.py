@@ -76,12 +76,14 @@ from .const import (
     CONF_LINKED_DOORBELL_SENSOR,
     CONF_LINKED_HUMIDITY_SENSOR,
     CONF_LINKED_MOTION_SENSOR,
+    CONF_NOTIFY_WINDOW,
     CONF_SAFE_MODE,
     CONF_ZEROCONF_DEFAULT_INTERFACE,
     CONFIG_OPTIONS,
     DEFAULT_AUTO_START,
     DEFAULT_EXCLUDE_ACCESSORY_MODE,
     DEFAULT_HOMEKIT_MODE,
+    DEFAULT_NOTIFY_WINDOW,
     DEFAULT_PORT,
     DEFAULT_SAFE_MODE,
     DOMAIN,
@@ -144,6 +146,9 @@ BRIDGE_SCHEMA = vol.All(
             vol.Optional(CONF_PORT, default=DEFAULT_PORT): cv.port,
             vol.Optional(CONF_IP_ADDRESS): vol.All(ipaddress.ip_address, cv.string),
             vol.Optional(CONF_ADVERTISE_IP): vol.All(ipaddress.ip_address, cv.string),
+            vol.Optional(CONF_NOTIFY_WINDOW): vol.All(
+                vol.Coerce(float), vol.Range(min=0, max=10)
+            ),
             vol.Optional(CONF_AUTO_START, default=DEFAULT_AUTO_START): cv.boolean,
             vol.Optional(CONF_SAFE_MODE, default=DEFAULT_SAFE_MODE): cv.boolean,
             vol.Optional(CONF_FILTER, default={}): BASE_FILTER_SCHEMA,
@@ -242,9 +247,10 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
     port = conf[CONF_PORT]
     _LOGGER.debug("Begin setup HomeKit for %s", name)
 
-    # ip_address and advertise_ip are yaml only
+    # ip_address, advertise_ip and notify_window are yaml only
     ip_address = conf.get(CONF_IP_ADDRESS)
     advertise_ip = conf.get(CONF_ADVERTISE_IP)
+    notify_window = conf.get(CONF_NOTIFY_WINDOW, DEFAULT_NOTIFY_WINDOW)
     # exclude_accessory_mode is only used for config flow
     # to indicate that the config entry was setup after
     # we started creating config entries for entities that
@@ -273,6 +279,7 @@ async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry):
         advertise_ip,
         entry.entry_id,
         entry.title,
+        notify_window,
     )
 
     hass.data[DOMAIN][entry.entry_id] = {
@@ -440,6 +447,7 @@ class HomeKit:
         advertise_ip=None,
         entry_id=None,
         entry_title=None,
+        notify_window=DEFAULT_NOTIFY_WINDOW,
     ):
         """Initialize a HomeKit object."""
         self.hass = hass
@@ -453,6 +461,7 @@ class HomeKit:
         self._entry_id = entry_id
         self._entry_title = entry_title
         self._homekit_mode = homekit_mode
+        self._notify_window = notify_window
         self.aid_storage = None
         self.status = STATUS_READY
 
@@ -469,6 +478,7 @@ class HomeKit:
             self._entry_id,
             self._name,
             self._entry_title,
+            notify_window=self._notify_window,
             loop=self.hass.loop,
             address=ip_addr,
             port=self._port,
@@ -693,6 +703,19 @@ class HomeKit:
         else:
             self.driver.accessory.async_stop()
 
+    @callback
+    def async_status_data(self):
+        """Return the status and notification counters of the bridge."""
+        driver = self.driver
+        sent = driver.notifications_sent if driver else 0
+        suppressed = driver.notifications_suppressed if driver else 0
+        return {
+            "name": self._name,
+            "status": self.status,
+            "notifications_sent": sent,
+            "notifications_suppressed": suppressed,
+        }
+
     @callback
     def _async_configure_linked_sensors(self, ent_reg_ent, device_lookup, state):
         if (
@@ -1,9 +1,10 @@
 """Extend the basic Accessory and Bridge functions."""
 import logging
+import threading
 
-from pyhap.accessory import Accessory, Bridge
+from pyhap.accessory import Accessory, Bridge, get_topic
 from pyhap.accessory_driver import AccessoryDriver
-from pyhap.const import CATEGORY_OTHER
+from pyhap.const import CATEGORY_OTHER, HAP_REPR_AID, HAP_REPR_IID
 
 from homeassistant.components import cover
 from homeassistant.components.cover import (
@@ -56,6 +57,7 @@ from .const import (
     CONF_LINKED_BATTERY_SENSOR,
     CONF_LOW_BATTERY_THRESHOLD,
     DEFAULT_LOW_BATTERY_THRESHOLD,
+    DEFAULT_NOTIFY_WINDOW,
     DEVICE_CLASS_PM25,
     EVENT_HOMEKIT_CHANGED,
     HK_CHARGING,
@@ -490,13 +492,104 @@ class HomeBridge(Bridge):
 class HomeDriver(AccessoryDriver):
     """Adapter class for AccessoryDriver."""
 
-    def __init__(self, hass, entry_id, bridge_name, entry_title, **kwargs):
+    def __init__(
+        self,
+        hass,
+        entry_id,
+        bridge_name,
+        entry_title,
+        notify_window=DEFAULT_NOTIFY_WINDOW,
+        **kwargs,
+    ):
         """Initialize a AccessoryDriver object."""
         super().__init__(**kwargs)
         self.hass = hass
         self._entry_id = entry_id
         self._bridge_name = bridge_name
         self._entry_title = entry_title
+        self._notify_window = notify_window
+        self._pending_notifications = {}
+        self._flush_handle = None
+        self.notifications_sent = 0
+        self.notifications_suppressed = 0
+
+    def publish(self, data, sender_client_addr=None):
+        """Override super function to coalesce characteristic notifications.
+
+        Values changed by a controller are sent right away. Values changed
+        by Home Assistant are buffered per characteristic and only the last
+        value is sent when the notify window closes.
+        """
+        if sender_client_addr is not None:
+            self._run_in_loop(
+                self._async_send_controller_value, data, sender_client_addr
+            )
+            return
+
+        self._run_in_loop(self._async_buffer_notification, data)
+
+    def _run_in_loop(self, target, *args):
+        """Run a callback in the event loop, from the loop or a thread."""
+        if threading.current_thread() == self.tid:
+            target(*args)
+        else:
+            self.hass.loop.call_soon_threadsafe(target, *args)
+
+    @ha_callback
+    def _async_send_controller_value(self, data, sender_client_addr):
+        """Send a value changed by a controller instead of a buffered value.
+
+        The value is sent from the event loop, so a flush that was already
+        scheduled can't send the overridden value after it.
+        """
+        key = (data[HAP_REPR_AID], data[HAP_REPR_IID])
+        if self._pending_notifications.pop(key, None) is not None:
+            self.notifications_suppressed += 1
+        self._async_send(data, sender_client_addr)
+
+    @ha_callback
+    def _async_send(self, data, sender_client_addr=None):
+        """Send a value if a controller subscribed to its characteristic."""
+        if get_topic(data[HAP_REPR_AID], data[HAP_REPR_IID]) not in self.topics:
+            return
+        self.notifications_sent += 1
+        super().publish(data, sender_client_addr)
+
+    @ha_callback
+    def _async_buffer_notification(self, data):
+        """Buffer a value until the notify window closes."""
+        key = (data[HAP_REPR_AID], data[HAP_REPR_IID])
+        if key in self._pending_notifications:
+            self.notifications_suppressed += 1
+        self._pending_notifications[key] = data
+
+        if self._flush_handle is not None:
+            return
+
+        if self._notify_window:
+            self._flush_handle = self.hass.loop.call_later(
+                self._notify_window, self._async_flush_notifications
+            )
+        else:
+            self._flush_handle = self.hass.loop.call_soon(
+                self._async_flush_notifications
+            )
+
+    @ha_callback
+    def _async_flush_notifications(self):
+        """Send the last buffered value of each characteristic."""
+        self._flush_handle = None
+        pending, self._pending_notifications = self._pending_notifications, {}
+        for data in pending.values():
+            self._async_send(data)
+
+    async def async_stop(self):
+        """Override super function to drop buffered notifications."""
+        if self._flush_handle is not None:
+            self._flush_handle.cancel()
+            self._flush_handle = None
+        self._pending_notifications = {}
+        await super().async_stop()
 
     def pair(self, client_uuid, client_public):
         """Override super function to dismiss setup message if paired."""
@@ -52,6 +52,7 @@ CONF_LOW_BATTERY_THRESHOLD = "low_battery_threshold"
 CONF_MAX_FPS = "max_fps"
 CONF_MAX_HEIGHT = "max_height"
 CONF_MAX_WIDTH = "max_width"
+CONF_NOTIFY_WINDOW = "notify_window"
 CONF_SAFE_MODE = "safe_mode"
 CONF_ZEROCONF_DEFAULT_INTERFACE = "zeroconf_default_interface"
 CONF_STREAM_ADDRESS = "stream_address"
@@ -73,6 +74,7 @@ DEFAULT_LOW_BATTERY_THRESHOLD = 20
 DEFAULT_MAX_FPS = 30
 DEFAULT_MAX_HEIGHT = 1080
 DEFAULT_MAX_WIDTH = 1920
+DEFAULT_NOTIFY_WINDOW = 0
 DEFAULT_PORT = 21063
 DEFAULT_CONFIG_FLOW_PORT = 21064
 DEFAULT_SAFE_MODE = False
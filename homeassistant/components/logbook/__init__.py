@@ -14,7 +14,9 @@ from homeassistant.components.history import sqlalchemy_filter_from_include_excl
 from homeassistant.components.http import HomeAssistantView
 from homeassistant.components.recorder.models import (
     Events,
+    StateAttributes,
     States,
+    process_timestamp,
     process_timestamp_to_utc_isoformat,
 )
 from homeassistant.components.recorder.util import session_scope
@@ -60,6 +62,19 @@ DOMAIN = "logbook"
 
 GROUP_BY_MINUTES = 15
 
+# Stay below the number of variables SQLite allows in a query
+CONTEXT_LOOKUP_CHUNK_SIZE = 500
+
+# Rows fetched for a page on top of its limit, for rows that are only used
+# for their context and the rest of the GROUP_BY_MINUTES group of the page
+PAGE_QUERY_SLACK = 100
+
+# Largest limit of a page, larger limits are clamped to it so a single
+# request can't load the whole events table at once
+MAX_PAGE_LIMIT = 10000
+
+EPOCH = dt_util.utc_from_timestamp(0)
+
 EMPTY_JSON_OBJECT = "{}"
 UNIT_OF_MEASUREMENT_JSON = '"unit_of_measurement":'
 
@@ -86,6 +101,7 @@ ALL_EVENT_TYPES = [
 ]
 
 EVENT_COLUMNS = [
+    Events.event_id,
     Events.event_type,
     Events.event_data,
     Events.time_fired,
@@ -238,6 +254,42 @@ class LogbookView(HomeAssistantView):
                 "Can't combine entity with context_id", HTTP_BAD_REQUEST
             )
 
+        limit = request.query.get("limit")
+        cursor = request.query.get("cursor")
+        if limit is not None:
+            try:
+                limit = int(limit)
+                cursor = _decode_cursor(cursor) if cursor else None
+            except ValueError:
+                return self.json_message("Invalid limit or cursor", HTTP_BAD_REQUEST)
+            if limit < 1:
+                return self.json_message("Invalid limit or cursor", HTTP_BAD_REQUEST)
+            limit = min(limit, MAX_PAGE_LIMIT)
+
+        def json_events_page():
+            """Fetch a page of events and generate JSON."""
+            entries, next_cursor = _get_events_page(
+                hass,
+                start_day,
+                end_day,
+                limit,
+                cursor,
+                entity_ids,
+                self.filters,
+                self.entities_filter,
+                entity_matches_only,
+                context_id,
+            )
+            return self.json(
+                {
+                    "entries": entries,
+                    "next_cursor": next_cursor and _encode_cursor(next_cursor),
+                }
+            )
+
+        if limit is not None:
+            return await hass.async_add_executor_job(json_events_page)
+
         def json_events():
             """Fetch events and generate JSON."""
             return self.json(
@@ -430,62 +482,244 @@ def _get_events(
     entity_attr_cache = EntityAttributeCache(hass)
     context_lookup = {None: None}
 
+    if entity_ids is not None:
+        entities_filter = generate_filter([], entity_ids, [], [])
+
     def yield_events(query):
         """Yield Events that are not filtered away."""
         for row in query.yield_per(1000):
             event = LazyEventPartialState(row)
             context_lookup.setdefault(event.context_id, event)
-            if event.event_type == EVENT_CALL_SERVICE:
-                continue
-            if event.event_type == EVENT_STATE_CHANGED or _keep_event(
-                hass, event, entities_filter
-            ):
+            if _keep_row_event(hass, event, entities_filter):
                 yield event
 
+    with session_scope(hass=hass) as session:
+        query = _generate_logbook_query(
+            hass,
+            session,
+            start_day,
+            end_day,
+            entity_ids,
+            filters,
+            entity_matches_only,
+            context_id,
+        )
+        query = query.order_by(Events.time_fired, Events.event_id)
+
+        return list(
+            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+        )
+
+
+def _get_events_page(
+    hass,
+    start_day,
+    end_day,
+    limit,
+    cursor=None,
+    entity_ids=None,
+    filters=None,
+    entities_filter=None,
+    entity_matches_only=False,
+    context_id=None,
+):
+    """Get a page of events for a period of time.
+
+    Pages are continued from the (time_fired, event_id) cursor of the
+    previous page, so fetching a page does not depend on its offset in
+    the period. A page holds at least limit events and is extended to the
+    end of the GROUP_BY_MINUTES group of its last event, so the entries
+    are the same as the ones returned for the whole period.
+
+    Returns the entries and the cursor of the next page, or None if this
+    was the last page.
+    """
+    assert not (
+        entity_ids and context_id
+    ), "can't pass in both entity_ids and context_id"
+
+    entity_attr_cache = EntityAttributeCache(hass)
+    context_lookup = {None: None}
+
     if entity_ids is not None:
         entities_filter = generate_filter([], entity_ids, [], [])
 
     with session_scope(hass=hass) as session:
-        old_state = aliased(States, name="old_state")
 
-        if entity_ids is not None:
-            query = _generate_events_query_without_states(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_event_types_filter(
-                hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+        def logbook_query(*criteria):
+            """Return the ordered rows of the logbook that match criteria."""
+            return _generate_logbook_query(
+                hass,
+                session,
+                start_day,
+                end_day,
+                entity_ids,
+                filters,
+                entity_matches_only,
+                context_id,
+                criteria,
+            ).order_by(Events.time_fired, Events.event_id)
+
+        page_events = []
+        events = []
+        next_cursor = None
+        last_row = None
+        last_group = None
+        after = cursor
+        chunk_size = limit + PAGE_QUERY_SLACK
+        done = False
+        while not done:
+            # Fetch the rows of the page in chunks. The chunks after the
+            # first one are only needed when rows are filtered away or to
+            # finish the GROUP_BY_MINUTES group of the last event.
+            chunk_query = (
+                logbook_query(_after_cursor_matcher(after))
+                if after is not None
+                else logbook_query()
             )
-            if entity_matches_only:
-                # When entity_matches_only is provided, contexts and events that do not
-                # contain the entity_ids are not included in the logbook response.
-                query = _apply_event_entity_id_matchers(query, entity_ids)
-
-            query = query.union_all(
-                _generate_states_query(
-                    session, start_day, end_day, old_state, entity_ids
-                )
+            rows = chunk_query.limit(chunk_size).all()
+            done = len(rows) < chunk_size
+
+            for row in rows:
+                event = LazyEventPartialState(row)
+                if _keep_row_event(hass, event, entities_filter):
+                    group = event.time_fired_minute // GROUP_BY_MINUTES
+                    if len(events) >= limit and group != last_group:
+                        next_cursor = _cursor_from_row(last_row)
+                        done = True
+                        break
+                    last_group = group
+                    events.append(event)
+                page_events.append(event)
+                # Rows without an event can't be ordered after a cursor
+                if row.event_id is not None:
+                    last_row = row
+
+            if last_row is not None:
+                after = _cursor_from_row(last_row)
+
+        if cursor is not None:
+            # Contexts are looked up by their first event in the period,
+            # which may be on one of the previous pages.
+            _lookup_contexts_before_cursor(
+                logbook_query, cursor, page_events, context_lookup
             )
-        else:
-            query = _generate_events_query(session)
-            query = _apply_event_time_filter(query, start_day, end_day)
-            query = _apply_events_types_and_states_filter(
-                hass, query, old_state
-            ).filter(
-                (States.last_updated == States.last_changed)
-                | (Events.event_type != EVENT_STATE_CHANGED)
-            )
-            if filters:
-                query = query.filter(
-                    filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
-                )
 
-            if context_id is not None:
-                query = query.filter(Events.context_id == context_id)
+        for event in page_events:
+            context_lookup.setdefault(event.context_id, event)
 
-        query = query.order_by(Events.time_fired)
+        return (
+            list(humanify(hass, events, entity_attr_cache, context_lookup)),
+            next_cursor,
+        )
 
-        return list(
-            humanify(hass, yield_events(query), entity_attr_cache, context_lookup)
+
+def _lookup_contexts_before_cursor(logbook_query, cursor, page_events, context_lookup):
+    """Add the first events of the contexts of a page from before the cursor."""
+    context_ids = set()
+    for event in page_events:
+        context_ids.add(event.context_id)
+        context_ids.add(event.context_parent_id)
+    context_ids.discard(None)
+    context_ids = list(context_ids)
+
+    for i in range(0, len(context_ids), CONTEXT_LOOKUP_CHUNK_SIZE):
+        chunk = context_ids[i : i + CONTEXT_LOOKUP_CHUNK_SIZE]
+        chunk_query = logbook_query(
+            sqlalchemy.not_(_after_cursor_matcher(cursor)),
+            Events.context_id.in_(chunk),
         )
+        for row in chunk_query.yield_per(1000):
+            event = LazyEventPartialState(row)
+            context_lookup.setdefault(event.context_id, event)
+
+
+def _generate_logbook_query(
+    hass,
+    session,
+    start_day,
+    end_day,
+    entity_ids,
+    filters,
+    entity_matches_only,
+    context_id,
+    criteria=(),
+):
+    """Generate the unordered query of the rows of the logbook.
+
+    The criteria are applied to each query of a union instead of to the
+    union as a whole, so the database can use its indexes on them.
+    """
+    old_state = aliased(States, name="old_state")
+
+    if entity_ids is not None:
+        query = _generate_events_query_without_states(session)
+        query = _apply_event_time_filter(query, start_day, end_day)
+        query = _apply_event_types_filter(
+            hass, query, ALL_EVENT_TYPES_EXCEPT_STATE_CHANGED
+        )
+        if entity_matches_only:
+            # When entity_matches_only is provided, contexts and events that do not
+            # contain the entity_ids are not included in the logbook response.
+            query = _apply_event_entity_id_matchers(query, entity_ids)
+
+        return query.filter(*criteria).union_all(
+            _generate_states_query(
+                session, start_day, end_day, old_state, entity_ids
+            ).filter(*criteria)
+        )
+
+    query = _generate_events_query(session)
+    query = _apply_event_time_filter(query, start_day, end_day)
+    query = _apply_events_types_and_states_filter(hass, query, old_state).filter(
+        (States.last_updated == States.last_changed)
+        | (Events.event_type != EVENT_STATE_CHANGED)
+    )
+    if filters:
+        query = query.filter(
+            filters.entity_filter() | (Events.event_type != EVENT_STATE_CHANGED)
+        )
+
+    if context_id is not None:
+        query = query.filter(Events.context_id == context_id)
+
+    return query.filter(*criteria)
+
+
+def _keep_row_event(hass, event, entities_filter):
+    """Return if a row is shown in the logbook or only used for its context."""
+    if event.event_type == EVENT_CALL_SERVICE:
+        return False
+    return event.event_type == EVENT_STATE_CHANGED or _keep_event(
+        hass, event, entities_filter
+    )
+
+
+def _after_cursor_matcher(cursor):
+    time_fired, event_id = cursor
+    return (Events.time_fired > time_fired) | (
+        (Events.time_fired == time_fired) & (Events.event_id > event_id)
+    )
+
+
+def _cursor_from_row(row):
+    """Return the cursor of the rows after a row."""
+    return (process_timestamp(row.time_fired), row.event_id)
+
+
+def _encode_cursor(cursor):
+    """Encode a cursor to pass it to the logbook api."""
+    time_fired, event_id = cursor
+    return f"{(time_fired - EPOCH) // timedelta(microseconds=1)}_{event_id}"
+
+
+def _decode_cursor(value):
+    """Decode a cursor passed to the logbook api."""
+    microseconds, event_id = value.split("_")
+    event_id = int(event_id)
+    if event_id < 1:
+        raise ValueError(f"Invalid event_id in cursor: {event_id}")
+    return (EPOCH + timedelta(microseconds=int(microseconds)), event_id)
 
 
 def _generate_events_query(session):
@@ -494,7 +728,7 @@ def _generate_events_query(session):
         States.state,
         States.entity_id,
         States.domain,
-        States.attributes,
+        _attributes_column().label("attributes"),
     )
 
 
@@ -513,6 +747,9 @@ def _generate_states_query(session, start_day, end_day, old_state, entity_ids):
         _generate_events_query(session)
         .outerjoin(Events, (States.event_id == Events.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(_missing_state_matcher(old_state))
         .filter(_continuous_entity_matcher())
         .filter((States.last_updated > start_day) & (States.last_updated < end_day))
@@ -527,6 +764,9 @@ def _apply_events_types_and_states_filter(hass, query, old_state):
     events_query = (
         query.outerjoin(States, (Events.event_id == States.event_id))
         .outerjoin(old_state, (States.old_state_id == old_state.state_id))
+        .outerjoin(
+            StateAttributes, (States.attributes_id == StateAttributes.attributes_id)
+        )
         .filter(
             (Events.event_type != EVENT_STATE_CHANGED)
             | _missing_state_matcher(old_state)
@@ -556,10 +796,15 @@ def _continuous_entity_matcher():
     #
     return sqlalchemy.or_(
         sqlalchemy.not_(States.domain.in_(CONTINUOUS_DOMAINS)),
-        sqlalchemy.not_(States.attributes.contains(UNIT_OF_MEASUREMENT_JSON)),
+        sqlalchemy.not_(_attributes_column().contains(UNIT_OF_MEASUREMENT_JSON)),
     )
 
 
+def _attributes_column():
+    # Older rows store the attributes in the states table
+    return sqlalchemy.func.coalesce(States.attributes, StateAttributes.shared_attrs)
+
+
 def _apply_event_time_filter(events_query, start_day, end_day):
     return events_query.filter(
         (Events.time_fired > start_day) & (Events.time_fired < end_day)
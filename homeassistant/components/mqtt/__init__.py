@@ -2,13 +2,14 @@
 from __future__ import annotations
 
 import asyncio
-from functools import lru_cache, partial, wraps
+from functools import partial, wraps
 import inspect
 from itertools import groupby
 import logging
 from operator import attrgetter
 import os
 import ssl
+import threading
 import time
 from typing import Any, Callable, Union
 import uuid
@@ -67,7 +68,13 @@ from .const import (
     PROTOCOL_311,
 )
 from .discovery import LAST_DISCOVERY
-from .models import Message, MessageCallbackType, PublishPayloadType
+from .models import (
+    Message,
+    MessageBatchMetrics,
+    MessageCallbackType,
+    PublishPayloadType,
+)
+from .topic_trie import TopicTrie
 from .util import _VALID_QOS_SCHEMA, valid_publish_topic, valid_subscribe_topic
 
 _LOGGER = logging.getLogger(__name__)
@@ -531,7 +538,6 @@ class Subscription:
     """Class to hold data about an active subscription."""
 
     topic: str = attr.ib()
-    matcher: Any = attr.ib()
     job: HassJob = attr.ib()
     qos: int = attr.ib(default=0)
     encoding: str = attr.ib(default="utf-8")
@@ -555,6 +561,7 @@ class MQTT:
         self.config_entry = config_entry
         self.conf = conf
         self.subscriptions: list[Subscription] = []
+        self._subscriptions_trie: TopicTrie[Subscription] = TopicTrie()
         self.connected = False
         self._ha_started = asyncio.Event()
         self._last_subscribe = time.time()
@@ -563,6 +570,12 @@ class MQTT:
 
         self._pending_operations = {}
 
+        # Messages received by the paho thread waiting to be handled in
+        # the event loop, together with their monotonic receive time.
+        self._pending_messages: list[tuple[Any, float]] = []
+        self._pending_messages_lock = threading.Lock()
+        self.batch_metrics = MessageBatchMetrics()
+
         if self.hass.state == CoreState.running:
             self._ha_started.set()
         else:
@@ -741,11 +754,9 @@ class MQTT:
         if not isinstance(topic, str):
             raise HomeAssistantError("Topic needs to be a string!")
 
-        subscription = Subscription(
-            topic, _matcher_for_topic(topic), HassJob(msg_callback), qos, encoding
-        )
+        subscription = Subscription(topic, HassJob(msg_callback), qos, encoding)
         self.subscriptions.append(subscription)
-        self._matching_subscriptions.cache_clear()
+        self._subscriptions_trie.add(topic, subscription)
 
         # Only subscribe if currently connected.
         if self.connected:
@@ -755,12 +766,13 @@ class MQTT:
         @callback
         def async_remove() -> None:
             """Remove subscription."""
-            if subscription not in self.subscriptions:
-                raise HomeAssistantError("Can't remove subscription twice")
+            try:
+                self._subscriptions_trie.remove(topic, subscription)
+            except KeyError as err:
+                raise HomeAssistantError("Can't remove subscription twice") from err
             self.subscriptions.remove(subscription)
-            self._matching_subscriptions.cache_clear()
 
-            if any(other.topic == topic for other in self.subscriptions):
+            if topic in self._subscriptions_trie:
                 # Other subscriptions on topic remaining - don't unsubscribe.
                 return
 
@@ -848,16 +860,35 @@ class MQTT:
             )
 
     def _mqtt_on_message(self, _mqttc, _userdata, msg) -> None:
-        """Message received callback."""
-        self.hass.add_job(self._mqtt_handle_message, msg)
+        """Message received callback.
+
+        Messages are buffered and handed to the event loop in batches so
+        a burst of messages only wakes up the loop once.
+        """
+        with self._pending_messages_lock:
+            self._pending_messages.append((msg, time.monotonic()))
+            if len(self._pending_messages) > 1:
+                # A drain of the buffer is already scheduled
+                return
+        self.hass.loop.call_soon_threadsafe(self._mqtt_handle_messages)
+
+    @callback
+    def _mqtt_handle_messages(self) -> None:
+        """Handle the messages received since the last batch in order."""
+        with self._pending_messages_lock:
+            messages = self._pending_messages
+            self._pending_messages = []
+
+        for msg, _ in messages:
+            try:
+                self._mqtt_handle_message(msg)
+            except Exception:  # pylint: disable=broad-except
+                # Do not let a failing subscriber drop the rest of the batch
+                _LOGGER.exception("Error handling message on %s", msg.topic)
 
-    @lru_cache(2048)
-    def _matching_subscriptions(self, topic):
-        subscriptions = []
-        for subscription in self.subscriptions:
-            if subscription.matcher(topic):
-                subscriptions.append(subscription)
-        return subscriptions
+        latency = time.monotonic() - messages[0][1]
+        self.batch_metrics.batch_done(len(messages), latency)
+        _LOGGER.debug("Handled a batch of %d messages in %.3fs", len(messages), latency)
 
     @callback
     def _mqtt_handle_message(self, msg) -> None:
@@ -869,7 +900,7 @@ class MQTT:
         )
         timestamp = dt_util.utcnow()
 
-        subscriptions = self._matching_subscriptions(msg.topic)
+        subscriptions = self._subscriptions_trie.match(msg.topic)
 
         for subscription in subscriptions:
 
@@ -969,16 +1000,6 @@ def _raise_on_error(result_code: int) -> None:
         )
 
 
-def _matcher_for_topic(subscription: str) -> Any:
-    # pylint: disable=import-outside-toplevel
-    from paho.mqtt.matcher import MQTTMatcher
-
-    matcher = MQTTMatcher()
-    matcher[subscription] = True
-
-    return lambda topic: next(matcher.iter_match(topic), False)
-
-
 @websocket_api.websocket_command(
     {vol.Required("type"): "mqtt/device/debug_info", vol.Required("device_id"): str}
 )
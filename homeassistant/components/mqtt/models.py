@@ -22,3 +22,26 @@ class Message:
 
 
 MessageCallbackType = Callable[[Message], None]
+
+
+@attr.s(slots=True)
+class MessageBatchMetrics:
+    """Metrics of the message batches handed to the event loop.
+
+    The latency of a batch is the time from receiving its first message
+    until all of its messages were handled.
+    """
+
+    batches: int = attr.ib(default=0)
+    messages: int = attr.ib(default=0)
+    last_batch_size: int = attr.ib(default=0)
+    last_batch_latency: float = attr.ib(default=0.0)
+    max_batch_latency: float = attr.ib(default=0.0)
+
+    def batch_done(self, size: int, latency: float) -> None:
+        """Record a handled batch."""
+        self.batches += 1
+        self.messages += size
+        self.last_batch_size = size
+        self.last_batch_latency = latency
+        self.max_batch_latency = max(self.max_batch_latency, latency)
@@ -0,0 +1,114 @@
+"""Trie of MQTT topic filters to look up the subscriptions matching a topic."""
+from __future__ import annotations
+
+from typing import Generic, TypeVar
+
+_T = TypeVar("_T")
+
+SINGLE_LEVEL_WILDCARD = "+"
+MULTI_LEVEL_WILDCARD = "#"
+
+
+class _TrieNode(Generic[_T]):
+    """A level of a topic filter."""
+
+    __slots__ = ("children", "values")
+
+    def __init__(self) -> None:
+        """Initialize the node."""
+        self.children: dict[str, _TrieNode[_T]] = {}
+        self.values: list[_T] = []
+
+
+class TopicTrie(Generic[_T]):
+    """Store values by MQTT topic filter.
+
+    A lookup walks one level of the topic at a time, so its cost depends
+    on the depth of the topic and the wildcards in use, not on the number
+    of stored filters. Wildcards follow the MQTT specification, including
+    that they do not match topics starting with $ at the first level.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the trie."""
+        self._root: _TrieNode[_T] = _TrieNode()
+
+    def add(self, topic_filter: str, value: _T) -> None:
+        """Add a value for a topic filter."""
+        node = self._root
+        for level in topic_filter.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                child = node.children[level] = _TrieNode()
+            node = child
+        node.values.append(value)
+
+    def remove(self, topic_filter: str, value: _T) -> None:
+        """Remove a value of a topic filter.
+
+        Raises KeyError if the value was not added for the filter.
+        """
+        path = [self._root]
+        levels = topic_filter.split("/")
+        for level in levels:
+            child = path[-1].children.get(level)
+            if child is None:
+                raise KeyError(topic_filter)
+            path.append(child)
+
+        try:
+            path[-1].values.remove(value)
+        except ValueError as err:
+            raise KeyError(topic_filter) from err
+
+        # Prune the levels that no longer lead to any value
+        for level, parent, node in zip(
+            reversed(levels), reversed(path[:-1]), reversed(path[1:])
+        ):
+            if node.values or node.children:
+                break
+            del parent.children[level]
+
+    def __contains__(self, topic_filter: object) -> bool:
+        """Return if there are values for exactly this topic filter."""
+        if not isinstance(topic_filter, str):
+            return False
+        node = self._root
+        for level in topic_filter.split("/"):
+            child = node.children.get(level)
+            if child is None:
+                return False
+            node = child
+        return bool(node.values)
+
+    def match(self, topic: str) -> list[_T]:
+        """Return the values of all filters matching a topic."""
+        levels = topic.split("/")
+        last = len(levels)
+        # Wildcards at the first level don't match $SYS style topics
+        first_wildcard = 1 if topic.startswith("$") else 0
+        matches: list[_T] = []
+        stack = [(self._root, 0)]
+
+        while stack:
+            node, index = stack.pop()
+            children = node.children
+
+            if index == last:
+                matches.extend(node.values)
+            else:
+                child = children.get(levels[index])
+                if child is not None:
+                    stack.append((child, index + 1))
+                if index >= first_wildcard:
+                    child = children.get(SINGLE_LEVEL_WILDCARD)
+                    if child is not None:
+                        stack.append((child, index + 1))
+
+            # A multi level wildcard also matches its parent level
+            if index >= first_wildcard:
+                child = children.get(MULTI_LEVEL_WILDCARD)
+                if child is not None:
+                    matches.extend(child.values)
+
+        return matches
@@ -2,6 +2,8 @@
 from __future__ import annotations
 
 import asyncio
+from collections import OrderedDict
+from collections.abc import Mapping
 import concurrent.futures
 from datetime import datetime
 import logging
@@ -36,9 +38,17 @@ from homeassistant.helpers.entityfilter import (
 from homeassistant.helpers.typing import ConfigType
 import homeassistant.util.dt as dt_util
 
-from . import migration, purge
-from .const import CONF_DB_INTEGRITY_CHECK, DATA_INSTANCE, DOMAIN, SQLITE_URL_PREFIX
-from .models import Base, Events, RecorderRuns, States
+from . import migration, purge, statistics, websocket_api
+from .const import (
+    CONF_DB_INTEGRITY_CHECK,
+    DATA_INSTANCE,
+    DOMAIN,
+    MAX_ROWS_PER_INSERT,
+    SQLITE_URL_PREFIX,
+    STATE_ATTRIBUTES_CACHE_SIZE,
+)
+from .metrics import RecorderMetrics
+from .models import Base, Events, RecorderRuns, StateAttributes, States
 from .util import (
     dburl_to_path,
     move_away_broken_database,
@@ -72,7 +82,9 @@ DEFAULT_DB_INTEGRITY_CHECK = True
 DEFAULT_DB_MAX_RETRIES = 10
 DEFAULT_DB_RETRY_WAIT = 3
 DEFAULT_COMMIT_INTERVAL = 1
+DEFAULT_MAX_QUEUE_BACKLOG = 30000
 KEEPALIVE_TIME = 30
+STATISTICS_MINUTE = 5
 
 # Controls how often we clean up
 # States and Events objects
@@ -86,6 +98,7 @@ CONF_PURGE_KEEP_DAYS = "purge_keep_days"
 CONF_PURGE_INTERVAL = "purge_interval"
 CONF_EVENT_TYPES = "event_types"
 CONF_COMMIT_INTERVAL = "commit_interval"
+CONF_MAX_QUEUE_BACKLOG = "max_queue_backlog"
 
 EXCLUDE_SCHEMA = INCLUDE_EXCLUDE_FILTER_SCHEMA_INNER.extend(
     {vol.Optional(CONF_EVENT_TYPES): vol.All(cv.ensure_list, [cv.string])}
@@ -110,6 +123,9 @@ CONFIG_SCHEMA = vol.Schema(
                     vol.Optional(
                         CONF_COMMIT_INTERVAL, default=DEFAULT_COMMIT_INTERVAL
                     ): cv.positive_int,
+                    vol.Optional(
+                        CONF_MAX_QUEUE_BACKLOG, default=DEFAULT_MAX_QUEUE_BACKLOG
+                    ): vol.All(vol.Coerce(int), vol.Range(min=1)),
                     vol.Optional(
                         CONF_DB_MAX_RETRIES, default=DEFAULT_DB_MAX_RETRIES
                     ): cv.positive_int,
@@ -174,6 +190,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     auto_purge = conf[CONF_AUTO_PURGE]
     keep_days = conf[CONF_PURGE_KEEP_DAYS]
     commit_interval = conf[CONF_COMMIT_INTERVAL]
+    max_queue_backlog = conf[CONF_MAX_QUEUE_BACKLOG]
     db_max_retries = conf[CONF_DB_MAX_RETRIES]
     db_retry_wait = conf[CONF_DB_RETRY_WAIT]
     db_integrity_check = conf[CONF_DB_INTEGRITY_CHECK]
@@ -188,6 +205,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
         auto_purge=auto_purge,
         keep_days=keep_days,
         commit_interval=commit_interval,
+        max_queue_backlog=max_queue_backlog,
         uri=db_url,
         db_max_retries=db_max_retries,
         db_retry_wait=db_retry_wait,
@@ -197,6 +215,7 @@ async def async_setup(hass: HomeAssistant, config: ConfigType) -> bool:
     )
     instance.async_initialize()
     instance.start()
+    websocket_api.async_setup(hass)
 
     async def async_handle_purge_service(service):
         """Handle calls to the purge service."""
@@ -234,6 +253,23 @@ class PurgeTask(NamedTuple):
     apply_filter: bool
 
 
+class StatisticsTask(NamedTuple):
+    """An object to insert into the recorder queue to compile statistics."""
+
+    start: datetime
+    tries: int = 1
+
+
+class PendingState(NamedTuple):
+    """A states row waiting to be written with the next commit."""
+
+    state_row: dict[str, Any]
+    event_row: dict[str, Any]
+    old_state_row: dict[str, Any] | None
+    attributes_row: dict[str, Any] | None
+    attributes: Mapping[str, Any] | None
+
+
 class WaitTask:
     """An object to insert into the recorder queue to tell it set the _queue_watch event."""
 
@@ -247,6 +283,7 @@ class Recorder(threading.Thread):
         auto_purge: bool,
         keep_days: int,
         commit_interval: int,
+        max_queue_backlog: int,
         uri: str,
         db_max_retries: int,
         db_retry_wait: int,
@@ -262,6 +299,9 @@ class Recorder(threading.Thread):
         self.keep_days = keep_days
         self.commit_interval = commit_interval
         self.queue: Any = queue.SimpleQueue()
+        self.max_queue_backlog = max_queue_backlog
+        self.metrics = RecorderMetrics()
+        self._backlog_exceeded = False
         self.recording_start = dt_util.utcnow()
         self.db_url = uri
         self.db_max_retries = db_max_retries
@@ -279,7 +319,10 @@ class Recorder(threading.Thread):
         self._commits_without_expire = 0
         self._keepalive_count = 0
         self._old_states = {}
-        self._pending_expunge = []
+        self._pending_events = []
+        self._pending_states = []
+        self._pending_attributes = {}
+        self._state_attributes = OrderedDict()
         self.event_session = None
         self.get_session = None
         self._completed_database_setup = None
@@ -379,6 +422,17 @@ class Recorder(threading.Thread):
                 async_purge, hour=4, minute=12, second=0
             )
 
+        @callback
+        def async_hourly_statistics(now):
+            """Compile the statistics of the hour that ended."""
+            start = dt_util.as_utc(now).replace(minute=0, second=0, microsecond=0)
+            self.queue.put(StatisticsTask(start - statistics.STATISTICS_PERIOD))
+
+        # Compile statistics a few minutes after every hour
+        self.hass.helpers.event.track_time_change(
+            async_hourly_statistics, minute=STATISTICS_MINUTE, second=0
+        )
+
         _LOGGER.debug("Recorder processing the queue")
         # Use a session for the event read loop
         # with a commit every time the event time
@@ -440,6 +494,21 @@ class Recorder(threading.Thread):
                     PurgeTask(event.keep_days, event.repack, event.apply_filter)
                 )
             return
+        if isinstance(event, StatisticsTask):
+            # Make sure the states of the period are in the database
+            self._commit_event_session_or_recover()
+            # Schedule a new statistics task if this one didn't finish
+            if statistics.compile_statistics(self, event.start):
+                return
+            if event.tries < self.db_max_retries:
+                self.queue.put(StatisticsTask(event.start, event.tries + 1))
+            else:
+                _LOGGER.error(
+                    "Giving up compiling statistics for %s after %s tries",
+                    event.start,
+                    event.tries,
+                )
+            return
         if isinstance(event, WaitTask):
             self._queue_watch.set()
             return
@@ -458,13 +527,14 @@ class Recorder(threading.Thread):
         if not self.enabled:
             return
 
+        self.metrics.event_processed(event.time_fired)
+
         try:
             if event.event_type == EVENT_STATE_CHANGED:
-                dbevent = Events.from_event(event, event_data="{}")
+                event_row = Events.row_from_event(event, event_data="{}")
             else:
-                dbevent = Events.from_event(event)
-            dbevent.created = event.time_fired
-            self.event_session.add(dbevent)
+                event_row = Events.row_from_event(event)
+            event_row["created"] = event.time_fired
         except (TypeError, ValueError):
             _LOGGER.warning("Event is not JSON serializable: %s", event)
             return
@@ -473,38 +543,75 @@ class Recorder(threading.Thread):
             _LOGGER.exception("Error adding event: %s", err)
             return
 
-        if event.event_type == EVENT_STATE_CHANGED:
+        if event.event_type != EVENT_STATE_CHANGED:
+            self._pending_events.append(event_row)
+        else:
             try:
-                dbstate = States.from_event(event)
-                has_new_state = event.data.get("new_state")
-                if dbstate.entity_id in self._old_states:
-                    old_state = self._old_states.pop(dbstate.entity_id)
-                    if old_state.state_id:
-                        dbstate.old_state_id = old_state.state_id
-                    else:
-                        dbstate.old_state = old_state
-                if not has_new_state:
-                    dbstate.state = None
-                dbstate.event = dbevent
-                dbstate.created = event.time_fired
-                self.event_session.add(dbstate)
-                if has_new_state:
-                    self._old_states[dbstate.entity_id] = dbstate
-                    self._pending_expunge.append(dbstate)
+                state_row = States.row_from_event(event)
+                new_state = event.data.get("new_state")
+                entity_id = state_row["entity_id"]
+                old_pending = self._old_states.pop(entity_id, None)
+                if new_state:
+                    attributes = new_state.attributes
+                    attributes_row = self._get_attributes_row(
+                        event, attributes, old_pending
+                    )
+                else:
+                    state_row["state"] = None
+                    attributes = attributes_row = None
+                state_row["created"] = event.time_fired
+                pending = PendingState(
+                    state_row,
+                    event_row,
+                    None if old_pending is None else old_pending.state_row,
+                    attributes_row,
+                    attributes,
+                )
+                self._pending_states.append(pending)
+                if new_state:
+                    self._old_states[entity_id] = pending
             except (TypeError, ValueError):
                 _LOGGER.warning(
                     "State is not JSON serializable: %s",
                     event.data.get("new_state"),
                 )
+                # Still record the event itself like any other event
+                self._pending_events.append(event_row)
             except Exception as err:  # pylint: disable=broad-except
                 # Must catch the exception to prevent the loop from collapsing
                 _LOGGER.exception("Error adding state change: %s", err)
+                self._pending_events.append(event_row)
 
         # If they do not have a commit interval
         # than we commit right away
         if not self.commit_interval:
             self._commit_event_session_or_recover()
 
+    def _get_attributes_row(self, event, attributes, old_pending):
+        """Return the state_attributes row for the attributes of a new state."""
+        if (
+            old_pending is not None
+            and old_pending.attributes_row is not None
+            and old_pending.attributes == attributes
+        ):
+            # Comparing the dicts is much cheaper than serializing
+            # them again when only the state changed
+            return old_pending.attributes_row
+
+        shared_attrs = StateAttributes.shared_attrs_from_event(event)
+        attributes_row = self._state_attributes.get(shared_attrs)
+        if attributes_row is not None:
+            self._state_attributes.move_to_end(shared_attrs)
+            return attributes_row
+
+        attributes_row = self._pending_attributes.get(shared_attrs)
+        if attributes_row is None:
+            attributes_row = self._pending_attributes[shared_attrs] = {
+                "hash": StateAttributes.hash_shared_attrs(shared_attrs),
+                "shared_attrs": shared_attrs,
+            }
+        return attributes_row
+
     def _commit_event_session_or_recover(self):
         """Commit changes to the database and recover if the database fails when possible."""
         try:
@@ -551,15 +658,24 @@ class Recorder(threading.Thread):
     def _commit_event_session(self):
         self._commits_without_expire += 1
 
-        if self._pending_expunge:
-            self.event_session.flush()
-            for dbstate in self._pending_expunge:
-                # Expunge the state so its not expired
-                # until we use it later for dbstate.old_state
-                if dbstate in self.event_session:
-                    self.event_session.expunge(dbstate)
-            self._pending_expunge = []
-        self.event_session.commit()
+        start = time.perf_counter()
+        rows = (
+            len(self._pending_events)
+            + len(self._pending_states)
+            + len(self._pending_attributes)
+        )
+        if rows:
+            self._write_pending_rows()
+        try:
+            self.event_session.commit()
+        except Exception:
+            # Nothing of the batch was committed, keep the rows for a
+            # retry without the ids they got in the failed transaction
+            self._strip_pending_ids()
+            raise
+        if rows:
+            self._pending_rows_committed()
+        self.metrics.commit_done(time.perf_counter() - start, rows)
 
         # Expire is an expensive operation (frequently more expensive
         # than the flush and commit itself) so we only
@@ -568,6 +684,144 @@ class Recorder(threading.Thread):
             self._commits_without_expire = 0
             self.event_session.expire_all()
 
+    def _write_pending_rows(self):
+        """Bulk insert the rows accumulated since the last commit.
+
+        The rows are written with core inserts in the event
+        session transaction so they are committed or rolled back with it.
+        They stay pending until that transaction is committed.
+        """
+        # Write the rows in a savepoint so a failure only discards this
+        # batch and not other objects waiting in the event session
+        savepoint = self.event_session.begin_nested()
+        connection = self.event_session.connection()
+        try:
+            if self._pending_events:
+                # Nothing references these events so we do not
+                # need their ids and can use executemany
+                connection.execute(Events.__table__.insert(), self._pending_events)
+            self._insert_rows(
+                connection,
+                Events.__table__,
+                [pending.event_row for pending in self._pending_states],
+                "event_id",
+            )
+            self._write_pending_attributes(connection)
+            self._insert_pending_states(connection)
+            savepoint.commit()
+        except Exception:
+            # Discard the partial writes so a retry inserts every row
+            # exactly once
+            try:
+                savepoint.rollback()
+            except Exception:  # pylint: disable=broad-except
+                # The connection is gone, nothing of the transaction is left
+                self.event_session.rollback()
+            self._strip_pending_ids()
+            raise
+
+    def _strip_pending_ids(self):
+        """Remove the ids assigned to the pending rows in a failed transaction."""
+        for pending in self._pending_states:
+            pending.event_row.pop("event_id", None)
+            pending.state_row.pop("state_id", None)
+        for attributes_row in self._pending_attributes.values():
+            attributes_row.pop("attributes_id", None)
+
+    def _pending_rows_committed(self):
+        """Clear the pending rows and cache their attributes once committed."""
+        state_attributes = self._state_attributes
+        for shared_attrs, attributes_row in self._pending_attributes.items():
+            state_attributes[shared_attrs] = attributes_row
+        while len(state_attributes) > STATE_ATTRIBUTES_CACHE_SIZE:
+            state_attributes.popitem(last=False)
+
+        self._pending_events = []
+        self._pending_states = []
+        self._pending_attributes = {}
+
+    def _write_pending_attributes(self, connection):
+        """Link the pending attributes to identical rows or insert them."""
+        pending_attributes = self._pending_attributes
+        if not pending_attributes:
+            return
+
+        table = StateAttributes.__table__
+        hashes = list({row["hash"] for row in pending_attributes.values()})
+        for start in range(0, len(hashes), MAX_ROWS_PER_INSERT):
+            query = select([table.c.attributes_id, table.c.shared_attrs]).where(
+                table.c.hash.in_(hashes[start : start + MAX_ROWS_PER_INSERT])
+            )
+            for attributes_id, shared_attrs in connection.execute(query):
+                if shared_attrs in pending_attributes:
+                    pending_attributes[shared_attrs]["attributes_id"] = attributes_id
+
+        self._insert_rows(
+            connection,
+            table,
+            [row for row in pending_attributes.values() if "attributes_id" not in row],
+            "attributes_id",
+        )
+
+    def _insert_pending_states(self, connection):
+        """Insert the pending states linked to their events and old states."""
+        rows = []
+        for (
+            state_row,
+            event_row,
+            old_state_row,
+            attributes_row,
+            _,
+        ) in self._pending_states:
+            if old_state_row is not None and "state_id" not in old_state_row:
+                # The old state is waiting in this batch as well,
+                # write it first so we know its id
+                self._insert_rows(connection, States.__table__, rows, "state_id")
+                rows = []
+            state_row["event_id"] = event_row["event_id"]
+            state_row["old_state_id"] = (
+                None if old_state_row is None else old_state_row["state_id"]
+            )
+            state_row["attributes_id"] = (
+                None if attributes_row is None else attributes_row["attributes_id"]
+            )
+            rows.append(state_row)
+        self._insert_rows(connection, States.__table__, rows, "state_id")
+
+    def _insert_rows(self, connection, table, rows, id_column):
+        """Insert rows and set the generated primary key on each of them."""
+        if connection.dialect.name != "postgresql":
+            # The ids of a multi-row insert are not guaranteed to be
+            # consecutive, so only RETURNING can tell them reliably
+            for row in rows:
+                result = connection.execute(table.insert(), row)
+                row[id_column] = result.inserted_primary_key[0]
+            return
+
+        for start in range(0, len(rows), MAX_ROWS_PER_INSERT):
+            chunk = rows[start : start + MAX_ROWS_PER_INSERT]
+            # RETURNING yields the ids in the order of the values
+            result = connection.execute(
+                table.insert().values(chunk).returning(table.c[id_column])
+            )
+            for row, (row_id,) in zip(chunk, result):
+                row[id_column] = row_id
+
+    def state_attributes_ids_in_use(self):
+        """Return the ids of the state attributes rows we may link new states to."""
+        attributes_rows = list(self._state_attributes.values())
+        attributes_rows.extend(
+            pending.attributes_row for pending in self._old_states.values()
+        )
+        attributes_rows.extend(
+            pending.attributes_row for pending in self._pending_states
+        )
+        return {
+            attributes_row["attributes_id"]
+            for attributes_row in attributes_rows
+            if attributes_row is not None and "attributes_id" in attributes_row
+        }
+
     def _handle_sqlite_corruption(self):
         """Handle the sqlite3 database being corrupt."""
         self._close_connection()
@@ -576,7 +830,6 @@ class Recorder(threading.Thread):
 
     def _reopen_event_session(self):
         """Rollback the event session and reopen it after a failure."""
-        self._old_states = {}
 
         try:
             self.event_session.rollback()
@@ -591,6 +844,13 @@ class Recorder(threading.Thread):
 
     def _open_event_session(self):
         """Open the event session."""
+        # Rows that were not written with the previous session are lost
+        # so the old states may no longer have a row to link to
+        self._old_states = {}
+        self._pending_events = []
+        self._pending_states = []
+        self._pending_attributes = {}
+        self._state_attributes.clear()
         try:
             self.event_session = self.get_session()
             self.event_session.expire_on_commit = False
@@ -611,9 +871,50 @@ class Recorder(threading.Thread):
 
     @callback
     def event_listener(self, event):
-        """Listen for new events and put them in the process queue."""
+        """Listen for new events and put them in the process queue.
+
+        When the database cannot keep up and the backlog reaches
+        max_queue_backlog, new events are dropped instead of growing
+        the queue until we run out of memory.
+        """
+        backlog = self.queue.qsize()
+        if self._backlog_exceeded:
+            # Wait until half of the backlog is written before we
+            # resume so we do not flap around the limit
+            if backlog >= max(self.max_queue_backlog // 2, 1):
+                self.metrics.events_dropped += 1
+                return
+            self._backlog_exceeded = False
+            _LOGGER.warning(
+                "The recorder queue has drained; Recording resumed after "
+                "%s events were dropped",
+                self.metrics.events_dropped,
+            )
+        elif backlog >= self.max_queue_backlog:
+            self._backlog_exceeded = True
+            self.metrics.events_dropped += 1
+            _LOGGER.error(
+                "The recorder queue reached the maximum size of %s; "
+                "Events are not being recorded until the database catches up",
+                self.max_queue_backlog,
+            )
+            return
+
         self.queue.put(event)
 
+    @callback
+    def async_get_info(self) -> dict[str, Any]:
+        """Return the state of the queue and the database writer."""
+        backlog = self.queue.qsize()
+        return {
+            "backlog": backlog,
+            "max_backlog": self.max_queue_backlog,
+            "backlog_exceeded": self._backlog_exceeded,
+            "recording": self.enabled,
+            "thread_running": self.is_alive(),
+            **self.metrics.as_dict(backlog),
+        }
+
     def block_till_done(self):
         """Block till all events processed.
 
@@ -8,3 +8,11 @@ CONF_DB_INTEGRITY_CHECK = "db_integrity_check"
 
 # The maximum number of rows (events) we purge in one delete statement
 MAX_ROWS_TO_PURGE = 1000
+
+# The maximum number of rows we write in one multi-row insert statement,
+# this keeps us below the default sqlite limit of 999 bound parameters
+MAX_ROWS_PER_INSERT = 100
+
+# The number of recently written state attributes we remember so
+# identical attributes are linked without querying the database
+STATE_ATTRIBUTES_CACHE_SIZE = 2048
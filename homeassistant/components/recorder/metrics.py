@@ -0,0 +1,78 @@
+"""Track the throughput of the recorder thread."""
+from __future__ import annotations
+
+from datetime import datetime
+import time
+from typing import Any
+
+import homeassistant.util.dt as dt_util
+
+# The number of seconds we average the write rate over
+RATE_WINDOW = 10
+
+
+class RecorderMetrics:
+    """Counters and timings of the recorder.
+
+    The write counters and timings are only updated by the recorder
+    thread and events_dropped only by the event listener on the event
+    loop. Everything is read from the event loop, a slightly stale
+    read is fine so no locking is needed.
+    """
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.events_dropped = 0
+        self.rows_written = 0
+        self.commits = 0
+        self.last_commit_duration = 0.0
+        self.max_commit_duration = 0.0
+        self._last_time_fired: datetime | None = None
+        self._window_start = time.monotonic()
+        self._window_rows = 0
+        self._window_rate = 0.0
+
+    def event_processed(self, time_fired: datetime) -> None:
+        """Remember when the event the recorder is working on was fired."""
+        self._last_time_fired = time_fired
+
+    def commit_done(self, duration: float, rows: int) -> None:
+        """Record a finished commit."""
+        self.commits += 1
+        self.rows_written += rows
+        self.last_commit_duration = duration
+        self.max_commit_duration = max(self.max_commit_duration, duration)
+
+        self._window_rows += rows
+        now = time.monotonic()
+        elapsed = now - self._window_start
+        if elapsed >= RATE_WINDOW:
+            self._window_rate = self._window_rows / elapsed
+            self._window_start = now
+            self._window_rows = 0
+
+    def rows_per_second(self) -> float:
+        """Return the rate rows were written at recently."""
+        elapsed = time.monotonic() - self._window_start
+        if elapsed >= RATE_WINDOW:
+            # No commit closed the window, the recorder is idle or stalled
+            return self._window_rows / elapsed
+        return self._window_rate
+
+    def backlog_age(self, backlog: int) -> float:
+        """Return how many seconds the recorder is behind the event bus."""
+        if not backlog or self._last_time_fired is None:
+            return 0.0
+        return max((dt_util.utcnow() - self._last_time_fired).total_seconds(), 0.0)
+
+    def as_dict(self, backlog: int) -> dict[str, Any]:
+        """Return the metrics as a dictionary."""
+        return {
+            "backlog_age": round(self.backlog_age(backlog), 3),
+            "events_dropped": self.events_dropped,
+            "rows_written": self.rows_written,
+            "rows_per_second": round(self.rows_per_second(), 1),
+            "commits": self.commits,
+            "last_commit_duration": round(self.last_commit_duration, 4),
+            "max_commit_duration": round(self.max_commit_duration, 4),
+        }
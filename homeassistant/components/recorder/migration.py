@@ -363,6 +363,15 @@ def _apply_update(engine, new_version, old_version):
         if engine.dialect.name == "mysql":
             _modify_columns(engine, "events", ["event_data LONGTEXT"])
             _modify_columns(engine, "states", ["attributes LONGTEXT"])
+    elif new_version == 13:
+        # The state_attributes table is created by create_all,
+        # new states link to their attributes instead of
+        # storing a copy in the attributes column
+        _add_columns(engine, "states", ["attributes_id INTEGER"])
+        _create_index(engine, "states", "ix_states_attributes_id")
+    elif new_version == 14:
+        # The statistics table is created by create_all
+        pass
     else:
         raise ValueError(f"No schema migration defined for version {new_version}")
 
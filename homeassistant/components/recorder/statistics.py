@@ -0,0 +1,263 @@
+"""Hourly statistics of numeric sensors."""
+from __future__ import annotations
+
+from collections import defaultdict
+from datetime import datetime, timedelta
+from itertools import groupby
+import logging
+import time
+from typing import TYPE_CHECKING, Any, Iterable
+
+from sqlalchemy import func
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.orm.session import Session
+
+from homeassistant.const import (
+    ATTR_UNIT_OF_MEASUREMENT,
+    ENERGY_KILO_WATT_HOUR,
+    ENERGY_WATT_HOUR,
+    VOLUME_CUBIC_FEET,
+    VOLUME_CUBIC_METERS,
+)
+from homeassistant.helpers.typing import HomeAssistantType
+import homeassistant.util.dt as dt_util
+
+from .models import (
+    States,
+    Statistics,
+    process_timestamp,
+    process_timestamp_to_utc_isoformat,
+)
+from .util import execute, session_scope
+
+if TYPE_CHECKING:
+    from . import Recorder
+
+_LOGGER = logging.getLogger(__name__)
+
+STATISTICS_DOMAINS = ("sensor",)
+STATISTICS_PERIOD = timedelta(hours=1)
+
+# Units of sensors that accumulate, like energy and gas meters
+ACCUMULATING_UNITS = {
+    ENERGY_KILO_WATT_HOUR,
+    ENERGY_WATT_HOUR,
+    VOLUME_CUBIC_FEET,
+    VOLUME_CUBIC_METERS,
+}
+
+QUERY_STATISTICS = [
+    Statistics.statistic_id,
+    Statistics.start,
+    Statistics.mean,
+    Statistics.min,
+    Statistics.max,
+    Statistics.state,
+    Statistics.sum,
+]
+
+
+def compile_statistics(instance: Recorder, start: datetime) -> bool:
+    """Compile statistics for the hour starting at start.
+
+    Each period continues from the last value of the previous period,
+    so sensors that did not change are carried forward. Sensors without
+    statistics for the previous period, after the first run or downtime,
+    continue from their last state in the keep_days before the period.
+
+    Returns False when the period should be compiled again later.
+    """
+    start = dt_util.as_utc(start)
+    end = start + STATISTICS_PERIOD
+    _LOGGER.debug("Compiling statistics for %s-%s", start, end)
+    try:
+        with session_scope(session=instance.get_session()) as session:  # type: ignore
+            if (
+                session.query(Statistics.id).filter(Statistics.start == start).first()
+                is not None
+            ):
+                _LOGGER.debug("Statistics already compiled for %s", start)
+                return True
+
+            initial_states = {
+                row.statistic_id: row.state
+                for row in session.query(Statistics.statistic_id, Statistics.state)
+                .filter(Statistics.start == start - STATISTICS_PERIOD)
+                .filter(Statistics.state.isnot(None))
+            }
+            initial_states.update(
+                _last_states_before(
+                    session,
+                    start,
+                    start - timedelta(days=instance.keep_days),
+                    initial_states.keys(),
+                )
+            )
+
+            query = (
+                session.query(States.entity_id, States.state, States.last_updated)
+                .filter(States.domain.in_(STATISTICS_DOMAINS))
+                .filter(States.last_updated >= start)
+                .filter(States.last_updated < end)
+                .order_by(States.entity_id, States.last_updated)
+            )
+            changes = {
+                entity_id: [
+                    (process_timestamp(row.last_updated), _float_or_none(row.state))
+                    for row in rows
+                ]
+                for entity_id, rows in groupby(
+                    execute(query), lambda row: row.entity_id
+                )
+            }
+
+            for statistic_id in sorted(initial_states.keys() | changes.keys()):
+                stat = _compile_statistic(
+                    start,
+                    initial_states.get(statistic_id),
+                    changes.get(statistic_id, []),
+                    _is_accumulating(instance.hass, statistic_id),
+                )
+                if stat is not None:
+                    session.add(
+                        Statistics(statistic_id=statistic_id, start=start, **stat)
+                    )
+    except SQLAlchemyError as err:
+        _LOGGER.warning(
+            "Error compiling statistics: %s; retrying in %s seconds",
+            err,
+            instance.db_retry_wait,
+        )
+        time.sleep(instance.db_retry_wait)
+        return False
+
+    return True
+
+
+def _last_states_before(
+    session: Session, start: datetime, since: datetime, exclude: Iterable[str]
+) -> dict[str, float]:
+    """Return the last numeric state of the sensors between since and start."""
+    last_state_ids = session.query(
+        func.max(States.state_id).label("max_state_id")
+    ).filter(
+        States.domain.in_(STATISTICS_DOMAINS),
+        States.last_updated >= since,
+        States.last_updated < start,
+    )
+    exclude = list(exclude)
+    if exclude:
+        last_state_ids = last_state_ids.filter(~States.entity_id.in_(exclude))
+    last_state_ids = last_state_ids.group_by(States.entity_id).subquery()
+
+    query = session.query(States.entity_id, States.state).join(
+        last_state_ids, States.state_id == last_state_ids.c.max_state_id
+    )
+    last_states = {}
+    for row in execute(query):
+        value = _float_or_none(row.state)
+        if value is not None:
+            last_states[row.entity_id] = value
+    return last_states
+
+
+def _is_accumulating(hass: HomeAssistantType, statistic_id: str) -> bool:
+    """Return if the sensor accumulates, so the sum of its increase is useful."""
+    state = hass.states.get(statistic_id)
+    return (
+        state is not None
+        and state.attributes.get(ATTR_UNIT_OF_MEASUREMENT) in ACCUMULATING_UNITS
+    )
+
+
+def _float_or_none(state: str | None) -> float | None:
+    """Return the state as a float or None if it is not numeric."""
+    try:
+        return float(state)  # type: ignore
+    except (TypeError, ValueError):
+        return None
+
+
+def _compile_statistic(
+    start: datetime,
+    initial_state: float | None,
+    changes: list[tuple[datetime, float | None]],
+    accumulating: bool,
+) -> dict[str, float | None] | None:
+    """Compile the statistic of one sensor over one period.
+
+    The mean is weighted by how long each value was held. For sensors
+    that accumulate the sum is the total increase over the period where
+    a decrease is handled as the meter being reset to zero, for other
+    sensors the sum is None.
+    """
+    samples = changes
+    if initial_state is not None:
+        samples = [(start, initial_state), *changes]
+
+    values = [value for _, value in samples if value is not None]
+    if not values:
+        return None
+
+    end = start + STATISTICS_PERIOD
+    weighted_sum = 0.0
+    duration = 0.0
+    increase = 0.0
+    last_value = None
+    for (changed, value), next_changed in zip(
+        samples, [changed for changed, _ in samples[1:]] + [end]
+    ):
+        if value is None:
+            continue
+        seconds = (next_changed - changed).total_seconds()
+        weighted_sum += value * seconds
+        duration += seconds
+        if last_value is not None:
+            increase += value - last_value if value >= last_value else value
+        last_value = value
+
+    return {
+        "mean": weighted_sum / duration if duration else values[-1],
+        "min": min(values),
+        "max": max(values),
+        "state": samples[-1][1],
+        "sum": increase if accumulating else None,
+    }
+
+
+def statistics_during_period(
+    hass: HomeAssistantType,
+    start_time: datetime,
+    end_time: datetime | None = None,
+    statistic_ids: Iterable[str] | None = None,
+) -> dict[str, list[dict[str, Any]]]:
+    """Return the hourly statistics that started during start_time - end_time."""
+    with session_scope(hass=hass) as session:
+        query = session.query(*QUERY_STATISTICS).filter(Statistics.start >= start_time)
+        if end_time is not None:
+            query = query.filter(Statistics.start < end_time)
+        if statistic_ids is not None:
+            query = query.filter(Statistics.statistic_id.in_(list(statistic_ids)))
+        query = query.order_by(Statistics.statistic_id, Statistics.start)
+
+        return _sorted_statistics_to_dict(execute(query))
+
+
+def _sorted_statistics_to_dict(
+    stats: Iterable[Any],
+) -> dict[str, list[dict[str, Any]]]:
+    """Convert SQL results into a JSON friendly dict keyed by statistic_id."""
+    result: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for db_state in stats:
+        result[db_state.statistic_id].append(
+            {
+                "statistic_id": db_state.statistic_id,
+                "start": process_timestamp_to_utc_isoformat(db_state.start),
+                "mean": db_state.mean,
+                "min": db_state.min,
+                "max": db_state.max,
+                "state": db_state.state,
+                "sum": db_state.sum,
+            }
+        )
+    return dict(result)
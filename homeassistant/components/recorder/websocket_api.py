@@ -0,0 +1,22 @@
+"""Websocket API for the recorder integration."""
+import voluptuous as vol
+
+from homeassistant.components import websocket_api
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DATA_INSTANCE
+
+
+@callback
+def async_setup(hass: HomeAssistant) -> None:
+    """Set up the recorder websocket API."""
+    websocket_api.async_register_command(hass, ws_info)
+
+
+@websocket_api.require_admin
+@websocket_api.websocket_command({vol.Required("type"): "recorder/info"})
+@callback
+def ws_info(hass: HomeAssistant, connection: websocket_api.ActiveConnection, msg):
+    """Return the queue backlog and write metrics of the recorder."""
+    instance = hass.data[DATA_INSTANCE]
+    connection.send_result(msg["id"], instance.async_get_info())
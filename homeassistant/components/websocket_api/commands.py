@@ -6,7 +6,7 @@ import voluptuous as vol
 from homeassistant.auth.permissions.const import CAT_ENTITIES, POLICY_READ
 from homeassistant.components.websocket_api.const import ERR_NOT_FOUND
 from homeassistant.const import EVENT_STATE_CHANGED, EVENT_TIME_CHANGED, MATCH_ALL
-from homeassistant.core import DOMAIN as HASS_DOMAIN, callback
+from homeassistant.core import DOMAIN as HASS_DOMAIN, callback, split_entity_id
 from homeassistant.exceptions import (
     HomeAssistantError,
     ServiceNotFound,
@@ -14,9 +14,18 @@ from homeassistant.exceptions import (
     Unauthorized,
 )
 from homeassistant.helpers import config_validation as cv, entity, template
-from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+from homeassistant.helpers.event import (
+    TrackTemplate,
+    async_call_later,
+    async_track_state_change_event,
+    async_track_template_result,
+)
 from homeassistant.helpers.service import async_get_all_descriptions
-from homeassistant.loader import IntegrationNotFound, async_get_integration
+from homeassistant.loader import (
+    IntegrationNotFound,
+    async_get_import_times,
+    async_get_integration,
+)
 
 from . import const, decorators, messages
 
@@ -27,17 +36,21 @@ from . import const, decorators, messages
 def async_register_commands(hass, async_reg):
     """Register commands."""
     async_reg(hass, handle_call_service)
+    async_reg(hass, handle_connection_info)
     async_reg(hass, handle_entity_source)
     async_reg(hass, handle_execute_script)
     async_reg(hass, handle_get_config)
     async_reg(hass, handle_get_services)
     async_reg(hass, handle_get_states)
+    async_reg(hass, handle_integration_import_times)
     async_reg(hass, handle_manifest_get)
     async_reg(hass, handle_manifest_list)
     async_reg(hass, handle_ping)
     async_reg(hass, handle_render_template)
     async_reg(hass, handle_subscribe_events)
+    async_reg(hass, handle_subscribe_states)
     async_reg(hass, handle_subscribe_trigger)
+    async_reg(hass, handle_supported_features)
     async_reg(hass, handle_test_condition)
     async_reg(hass, handle_unsubscribe_events)
 
@@ -116,6 +129,134 @@ def handle_unsubscribe_events(hass, connection, msg):
         )
 
 
+@callback
+@decorators.websocket_command(
+    vol.All(
+        {
+            vol.Required("type"): "subscribe_states",
+            vol.Optional("entity_ids"): cv.entity_ids,
+            vol.Optional("domains"): vol.All(
+                cv.ensure_list, [vol.All(cv.string, vol.Lower)]
+            ),
+            vol.Optional("attributes"): vol.All(cv.ensure_list, [cv.string]),
+            vol.Optional("min_interval", default=0): vol.All(
+                vol.Coerce(float), vol.Range(min=0)
+            ),
+        },
+        cv.has_at_least_one_key("entity_ids", "domains"),
+    )
+)
+def handle_subscribe_states(hass, connection, msg):
+    """Handle subscribe states command.
+
+    Only the states of the requested entities and domains are sent. Changes
+    within min_interval seconds of the last message are coalesced, so only
+    the latest state of each entity is sent when the interval has passed.
+    """
+    entity_ids = set(msg.get("entity_ids", []))
+    domains = set(msg.get("domains", []))
+    attributes = msg.get("attributes")
+    min_interval = msg["min_interval"]
+
+    entity_perm = connection.user.permissions.check_entity
+    pending: dict = {}
+    last_sent = 0.0
+    unsub_flush = None
+
+    def _as_dict(state):
+        """Return the state as sent to the client."""
+        if state is None:
+            return None
+        if attributes is None:
+            return state
+        return {
+            **state.as_dict(),
+            "attributes": {
+                key: state.attributes[key]
+                for key in attributes
+                if key in state.attributes
+            },
+        }
+
+    def _changed(old_state, new_state):
+        """Return if the change is relevant to the client."""
+        if attributes is None or old_state is None or new_state is None:
+            return True
+        return old_state.state != new_state.state or any(
+            old_state.attributes.get(key) != new_state.attributes.get(key)
+            for key in attributes
+        )
+
+    @callback
+    def flush(_now=None):
+        """Send the latest state of all changed entities."""
+        nonlocal last_sent, unsub_flush
+        unsub_flush = None
+        last_sent = hass.loop.time()
+        states = {entity_id: _as_dict(state) for entity_id, state in pending.items()}
+        pending.clear()
+        connection.send_message(messages.event_message(msg["id"], states))
+
+    @callback
+    def forward_state(event):
+        """Queue a state change for the websocket."""
+        nonlocal unsub_flush
+        entity_id = event.data["entity_id"]
+        new_state = event.data["new_state"]
+        if not entity_perm(entity_id, POLICY_READ) or not _changed(
+            event.data["old_state"], new_state
+        ):
+            return
+
+        pending[entity_id] = new_state
+        if unsub_flush is not None:
+            return
+
+        delay = last_sent + min_interval - hass.loop.time()
+        if delay <= 0:
+            flush()
+        else:
+            unsub_flush = async_call_later(hass, delay, flush)
+
+    @callback
+    def domain_filter(event):
+        """Filter state changes of the subscribed domains."""
+        entity_id = event.data["entity_id"]
+        return entity_id not in entity_ids and split_entity_id(entity_id)[0] in domains
+
+    unsubs = []
+    if entity_ids:
+        unsubs.append(async_track_state_change_event(hass, entity_ids, forward_state))
+    if domains:
+        unsubs.append(
+            hass.bus.async_listen(
+                EVENT_STATE_CHANGED, forward_state, event_filter=domain_filter
+            )
+        )
+
+    @callback
+    def unsubscribe():
+        """Stop forwarding states."""
+        for unsub in unsubs:
+            unsub()
+        if unsub_flush is not None:
+            unsub_flush()
+
+    connection.subscriptions[msg["id"]] = unsubscribe
+    connection.send_result(msg["id"])
+
+    # Start with the current states
+    if domains:
+        for state in hass.states.async_all(domains):
+            if entity_perm(state.entity_id, POLICY_READ):
+                pending[state.entity_id] = state
+    for entity_id in entity_ids:
+        state = hass.states.get(entity_id)
+        if state is not None and entity_perm(entity_id, POLICY_READ):
+            pending[entity_id] = state
+    flush()
+
+
 @decorators.websocket_command(
     {
         vol.Required("type"): "call_service",
@@ -241,6 +382,24 @@ async def handle_manifest_get(hass, connection, msg):
         connection.send_error(msg["id"], const.ERR_NOT_FOUND, "Integration not found")
 
 
+@callback
+@decorators.websocket_command({vol.Required("type"): "integration/import_times"})
+@decorators.require_admin
+def handle_integration_import_times(hass, connection, msg):
+    """Handle integration import times command."""
+    connection.send_result(msg["id"], async_get_import_times(hass))
+
+
+@callback
+@decorators.websocket_command({vol.Required("type"): "connection/info"})
+def handle_connection_info(hass, connection, msg):
+    """Handle the write queue depth and metrics of the connection command."""
+    info = {}
+    if connection.async_get_write_info is not None:
+        info = connection.async_get_write_info()
+    connection.send_result(msg["id"], info)
+
+
 @callback
 @decorators.websocket_command({vol.Required("type"): "ping"})
 def handle_ping(hass, connection, msg):
@@ -248,6 +407,19 @@ def handle_ping(hass, connection, msg):
     connection.send_message(pong_message(msg["id"]))
 
 
+@callback
+@decorators.websocket_command(
+    {
+        vol.Required("type"): "supported_features",
+        vol.Required("features"): {str: int},
+    }
+)
+def handle_supported_features(hass, connection, msg):
+    """Handle setting the features supported by the client."""
+    connection.supported_features = msg["features"]
+    connection.send_result(msg["id"])
+
+
 @decorators.websocket_command(
     {
         vol.Required("type"): "render_template",
@@ -30,6 +30,14 @@ class ActiveConnection:
 
         self.subscriptions: dict[Hashable, Callable[[], Any]] = {}
         self.last_id = 0
+        self.supported_features: dict[str, float] = {}
+        # Set by the websocket handler that writes to the client
+        self.async_get_write_info: Callable[[], dict[str, int]] | None = None
+
+    @property
+    def can_coalesce(self) -> bool:
+        """Return if the client accepts multiple messages in one frame."""
+        return self.supported_features.get(const.FEATURE_COALESCE_MESSAGES) == 1
 
     def context(self, msg):
         """Return a context."""
@@ -1,8 +1,12 @@
 """Decorators for the Websocket API."""
+from __future__ import annotations
+
 import asyncio
 from functools import wraps
 from typing import Awaitable, Callable
 
+import voluptuous as vol
+
 from homeassistant.core import HomeAssistant, callback
 from homeassistant.exceptions import Unauthorized
 
@@ -109,15 +113,27 @@ def ws_require_user(
 
 
 def websocket_command(
-    schema: dict,
+    schema: dict | vol.All,
 ) -> Callable[[const.WebSocketCommandHandler], const.WebSocketCommandHandler]:
-    """Tag a function as a websocket command."""
-    command = schema["type"]
+    """Tag a function as a websocket command.
+
+    The schema is a dict or a vol.All with the dict first, for validators
+    that look at the message as a whole.
+    """
+    if isinstance(schema, dict):
+        command = schema["type"]
+        ws_schema = messages.BASE_COMMAND_MESSAGE_SCHEMA.extend(schema)
+    else:
+        command = schema.validators[0]["type"]
+        ws_schema = vol.All(
+            messages.BASE_COMMAND_MESSAGE_SCHEMA.extend(schema.validators[0]),
+            *schema.validators[1:],
+        )
 
     def decorate(func):
         """Decorate ws command function."""
         # pylint: disable=protected-access
-        func._ws_schema = messages.BASE_COMMAND_MESSAGE_SCHEMA.extend(schema)
+        func._ws_schema = ws_schema
         func._ws_command = command
         return func
 
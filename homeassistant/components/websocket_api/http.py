@@ -51,6 +51,30 @@ class WebSocketAdapter(logging.LoggerAdapter):
         return f'[{self.extra["connid"]}] {msg}', kwargs
 
 
+class WriteMetrics:
+    """Track the messages written to a websocket client."""
+
+    def __init__(self) -> None:
+        """Initialize the metrics."""
+        self.messages_sent = 0
+        self.frames_sent = 0
+        self.peak_pending = 0
+
+    def frame_sent(self, messages: int) -> None:
+        """Record a frame holding a number of messages was sent."""
+        self.frames_sent += 1
+        self.messages_sent += messages
+
+    def as_dict(self, pending: int) -> dict[str, int]:
+        """Return the metrics and the current queue depth as a dictionary."""
+        return {
+            "pending_messages": pending,
+            "peak_pending": self.peak_pending,
+            "messages_sent": self.messages_sent,
+            "frames_sent": self.frames_sent,
+        }
+
+
 class WebSocketHandler:
     """Handle an active websocket client connection."""
 
@@ -62,24 +86,57 @@ class WebSocketHandler:
         self._to_write: asyncio.Queue = asyncio.Queue(maxsize=MAX_PENDING_MSG)
         self._handle_task = None
         self._writer_task = None
+        self._connection = None
         self._logger = WebSocketAdapter(_WS_LOGGER, {"connid": id(self)})
         self._peak_checker_unsub = None
+        self.metrics = WriteMetrics()
+
+    @property
+    def pending_messages(self) -> int:
+        """Return the number of messages waiting to be written."""
+        return self._to_write.qsize()
+
+    @callback
+    def async_get_write_info(self) -> dict[str, int]:
+        """Return the queue depth and write metrics of the connection."""
+        return self.metrics.as_dict(self.pending_messages)
 
     async def _writer(self):
         """Write outgoing messages."""
+        to_write = self._to_write
         # Exceptions if Socket disconnected or cancelled by connection handler
         with suppress(RuntimeError, ConnectionResetError, *CANCELLATION_ERRORS):
             while not self.wsock.closed:
-                message = await self._to_write.get()
+                message = await to_write.get()
                 if message is None:
                     break
 
-                if not isinstance(message, str):
-                    message = message_to_json(message)
-
-                self._logger.debug("Sending %s", message)
+                messages = [message]
+                connection = self._connection
+                if connection and connection.can_coalesce:
+                    # Write everything queued since the writer last ran
+                    # together. Other clients leave their backlog in the
+                    # queue so a slow reader still trips the peak check.
+                    while not to_write.empty():
+                        message = to_write.get_nowait()
+                        if message is None:
+                            break
+                        messages.append(message)
+
+                for idx, queued in enumerate(messages):
+                    if not isinstance(queued, str):
+                        messages[idx] = queued = message_to_json(queued)
+                    self._logger.debug("Sending %s", queued)
+
+                if len(messages) > 1:
+                    await self.wsock.send_str(f"[{','.join(messages)}]")
+                else:
+                    await self.wsock.send_str(messages[0])
+                self.metrics.frame_sent(len(messages))
 
-                await self.wsock.send_str(message)
+                # A None message closes the writer
+                if message is None:
+                    break
 
         # Clean up the peaker checker when we shut down the writer
         if self._peak_checker_unsub:
@@ -103,7 +160,11 @@ class WebSocketHandler:
 
             self._cancel()
 
-        if self._to_write.qsize() < PENDING_MSG_PEAK:
+        pending = self._to_write.qsize()
+        if pending > self.metrics.peak_pending:
+            self.metrics.peak_pending = pending
+
+        if pending < PENDING_MSG_PEAK:
             if self._peak_checker_unsub:
                 self._peak_checker_unsub()
                 self._peak_checker_unsub = None
@@ -185,7 +246,8 @@ class WebSocketHandler:
                 raise Disconnect from err
 
             self._logger.debug("Received %s", msg_data)
-            connection = await auth.async_handle(msg_data)
+            connection = self._connection = await auth.async_handle(msg_data)
+            connection.async_get_write_info = self.async_get_write_info
             self.hass.data[DATA_CONNECTIONS] = (
                 self.hass.data.get(DATA_CONNECTIONS, 0) + 1
             )
@@ -32,6 +32,9 @@ BASE_COMMAND_MESSAGE_SCHEMA = vol.Schema({vol.Required("id"): cv.positive_int})
 IDEN_TEMPLATE = "__IDEN__"
 IDEN_JSON_TEMPLATE = '"__IDEN__"'
 
+# Events that can be in flight to the subscribers at once
+EVENT_MESSAGE_CACHE_SIZE = 1024
+
 
 def result_message(iden: int, result: Any = None) -> dict:
     """Return a success result message."""
@@ -62,17 +65,21 @@ def cached_event_message(iden: int, event: Event) -> str:
     all getting many of the same events (mostly state changed)
     we can avoid serializing the same data for each connection.
     """
-    return _cached_event_message(event).replace(IDEN_JSON_TEMPLATE, str(iden), 1)
+    head, tail = _cached_event_message(event)
+    return f"{head}{iden}{tail}"
 
 
-@lru_cache(maxsize=128)
-def _cached_event_message(event: Event) -> str:
+@lru_cache(maxsize=EVENT_MESSAGE_CACHE_SIZE)
+def _cached_event_message(event: Event) -> tuple[str, str]:
     """Cache and serialize the event to json.
 
-    The IDEN_TEMPLATE is used which will be replaced
-    with the actual iden in cached_event_message
+    The json is split at the IDEN_TEMPLATE so cached_event_message
+    only has to join the parts around the actual iden.
     """
-    return message_to_json(event_message(IDEN_TEMPLATE, event))
+    head, _, tail = message_to_json(event_message(IDEN_TEMPLATE, event)).partition(
+        IDEN_JSON_TEMPLATE
+    )
+    return head, tail
 
 
 def message_to_json(message: Any) -> str:
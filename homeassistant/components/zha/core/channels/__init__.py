@@ -117,13 +117,17 @@ class Channels:
             return
         self._pools.append(ChannelPool.new(self, ep_id))
 
-    async def async_initialize(self, from_cache: bool = False) -> None:
-        """Initialize claimed channels."""
+    async def async_initialize(self, from_cache: bool = False) -> bool:
+        """Initialize claimed channels.
+
+        Return if all channels were initialized.
+        """
         await self.zdo_channel.async_initialize(from_cache)
         self.zdo_channel.debug("'async_initialize' stage succeeded")
-        await asyncio.gather(
+        results = await asyncio.gather(
             *(pool.async_initialize(from_cache) for pool in self.pools)
         )
+        return all(results)
 
     async def async_configure(self) -> None:
         """Configure claimed channels."""
@@ -312,16 +316,22 @@ class ChannelPool:
                 channel = channel_class(cluster, self)
                 self.client_channels[channel.id] = channel
 
-    async def async_initialize(self, from_cache: bool = False) -> None:
-        """Initialize claimed channels."""
-        await self._execute_channel_tasks("async_initialize", from_cache)
+    async def async_initialize(self, from_cache: bool = False) -> bool:
+        """Initialize claimed channels.
+
+        Return if all channels were initialized.
+        """
+        return await self._execute_channel_tasks("async_initialize", from_cache)
 
     async def async_configure(self) -> None:
         """Configure claimed channels."""
         await self._execute_channel_tasks("async_configure")
 
-    async def _execute_channel_tasks(self, func_name: str, *args: Any) -> None:
-        """Add a throttled channel task and swallow exceptions."""
+    async def _execute_channel_tasks(self, func_name: str, *args: Any) -> bool:
+        """Add a throttled channel task and swallow exceptions.
+
+        Return if the task succeeded for all channels.
+        """
 
         async def _throttle(coro):
             async with self._channels.semaphore:
@@ -330,11 +340,14 @@ class ChannelPool:
         channels = [*self.claimed_channels.values(), *self.client_channels.values()]
         tasks = [_throttle(getattr(ch, func_name)(*args)) for ch in channels]
         results = await asyncio.gather(*tasks, return_exceptions=True)
+        succeeded = True
         for channel, outcome in zip(channels, results):
             if isinstance(outcome, Exception):
                 channel.warning("'%s' stage failed: %s", func_name, str(outcome))
+                succeeded = False
                 continue
             channel.debug("'%s' stage succeeded", func_name)
+        return succeeded
 
     @callback
     def async_new_entity(
@@ -407,12 +407,16 @@ class ZHADevice(LogMixin):
             )
 
     async def async_initialize(self, from_cache=False):
-        """Initialize channels."""
+        """Initialize channels.
+
+        Return if all channels were initialized.
+        """
         self.debug("started initialization")
-        await self._channels.async_initialize(from_cache)
+        initialized = await self._channels.async_initialize(from_cache)
         self.debug("power source: %s", self.power_source)
         self.status = DeviceStatus.INITIALIZED
         self.debug("completed initialization")
+        return initialized
 
     @callback
     def async_cleanup_handles(self) -> None:
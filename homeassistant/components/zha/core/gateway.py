@@ -3,6 +3,7 @@ from __future__ import annotations
 
 import asyncio
 import collections
+import dataclasses
 from datetime import timedelta
 from enum import Enum
 import itertools
@@ -84,12 +85,19 @@ from .device import (
     ZHADevice,
 )
 from .group import GroupMember, ZHAGroup
+from .helpers import AdaptiveLimiter
 from .registries import GROUP_ENTITY_DOMAINS
 from .store import async_get_registry
 from .typing import ZhaGroupType, ZigpyEndpointType, ZigpyGroupType
 
 _LOGGER = logging.getLogger(__name__)
 
+# Mains powered devices refreshed concurrently from the network at startup
+REFRESH_INITIAL_CONCURRENCY = 2
+REFRESH_MAX_CONCURRENCY = 8
+# Average time to refresh a device above which the concurrency is lowered
+REFRESH_TARGET_LATENCY = 5
+
 EntityReference = collections.namedtuple(
     "EntityReference",
     "reference_id zha_device cluster_channels device_info remove_future",
@@ -105,6 +113,18 @@ class DevicePairingStatus(Enum):
     INITIALIZED = 4
 
 
+@dataclasses.dataclass
+class InitializationStatus:
+    """Progress of the initialization of the devices at startup."""
+
+    cached_devices: int = 0
+    cache_load_time: float | None = None
+    refresh_total: int = 0
+    refresh_done: int = 0
+    refresh_failed: int = 0
+    refresh_time: float | None = None
+
+
 class ZHAGateway:
     """Gateway that handles events that happen on the ZHA Zigbee network."""
 
@@ -129,6 +149,14 @@ class ZHAGateway:
         self._log_relay_handler = LogRelayHandler(hass, self)
         self._config_entry = config_entry
         self._unsubs = []
+        self.initialization_status = InitializationStatus()
+        self._refresh_limiter = AdaptiveLimiter(
+            REFRESH_INITIAL_CONCURRENCY,
+            1,
+            REFRESH_MAX_CONCURRENCY,
+            REFRESH_TARGET_LATENCY,
+        )
+        self._refresh_task = None
 
     async def async_initialize(self):
         """Initialize controller and connect radio."""
@@ -215,31 +243,70 @@ class ZHAGateway:
             discovery.GROUP_PROBE.discover_group_entities(zha_group)
 
     async def async_initialize_devices_and_entities(self) -> None:
-        """Initialize devices and load entities."""
-        semaphore = asyncio.Semaphore(2)
+        """Initialize devices and load entities.
 
-        async def _throttle(zha_device: zha_typing.ZhaDeviceType, cached: bool):
-            async with semaphore:
-                await zha_device.async_initialize(from_cache=cached)
+        All devices are restored from the zigpy cache so their entities can
+        be loaded right away. Mains powered devices are then refreshed from
+        the network in the background.
+        """
+        status = self.initialization_status
+        devices = list(self.devices.values())
+        start = time.monotonic()
 
-        _LOGGER.debug("Loading battery powered devices")
+        _LOGGER.debug("Loading devices from cache")
         await asyncio.gather(
-            *[
-                _throttle(dev, cached=True)
-                for dev in self.devices.values()
-                if not dev.is_mains_powered
-            ]
+            *(device.async_initialize(from_cache=True) for device in devices)
         )
+        status.cached_devices = len(devices)
+        status.cache_load_time = time.monotonic() - start
 
-        _LOGGER.debug("Loading mains powered devices")
-        await asyncio.gather(
-            *[
-                _throttle(dev, cached=False)
-                for dev in self.devices.values()
-                if dev.is_mains_powered
-            ]
+        mains_powered = [device for device in devices if device.is_mains_powered]
+        status.refresh_total = len(mains_powered)
+        self._refresh_task = self._hass.async_create_task(
+            self._async_refresh_devices(mains_powered)
+        )
+
+    async def _async_refresh_devices(self, devices) -> None:
+        """Refresh devices from the network, adapting to the radio latency."""
+        status = self.initialization_status
+        limiter = self._refresh_limiter
+        start = time.monotonic()
+
+        async def _refresh(zha_device: zha_typing.ZhaDeviceType) -> None:
+            await limiter.acquire()
+            device_start = time.monotonic()
+            succeeded = False
+            try:
+                succeeded = await zha_device.async_initialize(from_cache=False)
+            except Exception as err:  # pylint: disable=broad-except
+                zha_device.warning("Refreshing device failed: %s", err)
+            finally:
+                limiter.release(time.monotonic() - device_start, succeeded)
+            status.refresh_done += 1
+            if not succeeded:
+                status.refresh_failed += 1
+
+        _LOGGER.debug("Refreshing %d mains powered devices", len(devices))
+        await asyncio.gather(*(_refresh(device) for device in devices))
+        status.refresh_time = time.monotonic() - start
+        _LOGGER.debug(
+            "Refreshed %d mains powered devices in %.1f seconds, %d failed",
+            len(devices),
+            status.refresh_time,
+            status.refresh_failed,
         )
 
+    @property
+    def initialization_info(self):
+        """Return the progress and timing of the device initialization."""
+        return {
+            **dataclasses.asdict(self.initialization_status),
+            "refreshing": self._refresh_task is not None
+            and not self._refresh_task.done(),
+            "refresh_concurrency": self._refresh_limiter.limit,
+            "refresh_latency": self._refresh_limiter.latency,
+        }
+
     def device_joined(self, device):
         """Handle device joined.
 
@@ -666,6 +733,8 @@ class ZHAGateway:
     async def shutdown(self):
         """Stop ZHA Controller Application."""
         _LOGGER.debug("Shutting down ZHA ControllerApplication")
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
         for unsubscribe in self._unsubs:
             unsubscribe()
         await self.application_controller.pre_shutdown()
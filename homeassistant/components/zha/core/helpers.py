@@ -8,6 +8,7 @@ from __future__ import annotations
 
 import asyncio
 import binascii
+import collections
 from dataclasses import dataclass
 import functools
 import itertools
@@ -195,6 +196,69 @@ class LogMixin:
         return self.log(logging.ERROR, msg, *args)
 
 
+class AdaptiveLimiter:
+    """Limit concurrent requests, adapting the limit to the radio.
+
+    The limit is raised by one after every request that succeeded while the
+    average latency stayed below the target, lowered by one when the average
+    latency is above the target and halved when a request failed.
+    """
+
+    def __init__(
+        self,
+        initial: int,
+        minimum: int,
+        maximum: int,
+        target_latency: float,
+        smoothing: float = 0.2,
+    ) -> None:
+        """Initialize the limiter."""
+        self.limit = initial
+        self.minimum = minimum
+        self.maximum = maximum
+        self.target_latency = target_latency
+        self.latency: float | None = None
+        self._smoothing = smoothing
+        self._active = 0
+        self._waiters: collections.deque[asyncio.Future] = collections.deque()
+
+    async def acquire(self) -> None:
+        """Wait until a request can be made."""
+        while self._active >= self.limit:
+            waiter = asyncio.get_running_loop().create_future()
+            self._waiters.append(waiter)
+            try:
+                await waiter
+            finally:
+                if waiter in self._waiters:
+                    self._waiters.remove(waiter)
+        self._active += 1
+
+    @callback
+    def release(self, latency: float, success: bool) -> None:
+        """Record the outcome of a request and adapt the limit."""
+        self._active -= 1
+
+        if self.latency is None:
+            self.latency = latency
+        else:
+            self.latency += self._smoothing * (latency - self.latency)
+
+        if not success:
+            self.limit = max(self.minimum, self.limit // 2)
+        elif self.latency > self.target_latency:
+            self.limit = max(self.minimum, self.limit - 1)
+        else:
+            self.limit = min(self.maximum, self.limit + 1)
+
+        free = self.limit - self._active
+        while free > 0 and self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                free -= 1
+
+
 def retryable_req(
     delays=(1, 5, 10, 15, 30, 60, 120, 180, 360, 600, 900, 1800), raise_=False
 ):
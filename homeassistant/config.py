@@ -765,7 +765,7 @@ async def async_process_component_config(
     """
     domain = integration.domain
     try:
-        component = integration.get_component()
+        component = await integration.async_get_component()
     except LOAD_EXCEPTIONS as ex:
         _LOGGER.error("Unable to import %s: %s", domain, ex)
         return None
@@ -773,7 +773,7 @@ async def async_process_component_config(
     # Check if the integration has a custom config validator
     config_validator = None
     try:
-        config_validator = integration.get_platform("config")
+        config_validator = await integration.async_get_platform("config")
     except ImportError as err:
         # Filter out import error of the config platform.
         # If the config platform contains bad imports, make sure
@@ -844,7 +844,7 @@ async def async_process_component_config(
             continue
 
         try:
-            platform = p_integration.get_platform(domain)
+            platform = await p_integration.async_get_platform(domain)
         except LOAD_EXCEPTIONS:
             _LOGGER.exception("Platform error: %s", domain)
             continue
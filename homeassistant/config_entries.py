@@ -214,7 +214,7 @@ class ConfigEntry:
         self.supports_unload = await support_entry_unload(hass, self.domain)
 
         try:
-            component = integration.get_component()
+            component = await integration.async_get_component()
         except ImportError as err:
             _LOGGER.error(
                 "Error importing integration %s to set up %s configuration entry: %s",
@@ -228,7 +228,7 @@ class ConfigEntry:
 
         if self.domain == integration.domain:
             try:
-                integration.get_platform("config_flow")
+                await integration.async_get_platform("config_flow")
             except ImportError as err:
                 _LOGGER.error(
                     "Error importing platform config_flow from integration %s to set up %s configuration entry: %s",
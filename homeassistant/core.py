@@ -38,6 +38,7 @@ import yarl
 from homeassistant import block_async_io, loader, util
 from homeassistant.const import (
     ATTR_DOMAIN,
+    ATTR_ENTITY_ID,
     ATTR_FRIENDLY_NAME,
     ATTR_NOW,
     ATTR_SECONDS,
@@ -660,6 +661,10 @@ class EventBus:
     def __init__(self, hass: HomeAssistant) -> None:
         """Initialize a new event bus."""
         self._listeners: dict[str, list[tuple[HassJob, Callable | None]]] = {}
+        # Listeners indexed by event_type and the entity_id in the event data
+        self._entity_listeners: dict[
+            str, dict[str, list[tuple[HassJob, Callable | None]]]
+        ] = {}
         self._hass = hass
 
     @callback
@@ -668,7 +673,23 @@ class EventBus:
 
         This method must be run in the event loop.
         """
-        return {key: len(self._listeners[key]) for key in self._listeners}
+        listeners = {key: len(self._listeners[key]) for key in self._listeners}
+        for key, entity_listeners in self._entity_listeners.items():
+            listeners[key] = listeners.get(key, 0) + sum(
+                len(jobs) for jobs in entity_listeners.values()
+            )
+        return listeners
+
+    @callback
+    def async_entity_listeners(self, event_type: str) -> dict[str, int]:
+        """Return dictionary with entity ids and the number of listeners.
+
+        This method must be run in the event loop.
+        """
+        return {
+            entity_id: len(jobs)
+            for entity_id, jobs in self._entity_listeners.get(event_type, {}).items()
+        }
 
     @property
     def listeners(self) -> dict[str, int]:
@@ -707,6 +728,12 @@ class EventBus:
         if match_all_listeners is not None and event_type != EVENT_HOMEASSISTANT_CLOSE:
             listeners = match_all_listeners + listeners
 
+        entity_listeners = self._entity_listeners.get(event_type)
+        if entity_listeners is not None and event_data:
+            entity_id = event_data.get(ATTR_ENTITY_ID)
+            if isinstance(entity_id, str) and entity_id in entity_listeners:
+                listeners = listeners + entity_listeners[entity_id]
+
         event = Event(event_type, event_data, origin, time_fired, context)
 
         if event_type != EVENT_TIME_CHANGED:
@@ -765,6 +792,33 @@ class EventBus:
             event_type, (HassJob(listener), event_filter)
         )
 
+    @callback
+    def async_listen_entities(
+        self,
+        event_type: str,
+        entity_ids: Iterable[str],
+        listener: Callable,
+    ) -> CALLBACK_TYPE:
+        """Listen for events of a specific type about specific entities.
+
+        The listener only runs for events with one of the entity_ids as
+        entity_id in their data. Events are routed with a dict lookup, so
+        no event filter runs for the events of other entities.
+
+        This method must be run in the event loop.
+        """
+        filterable_job: tuple[HassJob, Callable | None] = (HassJob(listener), None)
+        entity_ids = list(entity_ids)
+        entity_listeners = self._entity_listeners.setdefault(event_type, {})
+        for entity_id in entity_ids:
+            entity_listeners.setdefault(entity_id, []).append(filterable_job)
+
+        def remove_listener() -> None:
+            """Remove the listener."""
+            self._async_remove_entity_listener(event_type, entity_ids, filterable_job)
+
+        return remove_listener
+
     @callback
     def _async_listen_filterable_job(
         self, event_type: str, filterable_job: tuple[HassJob, Callable | None]
@@ -849,6 +903,32 @@ class EventBus:
                 "Unable to remove unknown job listener %s", filterable_job
             )
 
+    @callback
+    def _async_remove_entity_listener(
+        self,
+        event_type: str,
+        entity_ids: Iterable[str],
+        filterable_job: tuple[HassJob, Callable | None],
+    ) -> None:
+        """Remove a listener of a specific event_type and entity ids.
+
+        This method must be run in the event loop.
+        """
+        try:
+            entity_listeners = self._entity_listeners[event_type]
+            for entity_id in entity_ids:
+                entity_listeners[entity_id].remove(filterable_job)
+                if not entity_listeners[entity_id]:
+                    entity_listeners.pop(entity_id)
+            if not entity_listeners:
+                self._entity_listeners.pop(event_type)
+        except (KeyError, ValueError):
+            # KeyError is key event_type or entity_id listener did not exist
+            # ValueError if listener did not exist within entity_id
+            _LOGGER.exception(
+                "Unable to remove unknown job listener %s", filterable_job
+            )
+
 
 class State:
     """Object to represent a state within the state machine.
@@ -1000,6 +1080,8 @@ class StateMachine:
     def __init__(self, bus: EventBus, loop: asyncio.events.AbstractEventLoop) -> None:
         """Initialize state machine."""
         self._states: dict[str, State] = {}
+        # The same states indexed by domain
+        self._domain_index: dict[str, dict[str, State]] = {}
         self._reservations: set[str] = set()
         self._bus = bus
         self._loop = loop
@@ -1023,12 +1105,12 @@ class StateMachine:
             return list(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), ()))
 
         return [
-            state.entity_id
-            for state in self._states.values()
-            if state.domain in domain_filter
+            entity_id
+            for domain in dict.fromkeys(domain.lower() for domain in domain_filter)
+            for entity_id in self._domain_index.get(domain, ())
         ]
 
     @callback
@@ -1043,10 +1125,11 @@ class StateMachine:
             return len(self._states)
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return len(self._domain_index.get(domain_filter.lower(), ()))
 
-        return len(
-            [None for state in self._states.values() if state.domain in domain_filter]
+        return sum(
+            len(self._domain_index.get(domain, ()))
+            for domain in dict.fromkeys(domain.lower() for domain in domain_filter)
         )
 
     def all(self, domain_filter: str | Iterable | None = None) -> list[State]:
@@ -1065,10 +1148,12 @@ class StateMachine:
             return list(self._states.values())
 
         if isinstance(domain_filter, str):
-            domain_filter = (domain_filter.lower(),)
+            return list(self._domain_index.get(domain_filter.lower(), {}).values())
 
         return [
-            state for state in self._states.values() if state.domain in domain_filter
+            state
+            for domain in dict.fromkeys(domain.lower() for domain in domain_filter)
+            for state in self._domain_index.get(domain, {}).values()
         ]
 
     def get(self, entity_id: str) -> State | None:
@@ -1112,6 +1197,11 @@ class StateMachine:
         if old_state is None:
             return False
 
+        domain_states = self._domain_index[old_state.domain]
+        del domain_states[entity_id]
+        if not domain_states:
+            del self._domain_index[old_state.domain]
+
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": None},
@@ -1217,6 +1307,7 @@ class StateMachine:
             old_state is None,
         )
         self._states[entity_id] = state
+        self._domain_index.setdefault(state.domain, {})[entity_id] = state
         self._bus.async_fire(
             EVENT_STATE_CHANGED,
             {"entity_id": entity_id, "old_state": old_state, "new_state": state},
@@ -49,6 +49,8 @@ class AreaRegistry:
         self.areas: MutableMapping[str, AreaEntry] = {}
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
         self._normalized_name_area_idx: dict[str, str] = {}
+        # Bumped whenever an area is added or removed
+        self.generation = 0
 
     @callback
     def async_get_area(self, area_id: str) -> AreaEntry | None:
@@ -89,6 +91,7 @@ class AreaRegistry:
         assert area.id is not None
         self.areas[area.id] = area
         self._normalized_name_area_idx[normalized_name] = area.id
+        self.generation += 1
         self.async_schedule_save()
         self.hass.bus.async_fire(
             EVENT_AREA_REGISTRY_UPDATED, {"action": "create", "area_id": area.id}
@@ -106,6 +109,7 @@ class AreaRegistry:
 
         del self.areas[area_id]
         del self._normalized_name_area_idx[area.normalized_name]
+        self.generation += 1
 
         self.hass.bus.async_fire(
             EVENT_AREA_REGISTRY_UPDATED, {"action": "remove", "area_id": area_id}
@@ -166,6 +170,7 @@ class AreaRegistry:
                 self._normalized_name_area_idx[normalized_name] = area["id"]
 
         self.areas = areas
+        self.generation += 1
 
     @callback
     def async_schedule_save(self) -> None:
@@ -138,11 +138,15 @@ class DeviceRegistry:
     devices: dict[str, DeviceEntry]
     deleted_devices: dict[str, DeletedDeviceEntry]
     _devices_index: dict[str, dict[str, dict[tuple[str, str], str]]]
+    _devices_by_area: dict[str, dict[str, DeviceEntry]]
+    _devices_by_config_entry: dict[str, dict[str, DeviceEntry]]
 
     def __init__(self, hass: HomeAssistantType) -> None:
         """Initialize the device registry."""
         self.hass = hass
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
+        # Bumped whenever a device is added or removed or its area changes
+        self.generation = 0
         self._clear_index()
 
     @callback
@@ -203,6 +207,8 @@ class DeviceRegistry:
         else:
             devices_index = self._devices_index[REGISTERED_DEVICE]
             self.devices[device.id] = device
+            self._add_device_to_secondary_indexes(device)
+            self.generation += 1
 
         _add_device_to_index(devices_index, device)
 
@@ -214,6 +220,8 @@ class DeviceRegistry:
         else:
             devices_index = self._devices_index[REGISTERED_DEVICE]
             self.devices.pop(device.id)
+            self._remove_device_from_secondary_indexes(device)
+            self.generation += 1
 
         _remove_device_from_index(devices_index, device)
 
@@ -224,6 +232,35 @@ class DeviceRegistry:
         devices_index = self._devices_index[REGISTERED_DEVICE]
         _remove_device_from_index(devices_index, old_device)
         _add_device_to_index(devices_index, new_device)
+        self._remove_device_from_secondary_indexes(old_device)
+        self._add_device_to_secondary_indexes(new_device)
+        if old_device.area_id != new_device.area_id:
+            self.generation += 1
+
+    def _secondary_indexes(
+        self, device: DeviceEntry
+    ) -> list[tuple[dict[str, dict[str, DeviceEntry]], str]]:
+        """Return the indexes by area and config entry to store a device in."""
+        indexes = [
+            (self._devices_by_config_entry, config_entry_id)
+            for config_entry_id in device.config_entries
+        ]
+        if device.area_id is not None:
+            indexes.append((self._devices_by_area, device.area_id))
+        return indexes
+
+    def _add_device_to_secondary_indexes(self, device: DeviceEntry) -> None:
+        """Add a device to the indexes by area and config entry."""
+        for index, key in self._secondary_indexes(device):
+            index.setdefault(key, {})[device.id] = device
+
+    def _remove_device_from_secondary_indexes(self, device: DeviceEntry) -> None:
+        """Remove a device from the indexes by area and config entry."""
+        for index, key in self._secondary_indexes(device):
+            devices = index[key]
+            del devices[device.id]
+            if not devices:
+                del index[key]
 
     def _clear_index(self) -> None:
         """Clear the index."""
@@ -231,14 +268,18 @@ class DeviceRegistry:
             REGISTERED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
             DELETED_DEVICE: {IDX_IDENTIFIERS: {}, IDX_CONNECTIONS: {}},
         }
+        self._devices_by_area = {}
+        self._devices_by_config_entry = {}
 
     def _rebuild_index(self) -> None:
         """Create the index after loading devices."""
         self._clear_index()
         for device in self.devices.values():
             _add_device_to_index(self._devices_index[REGISTERED_DEVICE], device)
+            self._add_device_to_secondary_indexes(device)
         for deleted_device in self.deleted_devices.values():
             _add_device_to_index(self._devices_index[DELETED_DEVICE], deleted_device)
+        self.generation += 1
 
     @callback
     def async_get_or_create(
@@ -611,9 +652,8 @@ class DeviceRegistry:
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for dev_id, device in self.devices.items():
-            if area_id == device.area_id:
-                self._async_update_device(dev_id, area_id=None)
+        for dev_id in list(self._devices_by_area.get(area_id, {})):
+            self._async_update_device(dev_id, area_id=None)
 
 
 @callback
@@ -641,7 +681,8 @@ async def async_get_registry(hass: HomeAssistantType) -> DeviceRegistry:
 @callback
 def async_entries_for_area(registry: DeviceRegistry, area_id: str) -> list[DeviceEntry]:
     """Return entries that match an area."""
-    return [device for device in registry.devices.values() if device.area_id == area_id]
+    # pylint: disable=protected-access
+    return list(registry._devices_by_area.get(area_id, {}).values())
 
 
 @callback
@@ -649,11 +690,8 @@ def async_entries_for_config_entry(
     registry: DeviceRegistry, config_entry_id: str
 ) -> list[DeviceEntry]:
     """Return entries that match a config entry."""
-    return [
-        device
-        for device in registry.devices.values()
-        if config_entry_id in device.config_entries
-    ]
+    # pylint: disable=protected-access
+    return list(registry._devices_by_config_entry.get(config_entry_id, {}).values())
 
 
 @callback
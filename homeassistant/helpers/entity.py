@@ -26,7 +26,7 @@ from homeassistant.const import (
     TEMP_CELSIUS,
     TEMP_FAHRENHEIT,
 )
-from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, callback
+from homeassistant.core import CALLBACK_TYPE, Context, HomeAssistant, State, callback
 from homeassistant.exceptions import HomeAssistantError, NoEntitySpecifiedError
 from homeassistant.helpers.entity_platform import EntityPlatform
 from homeassistant.helpers.entity_registry import RegistryEntry
@@ -127,6 +127,13 @@ class Entity(ABC):
     # If entity is added to an entity platform
     _added = False
 
+    # State, attributes and config of the last write to the state machine
+    _last_write: tuple[str, dict[str, Any], Any, Any] | None = None
+    # State object of the last write to the state machine
+    _last_written_state: State | None = None
+    # Number of writes skipped because nothing changed since the last write
+    writes_skipped = 0
+
     @property
     def should_poll(self) -> bool:
         """Return True if entity has to be polled for state.
@@ -395,9 +402,25 @@ class Entity(ABC):
                 extra,
             )
 
+        # Skip the write if nothing changed since the last write and the
+        # state machine still holds the state that was written.
+        customize = self.hass.data.get(DATA_CUSTOMIZE)
+        write = (state, attr, customize, self.hass.config.units)
+        if (
+            not self.force_update
+            and write == self._last_write
+            and self.hass.states.get(self.entity_id) is self._last_written_state
+        ):
+            self.writes_skipped += 1
+            if self.platform:
+                self.platform.writes_skipped += 1
+            return
+        self._last_write = write
+        attr = dict(attr)
+
         # Overwrite properties that have been set in the config file.
-        if DATA_CUSTOMIZE in self.hass.data:
-            attr.update(self.hass.data[DATA_CUSTOMIZE].get(self.entity_id))
+        if customize is not None:
+            attr.update(customize.get(self.entity_id))
 
         # Convert temperature if we detect one
         try:
@@ -425,6 +448,7 @@ class Entity(ABC):
         self.hass.states.async_set(
             self.entity_id, state, attr, self.force_update, self._context
         )
+        self._last_written_state = self.hass.states.get(self.entity_id)
 
     def schedule_update_ha_state(self, force_refresh: bool = False) -> None:
         """Schedule an update ha state change task.
@@ -4,6 +4,7 @@ from __future__ import annotations
 import asyncio
 from contextvars import ContextVar
 from datetime import datetime, timedelta
+from functools import partial
 from logging import Logger
 from types import ModuleType
 from typing import TYPE_CHECKING, Callable, Coroutine, Iterable
@@ -36,8 +37,14 @@ SLOW_ADD_MIN_TIMEOUT = 500
 
 PLATFORM_NOT_READY_RETRIES = 10
 DATA_ENTITY_PLATFORM = "entity_platform"
+DATA_POLLING_PLATFORMS = "entity_platform_polling"
 PLATFORM_NOT_READY_BASE_WAIT_TIME = 30  # seconds
 
+# Entities of a platform that are polled at the same time
+POLLING_SHARD_SIZE = 10
+# Fractional part of the golden ratio, spreads platform poll offsets evenly
+POLLING_OFFSET_STEP = 0.6180339887498949
+
 
 class EntityPlatform:
     """Manage the entities for a single platform."""
@@ -68,9 +75,22 @@ class EntityPlatform:
         self._setup_complete = False
         # Method to cancel the state change listener
         self._async_unsub_polling: CALLBACK_TYPE | None = None
+        # Methods to cancel the delayed polls of shards of the entities
+        self._async_unsub_poll_shards: list[CALLBACK_TYPE] = []
+        # Polling slot taken among the platforms sharing the scan interval
+        self._polling_index: int | None = None
+        # If skipped polls were already logged in the current polling round
+        self._skipped_polls_logged = False
+        # Entities with a poll in progress
+        self._polls_in_progress: set[str] = set()
+        # Duration of the last poll of each entity in seconds
+        self.poll_latency: dict[str, float] = {}
+        # Number of polls skipped because the previous poll was still running
+        self.skipped_polls: dict[str, int] = {}
+        # Number of state writes of the entities skipped because nothing changed
+        self.writes_skipped = 0
         # Method to cancel the retry of setup
         self._async_cancel_retry_setup: CALLBACK_TYPE | None = None
-        self._process_updates: asyncio.Lock | None = None
 
         self.parallel_updates: asyncio.Semaphore | None = None
 
@@ -335,12 +355,55 @@ class EntityPlatform:
         ):
             return
 
-        self._async_unsub_polling = async_track_time_interval(
-            self.hass,
-            self._update_entity_states,
-            self.scan_interval,
+        self._async_start_polling()
+
+    @callback
+    def _async_start_polling(self) -> None:
+        """Start polling the entities of the platform.
+
+        Platforms sharing a scan interval start polling at offsets spread
+        over the interval so they don't all poll at the same time.
+        """
+        polling_platforms = self.hass.data.setdefault(DATA_POLLING_PLATFORMS, {})
+        taken = polling_platforms.setdefault(self.scan_interval, set())
+        index = 0
+        while index in taken:
+            index += 1
+        taken.add(index)
+        self._polling_index = index
+        offset = self.scan_interval.total_seconds() * (
+            1 - (index * POLLING_OFFSET_STEP) % 1
+        )
+
+        @callback
+        def async_start_interval(now: datetime) -> None:
+            """Poll for the first time and then every scan interval."""
+            self._async_unsub_polling = async_track_time_interval(
+                self.hass, self._update_entity_states, self.scan_interval
+            )
+            self.hass.async_create_task(self._update_entity_states(now))
+
+        self._async_unsub_polling = async_call_later(
+            self.hass, offset, async_start_interval
         )
 
+    @callback
+    def _async_stop_polling(self) -> None:
+        """Stop polling the entities of the platform."""
+        if self._async_unsub_polling is not None:
+            self._async_unsub_polling()
+            self._async_unsub_polling = None
+
+        for unsub in self._async_unsub_poll_shards:
+            unsub()
+        self._async_unsub_poll_shards = []
+
+        if self._polling_index is not None:
+            self.hass.data[DATA_POLLING_PLATFORMS][self.scan_interval].discard(
+                self._polling_index
+            )
+            self._polling_index = None
+
     async def _async_add_entity(  # type: ignore[no-untyped-def]
         self, entity, update_before_add, entity_registry, device_registry
     ):
@@ -504,7 +567,14 @@ class EntityPlatform:
             # has a chance to finish.
             self.hass.states.async_reserve(entity.entity_id)
 
-        entity.async_on_remove(lambda: self.entities.pop(entity_id))
+        @callback
+        def remove_entity_cb() -> None:
+            """Remove entity from entities list and polling statistics."""
+            self.entities.pop(entity_id)
+            self.poll_latency.pop(entity_id, None)
+            self.skipped_polls.pop(entity_id, None)
+
+        entity.async_on_remove(remove_entity_cb)
 
         await entity.add_to_platform_finish()
 
@@ -524,9 +594,7 @@ class EntityPlatform:
 
         await asyncio.gather(*tasks)
 
-        if self._async_unsub_polling is not None:
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+        self._async_stop_polling()
         self._setup_complete = False
 
     async def async_destroy(self) -> None:
@@ -545,8 +613,7 @@ class EntityPlatform:
         if self._async_unsub_polling is not None and not any(
             entity.should_poll for entity in self.entities.values()
         ):
-            self._async_unsub_polling()
-            self._async_unsub_polling = None
+            self._async_stop_polling()
 
     async def async_extract_from_service(
         self, service_call: ServiceCall, expand_group: bool = True
@@ -594,31 +661,78 @@ class EntityPlatform:
     async def _update_entity_states(self, now: datetime) -> None:
         """Update the states of all the polling entities.
 
-        To protect from flooding the executor, we will update async entities
-        in parallel and other entities sequential.
+        To protect from flooding the executor, the entities are split in
+        shards of POLLING_SHARD_SIZE entities that are polled at offsets
+        spread over the scan interval. Async entities are updated in
+        parallel and other entities sequentially, unless the platform sets
+        PARALLEL_UPDATES.
 
         This method must be run in the event loop.
         """
-        if self._process_updates is None:
-            self._process_updates = asyncio.Lock()
-        if self._process_updates.locked():
+        entities = [entity for entity in self.entities.values() if entity.should_poll]
+        if not entities:
+            return
+
+        shards = [
+            entities[index : index + POLLING_SHARD_SIZE]
+            for index in range(0, len(entities), POLLING_SHARD_SIZE)
+        ]
+        shard_delay = self.scan_interval.total_seconds() / len(shards)
+
+        self._skipped_polls_logged = False
+        # Shards of the previous round have been polled by now
+        self._async_unsub_poll_shards = [
+            async_call_later(
+                self.hass,
+                shard_delay * index,
+                partial(self._async_poll_entities, shard),
+            )
+            for index, shard in enumerate(shards[1:], 1)
+        ]
+
+        await self._async_poll_entities(shards[0])
+
+    async def _async_poll_entities(
+        self, entities: list[Entity], _now: datetime | None = None
+    ) -> None:
+        """Poll entities, skipping the ones still updating from the last poll."""
+        tasks = []
+        skipped = []
+        for entity in entities:
+            entity_id = entity.entity_id
+            # Entity was removed after the shard was scheduled
+            if self.entities.get(entity_id) is not entity:
+                continue
+            if entity_id in self._polls_in_progress:
+                self.skipped_polls[entity_id] = self.skipped_polls.get(entity_id, 0) + 1
+                skipped.append(entity_id)
+                continue
+            tasks.append(self._async_poll_entity(entity))
+
+        if skipped and not self._skipped_polls_logged:
+            self._skipped_polls_logged = True
             self.logger.warning(
-                "Updating %s %s took longer than the scheduled update interval %s",
+                "Updating %s %s took longer than the scheduled update interval %s, "
+                "skipping the update of %s",
                 self.platform_name,
                 self.domain,
                 self.scan_interval,
+                ", ".join(skipped),
             )
-            return
 
-        async with self._process_updates:
-            tasks = []
-            for entity in self.entities.values():
-                if not entity.should_poll:
-                    continue
-                tasks.append(entity.async_update_ha_state(True))
+        if tasks:
+            await asyncio.gather(*tasks)
 
-            if tasks:
-                await asyncio.gather(*tasks)
+    async def _async_poll_entity(self, entity: Entity) -> None:
+        """Poll an entity and record how long it took."""
+        entity_id = entity.entity_id
+        self._polls_in_progress.add(entity_id)
+        start = self.hass.loop.time()
+        try:
+            await entity.async_update_ha_state(True)
+        finally:
+            self._polls_in_progress.discard(entity_id)
+            self.poll_latency[entity_id] = self.hass.loop.time() - start
 
 
 current_platform: ContextVar[EntityPlatform | None] = ContextVar(
@@ -144,6 +144,12 @@ class EntityRegistry:
         self.hass = hass
         self.entities: dict[str, RegistryEntry]
         self._index: dict[tuple[str, str, str], str] = {}
+        self._entities_by_device: dict[str, dict[str, RegistryEntry]] = {}
+        self._entities_by_area: dict[str, dict[str, RegistryEntry]] = {}
+        self._entities_by_config_entry: dict[str, dict[str, RegistryEntry]] = {}
+        # Bumped whenever an entry is added or removed or its entity,
+        # device or area id changes
+        self.generation = 0
         self._store = hass.helpers.storage.Store(STORAGE_VERSION, STORAGE_KEY)
         self.hass.bus.async_listen(
             EVENT_DEVICE_REGISTRY_UPDATED, self.async_device_modified
@@ -287,6 +293,7 @@ class EntityRegistry:
             original_icon=original_icon,
         )
         self._register_entry(entity)
+        self.generation += 1
         _LOGGER.info("Registered new %s.%s entity: %s", domain, platform, entity_id)
         self.async_schedule_save()
 
@@ -300,6 +307,7 @@ class EntityRegistry:
     def async_remove(self, entity_id: str) -> None:
         """Remove an entity from registry."""
         self._unregister_entry(self.entities[entity_id])
+        self.generation += 1
         self.hass.bus.async_fire(
             EVENT_ENTITY_REGISTRY_UPDATED, {"action": "remove", "entity_id": entity_id}
         )
@@ -448,6 +456,8 @@ class EntityRegistry:
         self._remove_index(old)
         new = attr.evolve(old, **new_values)
         self._register_entry(new)
+        if not {"entity_id", "device_id", "area_id"}.isdisjoint(new_values):
+            self.generation += 1
 
         self.async_schedule_save()
 
@@ -537,19 +547,14 @@ class EntityRegistry:
     @callback
     def async_clear_config_entry(self, config_entry: str) -> None:
         """Clear config entry from registry entries."""
-        for entity_id in [
-            entity_id
-            for entity_id, entry in self.entities.items()
-            if config_entry == entry.config_entry_id
-        ]:
+        for entity_id in list(self._entities_by_config_entry.get(config_entry, {})):
             self.async_remove(entity_id)
 
     @callback
     def async_clear_area_id(self, area_id: str) -> None:
         """Clear area id from registry entries."""
-        for entity_id, entry in self.entities.items():
-            if area_id == entry.area_id:
-                self._async_update_entity(entity_id, area_id=None)
+        for entity_id in list(self._entities_by_area.get(area_id, {})):
+            self._async_update_entity(entity_id, area_id=None)
 
     def _register_entry(self, entry: RegistryEntry) -> None:
         self.entities[entry.entity_id] = entry
@@ -557,6 +562,8 @@ class EntityRegistry:
 
     def _add_index(self, entry: RegistryEntry) -> None:
         self._index[(entry.domain, entry.platform, entry.unique_id)] = entry.entity_id
+        for index, key in self._secondary_indexes(entry):
+            index.setdefault(key, {})[entry.entity_id] = entry
 
     def _unregister_entry(self, entry: RegistryEntry) -> None:
         self._remove_index(entry)
@@ -564,11 +571,34 @@ class EntityRegistry:
 
     def _remove_index(self, entry: RegistryEntry) -> None:
         del self._index[(entry.domain, entry.platform, entry.unique_id)]
+        for index, key in self._secondary_indexes(entry):
+            entries = index[key]
+            del entries[entry.entity_id]
+            if not entries:
+                del index[key]
+
+    def _secondary_indexes(
+        self, entry: RegistryEntry
+    ) -> list[tuple[dict[str, dict[str, RegistryEntry]], str]]:
+        """Return the indexes by device, area and config entry to store entry in."""
+        return [
+            (index, key)
+            for index, key in (
+                (self._entities_by_device, entry.device_id),
+                (self._entities_by_area, entry.area_id),
+                (self._entities_by_config_entry, entry.config_entry_id),
+            )
+            if key is not None
+        ]
 
     def _rebuild_index(self) -> None:
         self._index = {}
+        self._entities_by_device = {}
+        self._entities_by_area = {}
+        self._entities_by_config_entry = {}
         for entry in self.entities.values():
             self._add_index(entry)
+        self.generation += 1
 
 
 @callback
@@ -598,11 +628,12 @@ def async_entries_for_device(
     registry: EntityRegistry, device_id: str, include_disabled_entities: bool = False
 ) -> list[RegistryEntry]:
     """Return entries that match a device."""
+    # pylint: disable=protected-access
+    entries = registry._entities_by_device.get(device_id, {})
     return [
         entry
-        for entry in registry.entities.values()
-        if entry.device_id == device_id
-        and (not entry.disabled_by or include_disabled_entities)
+        for entry in entries.values()
+        if not entry.disabled_by or include_disabled_entities
     ]
 
 
@@ -611,7 +642,8 @@ def async_entries_for_area(
     registry: EntityRegistry, area_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match an area."""
-    return [entry for entry in registry.entities.values() if entry.area_id == area_id]
+    # pylint: disable=protected-access
+    return list(registry._entities_by_area.get(area_id, {}).values())
 
 
 @callback
@@ -619,11 +651,8 @@ def async_entries_for_config_entry(
     registry: EntityRegistry, config_entry_id: str
 ) -> list[RegistryEntry]:
     """Return entries that match a config entry."""
-    return [
-        entry
-        for entry in registry.entities.values()
-        if entry.config_entry_id == config_entry_id
-    ]
+    # pylint: disable=protected-access
+    return list(registry._entities_by_config_entry.get(config_entry_id, {}).values())
 
 
 @callback
@@ -8,7 +8,7 @@ from datetime import datetime, timedelta
 import functools as ft
 import logging
 import time
-from typing import Any, Awaitable, Callable, Iterable, List
+from typing import Any, Awaitable, Callable, Iterable, List, Tuple
 
 import attr
 
@@ -53,10 +53,18 @@ TRACK_STATE_REMOVED_DOMAIN_LISTENER = "track_state_removed_domain_listener"
 TRACK_ENTITY_REGISTRY_UPDATED_CALLBACKS = "track_entity_registry_updated_callbacks"
 TRACK_ENTITY_REGISTRY_UPDATED_LISTENER = "track_entity_registry_updated_listener"
 
+TRACK_TEMPLATE_RENDER_INDEX = "track_template_render_index"
+
 _ALL_LISTENER = "all"
 _DOMAINS_LISTENER = "domains"
 _ENTITIES_LISTENER = "entities"
 
+_ROUTE_ALL = ("all", "")
+_ROUTE_ALL_LIFECYCLE = ("all_lifecycle", "")
+_ROUTE_DOMAIN = "domain"
+_ROUTE_DOMAIN_LIFECYCLE = "domain_lifecycle"
+_ROUTE_ENTITY = "entity"
+
 _LOGGER = logging.getLogger(__name__)
 
 
@@ -242,59 +250,51 @@ def async_track_state_change_event(
     In order to avoid having to iterate a long list
     of EVENT_STATE_CHANGED and fire and create a job
     for each one, we keep a dict of entity ids that
-    care about the state change events so we can
-    do a fast dict lookup to route events.
+    care about the state change events and listen on
+    the event bus by entity_id so events are routed
+    with a dict lookup without calling any filter.
     """
     entity_ids = _async_string_to_lower_list(entity_ids)
     if not entity_ids:
         return _remove_empty_listener
 
     entity_callbacks = hass.data.setdefault(TRACK_STATE_CHANGE_CALLBACKS, {})
+    entity_listeners = hass.data.setdefault(TRACK_STATE_CHANGE_LISTENER, {})
 
-    if TRACK_STATE_CHANGE_LISTENER not in hass.data:
-
-        @callback
-        def _async_state_change_filter(event: Event) -> bool:
-            """Filter state changes by entity_id."""
-            return event.data.get("entity_id") in entity_callbacks
-
-        @callback
-        def _async_state_change_dispatcher(event: Event) -> None:
-            """Dispatch state changes by entity_id."""
-            entity_id = event.data.get("entity_id")
-
-            if entity_id not in entity_callbacks:
-                return
+    @callback
+    def _async_state_change_dispatcher(event: Event) -> None:
+        """Dispatch state changes by entity_id."""
+        entity_id = event.data.get("entity_id")
 
-            for job in entity_callbacks[entity_id][:]:
-                try:
-                    hass.async_run_hass_job(job, event)
-                except Exception:  # pylint: disable=broad-except
-                    _LOGGER.exception(
-                        "Error while processing state change for %s", entity_id
-                    )
+        if entity_id not in entity_callbacks:
+            return
 
-        hass.data[TRACK_STATE_CHANGE_LISTENER] = hass.bus.async_listen(
-            EVENT_STATE_CHANGED,
-            _async_state_change_dispatcher,
-            event_filter=_async_state_change_filter,
-        )
+        for job in entity_callbacks[entity_id][:]:
+            try:
+                hass.async_run_hass_job(job, event)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while processing state change for %s", entity_id
+                )
 
     job = HassJob(action)
 
     for entity_id in entity_ids:
+        if entity_id not in entity_callbacks:
+            entity_listeners[entity_id] = hass.bus.async_listen_entities(
+                EVENT_STATE_CHANGED, (entity_id,), _async_state_change_dispatcher
+            )
         entity_callbacks.setdefault(entity_id, []).append(job)
 
     @callback
     def remove_listener() -> None:
         """Remove state change listener."""
-        _async_remove_indexed_listeners(
-            hass,
-            TRACK_STATE_CHANGE_CALLBACKS,
-            TRACK_STATE_CHANGE_LISTENER,
-            entity_ids,
-            job,
-        )
+        for entity_id in entity_ids:
+            callbacks = entity_callbacks[entity_id]
+            callbacks.remove(job)
+            if not callbacks:
+                del entity_callbacks[entity_id]
+                entity_listeners.pop(entity_id)()
 
     return remove_listener
 
@@ -766,6 +766,126 @@ def async_track_template(
 track_template = threaded_listener_factory(async_track_template)
 
 
+class _TemplateRenderIndex:
+    """Route state changes to the templates that depend on them.
+
+    The templates of all trackers are indexed by the entity ids and
+    domains their last render depended on, so a state change only
+    reaches the affected templates instead of every tracker testing
+    the filter of each of its templates.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the index."""
+        self.hass = hass
+        self._routes: dict[tuple[str, str], dict[_TemplateKey, None]] = {}
+        self._template_routes: dict[_TemplateKey, list[tuple[str, str]]] = {}
+        self._trackers: dict[_TrackTemplateResultInfo, int] = {}
+        self._unsub: Callable[[], None] | None = None
+
+    @callback
+    def async_update(
+        self, tracker: _TrackTemplateResultInfo, template: Template, info: RenderInfo
+    ) -> None:
+        """Index a template by the states its render depends on."""
+        key = (tracker, template)
+
+        # Renders that failed do not know which states they depend on
+        if info.exception or info.all_states:
+            routes = [_ROUTE_ALL]
+        else:
+            routes = [(_ROUTE_ENTITY, entity_id) for entity_id in info.entities]
+            routes.extend((_ROUTE_DOMAIN, domain) for domain in info.domains)
+            if info.all_states_lifecycle:
+                routes.append(_ROUTE_ALL_LIFECYCLE)
+            else:
+                routes.extend(
+                    (_ROUTE_DOMAIN_LIFECYCLE, domain)
+                    for domain in info.domains_lifecycle
+                )
+
+        old_routes = self._template_routes.get(key)
+        if old_routes is None:
+            self._trackers[tracker] = self._trackers.get(tracker, 0) + 1
+        elif old_routes == routes:
+            return
+        else:
+            self._async_remove_routes(key)
+        self._template_routes[key] = routes
+        for route in routes:
+            self._routes.setdefault(route, {})[key] = None
+
+        if self._unsub is None:
+            self._unsub = self.hass.bus.async_listen(
+                EVENT_STATE_CHANGED, self._async_state_changed
+            )
+
+    @callback
+    def async_remove(
+        self, tracker: _TrackTemplateResultInfo, template: Template
+    ) -> None:
+        """Remove a template from the index."""
+        key = (tracker, template)
+        if key not in self._template_routes:
+            return
+
+        self._async_remove_routes(key)
+        del self._template_routes[key]
+        self._trackers[tracker] -= 1
+        if not self._trackers[tracker]:
+            del self._trackers[tracker]
+
+        if not self._template_routes and self._unsub is not None:
+            self._unsub()
+            self._unsub = None
+
+    @callback
+    def _async_remove_routes(self, key: _TemplateKey) -> None:
+        """Remove the routes of a template."""
+        for route in self._template_routes.get(key, ()):
+            templates = self._routes[route]
+            del templates[key]
+            if not templates:
+                del self._routes[route]
+
+    @callback
+    def _async_state_changed(self, event: Event) -> None:
+        """Refresh the templates depending on a state change."""
+        entity_id = event.data[ATTR_ENTITY_ID]
+        domain = split_entity_id(entity_id)[0]
+        routes = [_ROUTE_ALL, (_ROUTE_ENTITY, entity_id), (_ROUTE_DOMAIN, domain)]
+        if event.data.get("new_state") is None or event.data.get("old_state") is None:
+            routes.extend((_ROUTE_ALL_LIFECYCLE, (_ROUTE_DOMAIN_LIFECYCLE, domain)))
+
+        affected: dict[_TrackTemplateResultInfo, dict[Template, None]] = {}
+        for route in routes:
+            for tracker, template in self._routes.get(route, ()):
+                affected.setdefault(tracker, {})[template] = None
+
+        for tracker, templates in affected.items():
+            # An earlier refresh may have removed the tracker
+            if tracker not in self._trackers:
+                continue
+            try:
+                tracker.async_refresh_templates(event, templates)
+            except Exception:  # pylint: disable=broad-except
+                _LOGGER.exception(
+                    "Error while processing state change for %s", entity_id
+                )
+
+
+_TemplateKey = Tuple["_TrackTemplateResultInfo", Template]
+
+
+@callback
+def _async_template_render_index(hass: HomeAssistant) -> _TemplateRenderIndex:
+    """Return the template render index."""
+    index: _TemplateRenderIndex | None = hass.data.get(TRACK_TEMPLATE_RENDER_INDEX)
+    if index is None:
+        index = hass.data[TRACK_TEMPLATE_RENDER_INDEX] = _TemplateRenderIndex(hass)
+    return index
+
+
 class _TrackTemplateResultInfo:
     """Handle removal / refresh of tracker."""
 
@@ -787,7 +907,7 @@ class _TrackTemplateResultInfo:
 
         self._rate_limit = KeyedRateLimit(hass)
         self._info: dict[Template, RenderInfo] = {}
-        self._track_state_changes: _TrackStateChangeFiltered | None = None
+        self._index = _async_template_render_index(hass)
         self._time_listeners: dict[Template, Callable] = {}
 
     def async_setup(self, raise_on_template_error: bool) -> None:
@@ -806,9 +926,8 @@ class _TrackTemplateResultInfo:
                     exc_info=info.exception,
                 )
 
-        self._track_state_changes = async_track_state_change_filtered(
-            self.hass, _render_infos_to_track_states(self._info.values()), self._refresh
-        )
+        for template, info in self._info.items():
+            self._index.async_update(self, template, info)
         self._update_time_listeners()
         _LOGGER.debug(
             "Template group %s listens for %s",
@@ -819,9 +938,18 @@ class _TrackTemplateResultInfo:
     @property
     def listeners(self) -> dict:
         """State changes that will cause a re-render."""
-        assert self._track_state_changes
+        track_states = _render_infos_to_track_states(
+            [
+                _suppress_domain_all_in_render_info(info)
+                if self._rate_limit.async_has_timer(template)
+                else info
+                for template, info in self._info.items()
+            ]
+        )
         return {
-            **self._track_state_changes.listeners,
+            _ALL_LISTENER: track_states.all_states,
+            _ENTITIES_LISTENER: track_states.entities,
+            _DOMAINS_LISTENER: track_states.domains,
             "time": bool(self._time_listeners),
         }
 
@@ -858,8 +986,8 @@ class _TrackTemplateResultInfo:
     @callback
     def async_remove(self) -> None:
         """Cancel the listener."""
-        assert self._track_state_changes
-        self._track_state_changes.async_remove()
+        for template in self._info:
+            self._index.async_remove(self, template)
         self._rate_limit.async_remove()
         for template in list(self._time_listeners):
             self._time_listeners.pop(template)()
@@ -869,6 +997,20 @@ class _TrackTemplateResultInfo:
         """Force recalculate the template."""
         self._refresh(None)
 
+    @callback
+    def async_refresh_templates(
+        self, event: Event, templates: Iterable[Template]
+    ) -> None:
+        """Refresh the templates the index routed a state change to."""
+        track_templates = [
+            track_template_
+            for track_template_ in self._track_templates
+            if track_template_.template in templates
+        ]
+        # An empty list would make _refresh render every template
+        if track_templates:
+            self._refresh(event, track_templates=track_templates)
+
     def _render_template_if_ready(
         self,
         track_template_: TrackTemplate,
@@ -962,25 +1104,23 @@ class _TrackTemplateResultInfo:
                 continue
 
             template = track_template_.template
-            self._setup_time_listener(template, self._info[template].has_time)
+            info = self._info[template]
+            self._setup_time_listener(template, info.has_time)
+            # Domains and all states are not routed while rate limited
+            self._index.async_update(
+                self,
+                template,
+                _suppress_domain_all_in_render_info(info)
+                if self._rate_limit.async_has_timer(template)
+                else info,
+            )
 
             info_changed = True
 
             if isinstance(update, TrackTemplateResult):
                 updates.append(update)
 
-        if info_changed:
-            assert self._track_state_changes
-            self._track_state_changes.async_update_listeners(
-                _render_infos_to_track_states(
-                    [
-                        _suppress_domain_all_in_render_info(self._info[template])
-                        if self._rate_limit.async_has_timer(template)
-                        else self._info[template]
-                        for template in self._info
-                    ]
-                )
-            )
+        if info_changed and _LOGGER.isEnabledFor(logging.DEBUG):
             _LOGGER.debug(
                 "Template group %s listens for %s",
                 self._track_templates,
@@ -0,0 +1,113 @@
+"""Helper to cache data parsed from files between restarts."""
+from __future__ import annotations
+
+import os
+from typing import Any, Callable, TypeVar, cast
+
+from homeassistant.const import __version__
+from homeassistant.core import HomeAssistant, callback
+
+from . import singleton, storage
+
+DATA_FILE_CACHE = "file_cache"
+STORAGE_KEY = "core.file_cache"
+STORAGE_VERSION = 1
+SAVE_DELAY = 10
+
+_T = TypeVar("_T")
+
+
+class FileCache:
+    """Cache of data parsed from files, persisted in .storage.
+
+    Entries are keyed by the path of the file and are only used while the
+    file keeps the modification time and size it had when it was parsed.
+    Entries of files that no longer exist are dropped when the cache is
+    loaded. All entries are dropped when Home Assistant is updated.
+    """
+
+    def __init__(
+        self, hass: HomeAssistant, store: storage.Store, entries: dict[str, Any]
+    ) -> None:
+        """Initialize the file cache."""
+        self.hass = hass
+        self._store = store
+        self._entries = entries
+
+    def load(self, path: str, parse: Callable[[str], _T]) -> _T:
+        """Return the parsed data of a file, parsing it if it changed.
+
+        The returned data is shared and should not be mutated.
+        Must be called from the executor.
+        """
+        try:
+            stat = os.stat(path)
+        except OSError:
+            # Let the parser deal with missing files
+            return parse(path)
+
+        entry = self._entries.get(path)
+        if (
+            entry is not None
+            and entry["mtime"] == stat.st_mtime
+            and entry["size"] == stat.st_size
+        ):
+            return cast(_T, entry["data"])
+
+        data = parse(path)
+        self.hass.loop.call_soon_threadsafe(
+            self._async_set,
+            path,
+            {"mtime": stat.st_mtime, "size": stat.st_size, "data": data},
+        )
+        return data
+
+    @callback
+    def _async_set(self, path: str, entry: dict[str, Any]) -> None:
+        """Store a parsed file and schedule saving the cache."""
+        self._entries[path] = entry
+        self.async_schedule_save()
+
+    @callback
+    def async_schedule_save(self) -> None:
+        """Schedule saving the cache."""
+        self._store.async_delay_save(self._data_to_save, SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict[str, Any]:
+        """Return the data of the cache to store in a file."""
+        return {"ha_version": __version__, "entries": self._entries}
+
+
+@singleton.singleton(DATA_FILE_CACHE)
+async def async_get_file_cache(hass: HomeAssistant) -> FileCache:
+    """Return the file cache, loading it from storage."""
+    store = storage.Store(hass, STORAGE_VERSION, STORAGE_KEY)
+    data = await store.async_load()
+
+    if not isinstance(data, dict) or data.get("ha_version") != __version__:
+        return FileCache(hass, store, {})
+
+    entries = await hass.async_add_executor_job(_existing_entries, data["entries"])
+    cache = FileCache(hass, store, entries)
+    if len(entries) != len(data["entries"]):
+        cache.async_schedule_save()
+    return cache
+
+
+def _existing_entries(entries: dict[str, Any]) -> dict[str, Any]:
+    """Return the entries of the files that still exist."""
+    return {path: entry for path, entry in entries.items() if os.path.exists(path)}
+
+
+def load_file(hass: HomeAssistant, path: str, parse: Callable[[str], _T]) -> _T:
+    """Parse a file, using the file cache if it is loaded.
+
+    Must be called from the executor.
+    """
+    cache = hass.data.get(DATA_FILE_CACHE)
+
+    if not isinstance(cache, FileCache):
+        return parse(path)
+
+    return cache.load(path, parse)
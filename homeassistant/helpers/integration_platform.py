@@ -27,7 +27,7 @@ async def async_process_integration_platforms(
         integration = await async_get_integration(hass, component_name)
 
         try:
-            platform = integration.get_platform(platform_name)
+            platform = await integration.async_get_platform(platform_name)
         except ImportError as err:
             if f"{component_name}.{platform_name}" not in str(err):
                 _LOGGER.exception(
@@ -0,0 +1,119 @@
+"""Helper to coalesce state reports to a remote service into batches."""
+from __future__ import annotations
+
+import asyncio
+from logging import Logger
+from typing import Any, Awaitable, Callable, Collection, Generic, Hashable, TypeVar
+
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+_T = TypeVar("_T")
+
+
+class ReportBatcher(Generic[_T]):
+    """Buffer reports for a short window and send them as one batch.
+
+    A report replaces any report for the same key that is still buffered,
+    so only the latest report of each key is sent. Batches are sent one at
+    a time so reports for a key are never delivered out of order.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        logger: Logger,
+        *,
+        delay: float,
+        function: Callable[
+            [dict[Hashable, _T]], Awaitable[Collection[Hashable] | None]
+        ],
+    ) -> None:
+        """Initialize the batcher.
+
+        delay: seconds to wait after the first buffered report before sending.
+        function: coroutine function called with the reports to send by key.
+          It can return the keys of the reports it failed to send.
+        """
+        self.hass = hass
+        self.logger = logger
+        self.delay = delay
+        self._function = function
+        self._pending: dict[Hashable, _T] = {}
+        self._pending_since: float | None = None
+        self._unsub_timer: CALLBACK_TYPE | None = None
+        self._send_lock = asyncio.Lock()
+
+        # Metrics
+        self.batches = 0
+        self.reports = 0
+        self.coalesced = 0
+        self.dropped = 0
+        self.last_batch_size = 0
+        self.max_batch_size = 0
+        self.last_latency: float | None = None
+
+    @callback
+    def async_add(self, key: Hashable, report: _T) -> None:
+        """Buffer a report, replacing a buffered report for the same key."""
+        if key in self._pending:
+            self.coalesced += 1
+        elif not self._pending:
+            self._pending_since = self.hass.loop.time()
+
+        self._pending[key] = report
+
+        if self._unsub_timer is None:
+            self._unsub_timer = async_call_later(
+                self.hass, self.delay, self._async_timer_finished
+            )
+
+    async def _async_timer_finished(self, _now: Any) -> None:
+        """Send the buffered reports when the window closes."""
+        self._unsub_timer = None
+        await self.async_flush()
+
+    async def async_flush(self) -> None:
+        """Send the buffered reports now."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        async with self._send_lock:
+            if not self._pending:
+                return
+
+            pending, self._pending = self._pending, {}
+            pending_since = self._pending_since
+            assert pending_since is not None
+
+            try:
+                failed = await self._function(pending)
+            except Exception:  # pylint: disable=broad-except
+                self.dropped += len(pending)
+                self.logger.exception("Error sending %d reports", len(pending))
+                return
+
+            if failed:
+                self.dropped += len(failed)
+
+            self.batches += 1
+            self.reports += len(pending) - len(failed or ())
+            self.last_batch_size = len(pending)
+            self.max_batch_size = max(self.max_batch_size, len(pending))
+            self.last_latency = self.hass.loop.time() - pending_since
+            self.logger.debug(
+                "Sent %d reports %.3f seconds after the first was buffered",
+                len(pending),
+                self.last_latency,
+            )
+
+    @callback
+    def async_cancel(self) -> None:
+        """Cancel sending and drop the buffered reports."""
+        if self._unsub_timer is not None:
+            self._unsub_timer()
+            self._unsub_timer = None
+
+        self.dropped += len(self._pending)
+        self._pending = {}
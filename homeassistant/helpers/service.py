@@ -58,6 +58,8 @@ CONF_SERVICE_DATA_TEMPLATE = "data_template"
 _LOGGER = logging.getLogger(__name__)
 
 SERVICE_DESCRIPTION_CACHE = "service_description_cache"
+DATA_TARGET_CACHE = "service_target_cache"
+TARGET_CACHE_SIZE = 1024
 
 
 class ServiceParams(TypedDict):
@@ -335,33 +337,123 @@ async def async_extract_referenced_entity_ids(
     if not selector.device_ids and not selector.area_ids:
         return selected
 
-    ent_reg = entity_registry.async_get(hass)
-    dev_reg = device_registry.async_get(hass)
-    area_reg = area_registry.async_get(hass)
+    resolved = _async_get_target_cache(hass).async_resolve(
+        selector.device_ids, selector.area_ids
+    )
+    selected.indirectly_referenced.update(resolved.indirectly_referenced)
+    selected.missing_devices.update(resolved.missing_devices)
+    selected.missing_areas.update(resolved.missing_areas)
+    selected.referenced_devices.update(resolved.referenced_devices)
+
+    return selected
+
+
+class ServiceTargetCache:
+    """Cache the devices and entities that device and area targets resolve to.
+
+    Resolved targets are cached until the entity, device or area registry
+    changes. The registries bump their generation on every change, so an
+    update is seen by the next call without waiting for its event.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialize the cache."""
+        self.hass = hass
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+        self._generations: tuple[Any, ...] = ()
+        self._resolved: dict[
+            tuple[frozenset[str], frozenset[str]], SelectedEntities
+        ] = {}
+
+    @ha.callback
+    def async_resolve(
+        self, device_ids: set[str], area_ids: set[str]
+    ) -> SelectedEntities:
+        """Return the devices and entities targeted by devices and areas.
+
+        The result is shared and should not be modified.
+        """
+        registries = (
+            entity_registry.async_get(self.hass),
+            device_registry.async_get(self.hass),
+            area_registry.async_get(self.hass),
+        )
+        generations = tuple((registry, registry.generation) for registry in registries)
+        if generations != self._generations:
+            # A registry was changed or replaced
+            if self._resolved:
+                self.invalidations += 1
+                self._resolved.clear()
+            self._generations = generations
+
+        key = (frozenset(device_ids), frozenset(area_ids))
+        resolved = self._resolved.get(key)
+
+        if resolved is not None:
+            self.hits += 1
+            return resolved
+
+        self.misses += 1
+        if len(self._resolved) >= TARGET_CACHE_SIZE:
+            # Drop the oldest resolved target
+            del self._resolved[next(iter(self._resolved))]
+        resolved = self._resolved[key] = _async_resolve_targets(
+            *registries, device_ids, area_ids
+        )
+        return resolved
 
-    for device_id in selector.device_ids:
+
+@ha.callback
+def _async_get_target_cache(hass: HomeAssistantType) -> ServiceTargetCache:
+    """Return the cache of resolved service targets."""
+    cache: ServiceTargetCache | None = hass.data.get(DATA_TARGET_CACHE)
+    if cache is None:
+        cache = hass.data[DATA_TARGET_CACHE] = ServiceTargetCache(hass)
+    return cache
+
+
+@ha.callback
+def _async_resolve_targets(
+    ent_reg: entity_registry.EntityRegistry,
+    dev_reg: device_registry.DeviceRegistry,
+    area_reg: area_registry.AreaRegistry,
+    device_ids: set[str],
+    area_ids: set[str],
+) -> SelectedEntities:
+    """Resolve the devices and entities targeted by devices and areas."""
+    selected = SelectedEntities()
+
+    for device_id in device_ids:
         if device_id not in dev_reg.devices:
             selected.missing_devices.add(device_id)
 
-    for area_id in selector.area_ids:
+    for area_id in area_ids:
         if area_id not in area_reg.areas:
             selected.missing_areas.add(area_id)
 
     # Find devices for this area
-    selected.referenced_devices.update(selector.device_ids)
-    for device_entry in dev_reg.devices.values():
-        if device_entry.area_id in selector.area_ids:
+    selected.referenced_devices.update(device_ids)
+    for area_id in area_ids:
+        for device_entry in device_registry.async_entries_for_area(dev_reg, area_id):
             selected.referenced_devices.add(device_entry.id)
 
-    if not selector.area_ids and not selected.referenced_devices:
+    if not area_ids and not selected.referenced_devices:
         return selected
 
-    for ent_entry in ent_reg.entities.values():
-        if ent_entry.area_id in selector.area_ids or (
-            not ent_entry.area_id and ent_entry.device_id in selected.referenced_devices
-        ):
+    for area_id in area_ids:
+        for ent_entry in entity_registry.async_entries_for_area(ent_reg, area_id):
             selected.indirectly_referenced.add(ent_entry.entity_id)
 
+    # Entities of the devices, unless they are assigned to a different area
+    for device_id in selected.referenced_devices:
+        for ent_entry in entity_registry.async_entries_for_device(
+            ent_reg, device_id, include_disabled_entities=True
+        ):
+            if not ent_entry.area_id:
+                selected.indirectly_referenced.add(ent_entry.entity_id)
+
     return selected
 
 
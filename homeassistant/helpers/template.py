@@ -6,16 +6,15 @@ import asyncio
 import base64
 import collections.abc
 from datetime import datetime, timedelta
-from functools import partial, wraps
+from functools import lru_cache, partial, wraps
 import json
 import logging
 import math
 from operator import attrgetter
 import random
 import re
-from typing import Any, Generator, Iterable, cast
+from typing import Any, Callable, Generator, Iterable, cast
 from urllib.parse import urlencode as urllib_urlencode
-import weakref
 
 import jinja2
 from jinja2 import contextfilter, contextfunction
@@ -47,6 +46,7 @@ _SENTINEL = object()
 DATE_STR_FORMAT = "%Y-%m-%d %H:%M:%S"
 
 _RENDER_INFO = "template.render_info"
+_RENDER_MEMO = "template.render_memo"
 _ENVIRONMENT = "template.environment"
 _ENVIRONMENT_LIMITED = "template.environment_limited"
 
@@ -72,6 +72,8 @@ _COLLECTABLE_STATE_ATTRIBUTES = {
 ALL_STATES_RATE_LIMIT = timedelta(minutes=1)
 DOMAIN_STATES_RATE_LIMIT = timedelta(seconds=1)
 
+COMPILED_TEMPLATE_CACHE_SIZE = 4096
+
 
 @bind_hass
 def attach(hass: HomeAssistantType, obj: Any) -> None:
@@ -208,6 +210,8 @@ class RenderInfo:
         self.entities = set()
         self.rate_limit: timedelta | None = None
         self.has_time = False
+        # Set when the result depends on more than the tracked states
+        self._memoizable = True
 
     def __repr__(self) -> str:
         """Representation of RenderInfo."""
@@ -243,6 +247,20 @@ class RenderInfo:
         self.domains = frozenset(self.domains)
         self.domains_lifecycle = frozenset(self.domains_lifecycle)
 
+    def _copy(self, template: Template) -> RenderInfo:
+        """Return a frozen copy of a memoized render for a template."""
+        render_info = RenderInfo(template)  # type: ignore[no-untyped-call]
+        render_info._result = self._result
+        render_info.all_states = self.all_states
+        render_info.all_states_lifecycle = self.all_states_lifecycle
+        render_info.domains = set(self.domains)
+        render_info.domains_lifecycle = set(self.domains_lifecycle)
+        render_info.entities = set(self.entities)
+        render_info.rate_limit = self.rate_limit
+        render_info.has_time = self.has_time
+        render_info._freeze()
+        return render_info
+
     def _freeze(self) -> None:
         self._freeze_sets()
 
@@ -272,6 +290,92 @@ class RenderInfo:
             self.filter = _false
 
 
+def _render_memo_key(
+    template: Template, variables: TemplateVarsType, kwargs: dict[str, Any]
+) -> tuple | None:
+    """Return the key of a render or None if the render can't be memoized."""
+    try:
+        key = (
+            template.template,
+            bool(template._limited),  # pylint: disable=protected-access
+            _typed_items(variables) if variables else None,
+            _typed_items(kwargs) if kwargs else None,
+        )
+        hash(key)
+    except TypeError:
+        return None
+    return key
+
+
+def _typed_items(values: dict[str, Any]) -> frozenset:
+    """Return the items with their types as 1, 1.0 and True are equal keys."""
+    return frozenset((key, type(value), value) for key, value in values.items())
+
+
+class RenderMemo:
+    """Share render results of identical templates.
+
+    Many subscriptions to the same template re-render on the same state
+    change. The first render is memoized together with the states of
+    the entities it tracks and reused while those states are unchanged.
+    The memo is cleared once the current event loop iteration is done,
+    so anything the render does not track, like the time, can't go stale.
+    """
+
+    def __init__(self, hass: HomeAssistantType) -> None:
+        """Initialise the memo."""
+        self.hass = hass
+        self.hits = 0
+        self.misses = 0
+        self._results: dict[tuple, tuple[RenderInfo, tuple]] = {}
+        self._clear_scheduled = False
+
+    @callback
+    def async_get(self, key: tuple) -> RenderInfo | None:
+        """Return a memoized render if the tracked states did not change."""
+        memoized = self._results.get(key)
+        if memoized is not None:
+            render_info, states = memoized
+            get_state = self.hass.states.get
+            if all(get_state(entity_id) is state for entity_id, state in states):
+                self.hits += 1
+                return render_info
+        self.misses += 1
+        return None
+
+    @callback
+    def async_set(self, key: tuple, render_info: RenderInfo) -> None:
+        """Memoize a render that only depends on specific entities."""
+        if (
+            render_info.exception is not None
+            or render_info.has_time
+            or not render_info._memoizable  # pylint: disable=protected-access
+            or render_info.all_states
+            or render_info.all_states_lifecycle
+            or render_info.domains
+            or render_info.domains_lifecycle
+        ):
+            return
+
+        get_state = self.hass.states.get
+        self._results[key] = (
+            # Keep a copy so changes the caller makes to its render stay local
+            render_info._copy(render_info.template),  # pylint: disable=protected-access
+            tuple(
+                (entity_id, get_state(entity_id)) for entity_id in render_info.entities
+            ),
+        )
+        if not self._clear_scheduled:
+            self._clear_scheduled = True
+            self.hass.loop.call_soon(self._async_clear)
+
+    @callback
+    def _async_clear(self) -> None:
+        """Forget the memoized renders."""
+        self._results.clear()
+        self._clear_scheduled = False
+
+
 class Template:
     """Class to hold a template and manage caching and rendering."""
 
@@ -468,6 +572,15 @@ class Template:
             render_info._freeze_static()
             return render_info
 
+        memo = self.hass.data.get(_RENDER_MEMO)
+        if memo is None:
+            memo = self.hass.data[_RENDER_MEMO] = RenderMemo(self.hass)
+        memo_key = _render_memo_key(self, variables, kwargs)
+        if memo_key is not None:
+            memoized = memo.async_get(memo_key)
+            if memoized is not None:
+                return memoized._copy(self)
+
         self.hass.data[_RENDER_INFO] = render_info
         try:
             render_info._result = self.async_render(variables, **kwargs)
@@ -477,6 +590,8 @@ class Template:
             del self.hass.data[_RENDER_INFO]
 
         render_info._freeze()
+        if memo_key is not None:
+            memo.async_set(memo_key, render_info)
         return render_info
 
     def render_with_possible_json_value(self, value, error_value=_SENTINEL):
@@ -865,8 +980,27 @@ def expand(hass: HomeAssistantType, *args: Any) -> Iterable[State]:
     return sorted(found.values(), key=lambda a: a.entity_id)
 
 
+def _not_memoizable(hass: HomeAssistantType | None) -> None:
+    """Record the render depends on more than the tracked states."""
+    render_info = hass.data.get(_RENDER_INFO) if hass is not None else None
+    if render_info is not None:
+        render_info._memoizable = False  # pylint: disable=protected-access
+
+
+def _not_memoizable_call(func: Callable[..., Any]) -> Callable[..., Any]:
+    """Wrap a function whose result depends on more than the tracked states."""
+
+    @wraps(func)
+    def wrapper(hass: HomeAssistantType, *args: Any, **kwargs: Any) -> Any:
+        _not_memoizable(hass)
+        return func(*args, **kwargs)
+
+    return wrapper
+
+
 def device_entities(hass: HomeAssistantType, device_id: str) -> Iterable[str]:
     """Get entity ids for entities tied to a device."""
+    _not_memoizable(hass)
     entity_reg = entity_registry.async_get(hass)
     entries = entity_registry.async_entries_for_device(entity_reg, device_id)
     return [entry.entity_id for entry in entries]
@@ -895,6 +1029,8 @@ def closest(hass, *args):
         'group.children' | closest(states.zone.school)
 
     """
+    # Depends on the location of home
+    _not_memoizable(hass)
     if len(args) == 1:
         latitude = hass.config.latitude
         longitude = hass.config.longitude
@@ -948,6 +1084,8 @@ def distance(hass, *args):
     Will calculate distance from home to a point or between points.
     Points can be passed in using state objects or lat/lng coordinates.
     """
+    # Depends on the location of home
+    _not_memoizable(hass)
     locations = []
 
     to_process = list(args)
@@ -1024,6 +1162,7 @@ def now(hass):
     render_info = hass.data.get(_RENDER_INFO)
     if render_info is not None:
         render_info.has_time = True
+        render_info._memoizable = False  # pylint: disable=protected-access
 
     return dt_util.now()
 
@@ -1033,6 +1172,7 @@ def utcnow(hass):
     render_info = hass.data.get(_RENDER_INFO)
     if render_info is not None:
         render_info.has_time = True
+        render_info._memoizable = False  # pylint: disable=protected-access
 
     return dt_util.utcnow()
 
@@ -1285,6 +1425,7 @@ def random_every_time(context, values):
     Unlike Jinja's random filter,
     this is context-dependent to avoid caching the chosen value.
     """
+    _not_memoizable(getattr(context.environment, "hass", None))
     return random.choice(values)
 
 
@@ -1320,7 +1461,10 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
         """Initialise template environment."""
         super().__init__(undefined=jinja2.make_logging_undefined(logger=_LOGGER))
         self.hass = hass
-        self.template_cache = weakref.WeakValueDictionary()
+        # Compiled code shared by all templates with the same source
+        self._compile_cached = lru_cache(maxsize=COMPILED_TEMPLATE_CACHE_SIZE)(
+            super().compile
+        )
         self.filters["round"] = forgiving_round
         self.filters["multiply"] = multiply
         self.filters["log"] = logarithm
@@ -1390,6 +1534,10 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
 
         self.globals["device_entities"] = hassfunction(device_entities)
         self.filters["device_entities"] = contextfilter(self.globals["device_entities"])
+        # The result changes with the time
+        self.globals["relative_time"] = hassfunction(
+            _not_memoizable_call(relative_time)
+        )
 
         if limited:
             # Only device_entities is available to limited templates, mark other
@@ -1459,12 +1607,11 @@ class TemplateEnvironment(ImmutableSandboxedEnvironment):
             # any instance of this.
             return super().compile(source, name, filename, raw, defer_init)
 
-        cached = self.template_cache.get(source)
-
-        if cached is None:
-            cached = self.template_cache[source] = super().compile(source)
+        return self._compile_cached(source)
 
-        return cached
+    def template_cache_info(self):
+        """Return the hits, misses and size of the compiled template cache."""
+        return self._compile_cached.cache_info()
 
 
 _NO_HASS_ENV = TemplateEnvironment(None)  # type: ignore[no-untyped-call]
@@ -17,6 +17,7 @@ from homeassistant.loader import (
 from homeassistant.util.async_ import gather_with_concurrency
 from homeassistant.util.json import load_json
 
+from .file_cache import FileCache, async_get_file_cache
 from .typing import HomeAssistantType
 
 _LOGGER = logging.getLogger(__name__)
@@ -71,12 +72,15 @@ def component_translation_path(
 
 
 def load_translations_files(
-    translation_files: dict[str, str]
+    translation_files: dict[str, str], file_cache: FileCache | None = None
 ) -> dict[str, dict[str, Any]]:
     """Load and parse translation.json files."""
     loaded = {}
     for component, translation_file in translation_files.items():
-        loaded_json = load_json(translation_file)
+        if file_cache is None:
+            loaded_json = load_json(translation_file)
+        else:
+            loaded_json = file_cache.load(translation_file, load_json)
 
         if not isinstance(loaded_json, dict):
             _LOGGER.warning(
@@ -182,8 +186,9 @@ async def async_get_component_strings(
         return translations
 
     # Load files
+    file_cache = await async_get_file_cache(hass)
     load_translations_job = hass.async_add_executor_job(
-        load_translations_files, files_to_load
+        load_translations_files, files_to_load, file_cache
     )
     assert load_translations_job is not None
     loaded_translations = await load_translations_job
@@ -194,7 +199,11 @@ async def async_get_component_strings(
             continue
 
         if "title" not in loaded_translation:
-            loaded_translation["title"] = integrations[loaded].name
+            # Copy as the loaded translations are shared with the file cache
+            loaded_translations[loaded] = {
+                **loaded_translation,
+                "title": integrations[loaded].name,
+            }
 
     translations.update(loaded_translations)
 
@@ -13,6 +13,7 @@ import json
 import logging
 import pathlib
 import sys
+import time
 from types import ModuleType
 from typing import TYPE_CHECKING, Any, Callable, Dict, TypedDict, TypeVar, cast
 
@@ -38,6 +39,7 @@ _LOGGER = logging.getLogger(__name__)
 DATA_COMPONENTS = "components"
 DATA_INTEGRATIONS = "integrations"
 DATA_CUSTOM_COMPONENTS = "custom_components"
+DATA_PENDING_IMPORTS = "pending_imports"
 PACKAGE_CUSTOM_COMPONENTS = "custom_components"
 PACKAGE_BUILTIN = "homeassistant.components"
 CUSTOM_WARNING = (
@@ -114,6 +116,8 @@ async def _async_get_custom_components(
     except ImportError:
         return {}
 
+    await _async_get_file_cache(hass)
+
     def get_sub_directories(paths: list[str]) -> list[pathlib.Path]:
         """Return all sub directories in a set of paths."""
         return [
@@ -286,7 +290,7 @@ class Integration:
                 continue
 
             try:
-                manifest = json.loads(manifest_path.read_text())
+                manifest = _load_manifest(hass, manifest_path)
             except ValueError as err:
                 _LOGGER.error(
                     "Error parsing manifest.json file at %s: %s", manifest_path, err
@@ -328,8 +332,10 @@ class Integration:
         self.hass = hass
         self.pkg_path = pkg_path
         self.file_path = file_path
-        self.manifest = manifest
-        manifest["is_built_in"] = self.is_built_in
+        # The manifest can be shared with the file cache
+        self.manifest = cast(Manifest, {**manifest, "is_built_in": self.is_built_in})
+        # Seconds it took to import the component and each platform
+        self.import_times: dict[str, float] = {}
 
         if self.dependencies:
             self._all_dependencies_resolved: bool | None = None
@@ -470,11 +476,53 @@ class Integration:
 
         return self._all_dependencies_resolved
 
+    async def async_get_component(self) -> ModuleType:
+        """Return the component, importing it in the executor."""
+        cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        if self.domain in cache:
+            return cache[self.domain]  # type: ignore
+        return await self._async_import(self.domain, self.get_component)
+
+    async def async_get_platform(self, platform_name: str) -> ModuleType:
+        """Return a platform for an integration, importing it in the executor."""
+        cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
+        full_name = f"{self.domain}.{platform_name}"
+        if full_name in cache:
+            return cache[full_name]  # type: ignore
+        return await self._async_import(
+            full_name, ft.partial(self.get_platform, platform_name)
+        )
+
+    async def _async_import(
+        self, name: str, import_module: Callable[[], ModuleType]
+    ) -> ModuleType:
+        """Import a module in the executor.
+
+        Concurrent requests for the same module share one import.
+        """
+        pending = self.hass.data.setdefault(DATA_PENDING_IMPORTS, {})
+        future: asyncio.Future[ModuleType] | None = pending.get(name)
+        if future is None:
+            future = pending[name] = self.hass.async_add_executor_job(import_module)
+            future.add_done_callback(lambda _: pending.pop(name, None))
+
+        try:
+            return await asyncio.shield(future)
+        except RuntimeError as err:
+            # Some modules need the event loop when they are imported,
+            # any other error must not run the module a second time
+            if "no current event loop" not in str(err):
+                raise
+            _LOGGER.debug("Importing %s in the event loop: %s", name, err)
+            return import_module()
+
     def get_component(self) -> ModuleType:
         """Return the component."""
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         if self.domain not in cache:
-            cache[self.domain] = importlib.import_module(self.pkg_path)
+            cache[self.domain] = self._import_timed(
+                self.domain, ft.partial(importlib.import_module, self.pkg_path)
+            )
         return cache[self.domain]  # type: ignore
 
     def get_platform(self, platform_name: str) -> ModuleType:
@@ -482,9 +530,20 @@ class Integration:
         cache = self.hass.data.setdefault(DATA_COMPONENTS, {})
         full_name = f"{self.domain}.{platform_name}"
         if full_name not in cache:
-            cache[full_name] = self._import_platform(platform_name)
+            cache[full_name] = self._import_timed(
+                full_name, ft.partial(self._import_platform, platform_name)
+            )
         return cache[full_name]  # type: ignore
 
+    def _import_timed(
+        self, name: str, import_module: Callable[[], ModuleType]
+    ) -> ModuleType:
+        """Import a module and record how long it took."""
+        start = time.perf_counter()
+        module = import_module()
+        self.import_times[name] = time.perf_counter() - start
+        return module
+
     def _import_platform(self, platform_name: str) -> ModuleType:
         """Import the platform."""
         return importlib.import_module(f"{self.pkg_path}.{platform_name}")
@@ -530,6 +589,7 @@ async def async_get_integration(hass: HomeAssistant, domain: str) -> Integration
 
     from homeassistant import components  # pylint: disable=import-outside-toplevel
 
+    await _async_get_file_cache(hass)
     integration = await hass.async_add_executor_job(
         Integration.resolve_from_root, hass, components, domain
     )
@@ -555,6 +615,18 @@ async def async_get_integration(hass: HomeAssistant, domain: str) -> Integration
     return integration
 
 
+def async_get_import_times(hass: HomeAssistant) -> dict[str, dict[str, float]]:
+    """Return how long the modules of each loaded integration took to import.
+
+    Async friendly but not a coroutine.
+    """
+    return {
+        domain: dict(integration.import_times)
+        for domain, integration in hass.data.get(DATA_INTEGRATIONS, {}).items()
+        if isinstance(integration, Integration) and integration.import_times
+    }
+
+
 class LoaderError(Exception):
     """Loader base error."""
 
@@ -578,6 +650,26 @@ class CircularDependency(LoaderError):
         self.to_domain = to_domain
 
 
+async def _async_get_file_cache(hass: HomeAssistant) -> None:
+    """Load the cache of parsed manifests before resolving integrations."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.file_cache import async_get_file_cache
+
+    await async_get_file_cache(hass)
+
+
+def _load_manifest(hass: HomeAssistant, manifest_path: pathlib.Path) -> Manifest:
+    """Load a manifest, reusing the cached one while the file is unchanged."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.file_cache import load_file
+
+    return load_file(
+        hass,
+        str(manifest_path),
+        lambda path: json.loads(pathlib.Path(path).read_text()),
+    )
+
+
 def _load_file(
     hass: HomeAssistant, comp_or_platform: str, base_paths: list[str]
 ) -> ModuleType | None:
@@ -8,12 +8,19 @@ from contextlib import suppress
 from datetime import datetime
 import json
 import logging
+import pathlib
+from tempfile import TemporaryDirectory
 from timeit import default_timer as timer
 from typing import Callable, TypeVar
 
 from homeassistant import core
 from homeassistant.components.websocket_api.const import JSON_DUMP
-from homeassistant.const import ATTR_NOW, EVENT_STATE_CHANGED, EVENT_TIME_CHANGED
+from homeassistant.const import (
+    ATTR_NOW,
+    EVENT_HOMEASSISTANT_FINAL_WRITE,
+    EVENT_STATE_CHANGED,
+    EVENT_TIME_CHANGED,
+)
 from homeassistant.helpers.entityfilter import convert_include_exclude_filter
 from homeassistant.helpers.json import JSONEncoder
 from homeassistant.util import dt as dt_util
@@ -252,6 +259,45 @@ async def state_changed_event_filter_helper(hass):
     return timer() - start
 
 
+@benchmark
+async def state_changed_entity_listeners(hass):
+    """Fire a million state changed events for 1000 entities with a listener each."""
+    count = 0
+    entity_id = "light.kitchen"
+    events_to_fire = 10 ** 6
+
+    @core.callback
+    def listener(*args):
+        """Handle event."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        hass.bus.async_listen_entities(
+            EVENT_STATE_CHANGED, [f"{entity_id}{idx}"], listener
+        )
+
+    events_data = [
+        {
+            "entity_id": f"{entity_id}{idx}",
+            "old_state": core.State(entity_id, "off"),
+            "new_state": core.State(entity_id, "on"),
+        }
+        for idx in range(1000)
+    ]
+
+    start = timer()
+
+    for idx in range(events_to_fire):
+        hass.bus.async_fire(EVENT_STATE_CHANGED, events_data[idx % 1000])
+
+    await hass.async_block_till_done()
+
+    assert count == events_to_fire
+
+    return timer() - start
+
+
 @benchmark
 async def logbook_filtering_state(hass):
     """Filter state changes."""
@@ -390,6 +436,138 @@ async def json_serialize_states(hass):
     return timer() - start
 
 
+@benchmark
+async def mqtt_topic_matching(hass):
+    """Match 100k topics against 5000 MQTT subscriptions."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+    trie = TopicTrie()
+    for device in range(1000):
+        for topic_filter in (
+            f"zigbee2mqtt/device_{device}",
+            f"zigbee2mqtt/device_{device}/availability",
+            f"tasmota/tele/device_{device}/+",
+            f"homeassistant/sensor/device_{device}/+/config",
+            f"shellies/device_{device}/#",
+        ):
+            trie.add(topic_filter, topic_filter)
+
+    topics = [
+        f"tasmota/tele/device_{idx % 1000}/STATE"
+        if idx % 2
+        else f"zigbee2mqtt/device_{idx % 1000}"
+        for idx in range(10 ** 5)
+    ]
+
+    start = timer()
+    for topic in topics:
+        trie.match(topic)
+    return timer() - start
+
+
+@benchmark
+async def track_template_result_1k(hass):
+    """Route 10k state changes to 1000 tracked templates."""
+    return await _track_template_result(hass, 1000)
+
+
+@benchmark
+async def track_template_result_10k(hass):
+    """Route 10k state changes to 10000 tracked templates."""
+    return await _track_template_result(hass, 10000)
+
+
+async def _track_template_result(hass, template_count):
+    """Route state changes of 1000 sensors to templates tracking them."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant.helpers.event import TrackTemplate, async_track_template_result
+    from homeassistant.helpers.template import Template
+
+    count = 0
+    changes = 10 ** 4
+
+    @core.callback
+    def listener(*args):
+        """Handle template result."""
+        nonlocal count
+        count += 1
+
+    for idx in range(1000):
+        hass.states.async_set(f"sensor.temperature_{idx}", 0)
+
+    for idx in range(template_count):
+        async_track_template_result(
+            hass,
+            [
+                TrackTemplate(
+                    Template(
+                        f"{{{{ states('sensor.temperature_{idx % 1000}') | int "
+                        f"+ {idx} }}}}"
+                    ),
+                    None,
+                )
+            ],
+            listener,
+        )
+
+    start = timer()
+
+    for idx in range(changes):
+        hass.states.async_set(f"sensor.temperature_{idx % 1000}", idx + 1)
+        if idx % 1000 == 999:
+            await hass.async_block_till_done()
+
+    assert count == changes * template_count // 1000
+
+    return timer() - start
+
+
+@benchmark
+async def load_integrations_cold(hass):
+    """Resolve all built-in integrations and their translations."""
+    return await _load_integrations(hass, warm=False)
+
+
+@benchmark
+async def load_integrations_warm(hass):
+    """Resolve all built-in integrations and their translations from the cache."""
+    return await _load_integrations(hass, warm=True)
+
+
+async def _load_integrations(hass, warm):
+    """Resolve all built-in integrations like a (re)start of Home Assistant."""
+    # pylint: disable=import-outside-toplevel
+    from homeassistant import components, loader
+    from homeassistant.helpers import file_cache, translation
+
+    domains = {
+        path.parent.name
+        for path in pathlib.Path(components.__path__[0]).glob("*/manifest.json")
+    }
+
+    async def load():
+        await asyncio.gather(
+            *(loader.async_get_integration(hass, domain) for domain in domains)
+        )
+        await translation.async_get_component_strings(hass, "en", domains)
+
+    with TemporaryDirectory() as config_dir:
+        hass.config.config_dir = config_dir
+
+        if warm:
+            await load()
+            # Store the file cache and forget everything else like a restart
+            hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+            await hass.async_block_till_done()
+            for key in (loader.DATA_INTEGRATIONS, file_cache.DATA_FILE_CACHE):
+                hass.data.pop(key)
+
+        start = timer()
+        await load()
+        return timer() - start
+
+
 def _create_state_changed_event_from_old_new(
     entity_id, event_time_fired, old_state, new_state
 ):
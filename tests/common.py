@@ -52,6 +52,7 @@ from homeassistant.helpers import (
     entity,
     entity_platform,
     entity_registry,
+    file_cache,
     intent,
     restore_state,
     storage,
@@ -114,6 +115,12 @@ def get_test_home_assistant():
     asyncio.set_event_loop(loop)
     hass = loop.run_until_complete(async_test_home_assistant(loop))
 
+    # Storage is not mocked here, keep the files parsed by the tests
+    # in memory instead of writing them to the test config dir
+    store = storage.Store(hass, file_cache.STORAGE_VERSION, file_cache.STORAGE_KEY)
+    store.async_delay_save = Mock()
+    hass.data[file_cache.DATA_FILE_CACHE] = file_cache.FileCache(hass, store, {})
+
     loop_stop_event = threading.Event()
 
     def run_loop():
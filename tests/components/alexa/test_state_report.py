@@ -1,11 +1,24 @@
 """Test report state."""
+from datetime import timedelta
 from unittest.mock import patch
 
 from homeassistant import core
 from homeassistant.components.alexa import state_report
+from homeassistant.util.dt import utcnow
 
 from . import DEFAULT_CONFIG, TEST_URL
 
+from tests.common import async_fire_time_changed
+
+
+async def async_send_reports(hass):
+    """Wait for the change report window to pass and the reports to be sent."""
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=state_report.CHANGE_REPORT_WINDOW)
+    )
+    await hass.async_block_till_done()
+
 
 async def test_report_state(hass, aioclient_mock):
     """Test proactive state reports."""
@@ -26,7 +39,7 @@ async def test_report_state(hass, aioclient_mock):
     )
 
     # To trigger event listener
-    await hass.async_block_till_done()
+    await async_send_reports(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -72,7 +85,7 @@ async def test_report_state_instance(hass, aioclient_mock):
     )
 
     # To trigger event listener
-    await hass.async_block_till_done()
+    await async_send_reports(hass)
 
     assert len(aioclient_mock.mock_calls) == 1
     call = aioclient_mock.mock_calls
@@ -203,7 +216,7 @@ async def test_proactive_mode_filter_states(hass, aioclient_mock):
         "on",
         {"friendly_name": "Test Contact Sensor", "device_class": "door"},
     )
-    await hass.async_block_till_done()
+    await async_send_reports(hass)
     assert len(aioclient_mock.mock_calls) == 1
 
     aioclient_mock.clear_requests()
@@ -253,8 +266,7 @@ async def test_proactive_mode_filter_states(hass, aioclient_mock):
 
     # Removing an entity
     hass.states.async_remove("binary_sensor.test_contact")
-    await hass.async_block_till_done()
-    await hass.async_block_till_done()
+    await async_send_reports(hass)
     assert len(aioclient_mock.mock_calls) == 0
 
     # If serializes to same properties, it should not report
@@ -275,5 +287,82 @@ async def test_proactive_mode_filter_states(hass, aioclient_mock):
             {"friendly_name": "Test Contact Sensor", "device_class": "door"},
         )
 
-        await hass.async_block_till_done()
+        await async_send_reports(hass)
+    assert len(aioclient_mock.mock_calls) == 1
+
+
+async def test_report_state_coalesced(hass, aioclient_mock):
+    """Test state changes within the report window are coalesced per entity."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    attrs = {"friendly_name": "Test Contact Sensor", "device_class": "door"}
+    hass.states.async_set("binary_sensor.test_contact", "on", attrs)
+    hass.states.async_set("binary_sensor.test_window", "on", attrs)
+
+    unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    hass.states.async_set("binary_sensor.test_contact", "off", attrs)
+    hass.states.async_set("binary_sensor.test_window", "off", attrs)
+    await hass.async_block_till_done()
+    hass.states.async_set("binary_sensor.test_contact", "on", attrs)
+    await hass.async_block_till_done()
+    assert len(aioclient_mock.mock_calls) == 0
+
+    await async_send_reports(hass)
+
+    assert len(aioclient_mock.mock_calls) == 2
+    reports = {
+        call[2]["event"]["endpoint"]["endpointId"]: call[2]["event"]["payload"][
+            "change"
+        ]["properties"][0]["value"]
+        for call in aioclient_mock.mock_calls
+    }
+    assert reports == {
+        "binary_sensor#test_contact": "DETECTED",
+        "binary_sensor#test_window": "NOT_DETECTED",
+    }
+
+    batcher = DEFAULT_CONFIG.report_batcher
+    assert batcher.batches == 1
+    assert batcher.reports == 2
+    assert batcher.coalesced == 1
+
+    # Reports still buffered are dropped when proactive mode is disabled
+    hass.states.async_set("binary_sensor.test_contact", "off", attrs)
+    await hass.async_block_till_done()
+    unsub()
+    await async_send_reports(hass)
+    assert len(aioclient_mock.mock_calls) == 2
+    assert batcher.dropped == 1
+
+
+async def test_report_state_failed_per_entity(hass, aioclient_mock, caplog):
+    """Test a failed ChangeReport only drops the report of its entity."""
+    aioclient_mock.post(TEST_URL, text="", status=202)
+    attrs = {"friendly_name": "Test Contact Sensor", "device_class": "door"}
+    hass.states.async_set("binary_sensor.test_contact", "on", attrs)
+    hass.states.async_set("binary_sensor.test_window", "on", attrs)
+
+    unsub = await state_report.async_enable_proactive_mode(hass, DEFAULT_CONFIG)
+
+    send_changereport = state_report.async_send_changereport_message
+
+    async def mock_send_changereport(hass, config, alexa_entity, alexa_properties):
+        if alexa_entity.entity_id == "binary_sensor.test_window":
+            raise ValueError
+        await send_changereport(hass, config, alexa_entity, alexa_properties)
+
+    with patch.object(
+        state_report, "async_send_changereport_message", mock_send_changereport
+    ):
+        hass.states.async_set("binary_sensor.test_contact", "off", attrs)
+        hass.states.async_set("binary_sensor.test_window", "off", attrs)
+        await async_send_reports(hass)
+
     assert len(aioclient_mock.mock_calls) == 1
+    assert "Error sending ChangeReport for binary_sensor.test_window" in caplog.text
+    batcher = DEFAULT_CONFIG.report_batcher
+    assert batcher.batches == 1
+    assert batcher.reports == 1
+    assert batcher.dropped == 1
+
+    unsub()
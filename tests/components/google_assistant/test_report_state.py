@@ -1,4 +1,5 @@
 """Test Google report state."""
+from datetime import timedelta
 from unittest.mock import AsyncMock, patch
 
 from homeassistant.components.google_assistant import error, report_state
@@ -10,6 +11,15 @@ from . import BASIC_CONFIG
 from tests.common import async_fire_time_changed
 
 
+async def async_send_reports(hass):
+    """Wait for the report window to pass and the reports to be sent."""
+    await hass.async_block_till_done()
+    async_fire_time_changed(
+        hass, utcnow() + timedelta(seconds=report_state.REPORT_STATE_WINDOW)
+    )
+    await hass.async_block_till_done()
+
+
 async def test_report_state(hass, caplog, legacy_patchable_time):
     """Test report state works."""
     assert await async_setup_component(hass, "switch", {})
@@ -39,7 +49,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         BASIC_CONFIG, "async_report_state_all", AsyncMock()
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
-        await hass.async_block_till_done()
+        await async_send_reports(hass)
 
     assert len(mock_report.mock_calls) == 1
     assert mock_report.mock_calls[0][1][0] == {
@@ -57,7 +67,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
 
         # Changed, but serialize is same, so filtered out by extra check
         hass.states.async_set("light.double_report", "off")
-        await hass.async_block_till_done()
+        await async_send_reports(hass)
 
         assert len(mock_report.mock_calls) == 1
         assert mock_report.mock_calls[0][1][0] == {
@@ -69,7 +79,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         BASIC_CONFIG, "async_report_state_all", AsyncMock()
     ) as mock_report:
         hass.states.async_set("switch.ac", "on", {"something": "else"})
-        await hass.async_block_till_done()
+        await async_send_reports(hass)
 
     assert len(mock_report.mock_calls) == 0
 
@@ -81,7 +91,7 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         side_effect=error.SmartHomeError("mock-error", "mock-msg"),
     ):
         hass.states.async_set("light.kitchen", "off")
-        await hass.async_block_till_done()
+        await async_send_reports(hass)
 
     assert "Not reporting state for light.kitchen: mock-error"
     assert len(mock_report.mock_calls) == 0
@@ -92,6 +102,54 @@ async def test_report_state(hass, caplog, legacy_patchable_time):
         BASIC_CONFIG, "async_report_state_all", AsyncMock()
     ) as mock_report:
         hass.states.async_set("light.kitchen", "on")
-        await hass.async_block_till_done()
+        await async_send_reports(hass)
 
     assert len(mock_report.mock_calls) == 0
+
+
+async def test_report_state_batched(hass, legacy_patchable_time):
+    """Test state changes within the report window are sent in one request."""
+    hass.states.async_set("light.ceiling", "off")
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report, patch.object(report_state, "INITIAL_REPORT_DELAY", 0):
+        unsub = report_state.async_enable_report_state(hass, BASIC_CONFIG)
+        async_fire_time_changed(hass, utcnow())
+        await hass.async_block_till_done()
+
+    assert len(mock_report.mock_calls) == 1
+
+    with patch.object(
+        BASIC_CONFIG, "async_report_state_all", AsyncMock()
+    ) as mock_report:
+        for light_id in range(3):
+            hass.states.async_set(f"light.light_{light_id}", "on")
+        hass.states.async_set("light.ceiling", "on")
+        await hass.async_block_till_done()
+        hass.states.async_set("light.ceiling", "off")
+        await hass.async_block_till_done()
+        assert len(mock_report.mock_calls) == 0
+
+        await async_send_reports(hass)
+
+    assert len(mock_report.mock_calls) == 1
+    assert mock_report.mock_calls[0][1][0] == {
+        "devices": {
+            "states": {
+                "light.light_0": {"on": True, "online": True},
+                "light.light_1": {"on": True, "online": True},
+                "light.light_2": {"on": True, "online": True},
+                "light.ceiling": {"on": False, "online": True},
+            }
+        }
+    }
+
+    batcher = BASIC_CONFIG.report_batcher
+    assert batcher.batches == 1
+    assert batcher.reports == 4
+    assert batcher.coalesced == 1
+    assert batcher.last_batch_size == 4
+    assert batcher.last_latency is not None
+
+    unsub()
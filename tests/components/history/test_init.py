@@ -15,7 +15,11 @@ from homeassistant.setup import async_setup_component
 import homeassistant.util.dt as dt_util
 
 from tests.common import init_recorder_component, mock_state_change_event
-from tests.components.recorder.common import trigger_db_commit, wait_recording_done
+from tests.components.recorder.common import (
+    async_wait_recording_done_without_instance,
+    trigger_db_commit,
+    wait_recording_done,
+)
 
 
 @pytest.mark.usefixtures("hass_history")
@@ -756,6 +760,111 @@ async def test_fetch_period_api_with_minimal_response(hass, hass_client):
     assert response.status == 200
 
 
+async def test_fetch_period_api_stream(hass, hass_client):
+    """Test the streamed history matches the regular response."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    client = await hass_client()
+
+    response = await client.get(f"/api/history/period/{start.isoformat()}?stream")
+    assert response.status == 200
+    assert await response.json() == []
+
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("sensor.power", "10", {"unit_of_measurement": "W"})
+    hass.states.async_set("sensor.power", "20", {"unit_of_measurement": "W"})
+    hass.states.async_set("light.kitchen", "on")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    await async_wait_recording_done_without_instance(hass)
+
+    for query in ("", "&minimal_response", "&significant_changes_only=0"):
+        response = await client.get(
+            f"/api/history/period/{start.isoformat()}?skip_initial_state{query}"
+        )
+        expected = await response.json()
+        response = await client.get(
+            f"/api/history/period/{start.isoformat()}?stream&skip_initial_state{query}"
+        )
+        assert response.status == 200
+        assert await response.json() == expected
+
+    response = await client.get(
+        f"/api/history/period/{start.isoformat()}?stream&filter_entity_id=light.kitchen"
+    )
+    history = await response.json()
+    assert len(history) == 1
+    assert [state["state"] for state in history[0]] == ["off", "on"]
+
+
+async def test_fetch_period_api_compact(hass, hass_client):
+    """Test the compact history response."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    start = dt_util.utcnow()
+    hass.states.async_set("light.kitchen", "off")
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("light.kitchen", "off", {"brightness": 100})
+    hass.states.async_set("sensor.power", "10")
+    await async_wait_recording_done_without_instance(hass)
+    kitchen = hass.states.get("light.kitchen")
+    client = await hass_client()
+
+    for query in ("", "&stream"):
+        response = await client.get(
+            f"/api/history/period/{start.isoformat()}?compact&skip_initial_state{query}"
+        )
+        assert response.status == 200
+        history = await response.json()
+        assert [entity["entity_id"] for entity in history] == [
+            "light.kitchen",
+            "sensor.power",
+        ]
+        assert history[0]["state"] == ["off", "on", "off"]
+        assert history[0]["attributes"] == [[0, {}], [1, {"brightness": 100}]]
+        assert history[0]["last_updated"][-1] == pytest.approx(
+            kitchen.last_updated.timestamp()
+        )
+
+    later = dt_util.utcnow()
+    hass.states.async_set("sensor.power", "20")
+    hass.states.async_set("sensor.power", "20", {"unit_of_measurement": "W"})
+    hass.states.async_set("climate.hvac", "heat", {"temperature": 20})
+    hass.states.async_set("climate.hvac", "heat", {"temperature": 21})
+    await async_wait_recording_done_without_instance(hass)
+
+    response = await client.get(
+        f"/api/history/period/{later.isoformat()}?compact&minimal_response"
+        "&significant_changes_only=0"
+    )
+    history = await response.json()
+    # Climate keeps its attributes and repeated states for the graphs
+    assert history == [
+        {
+            "entity_id": "climate.hvac",
+            "last_updated": [
+                pytest.approx(later.timestamp(), abs=5),
+                pytest.approx(later.timestamp(), abs=5),
+            ],
+            "state": ["heat", "heat"],
+            "attributes": [[0, {"temperature": 20}], [1, {"temperature": 21}]],
+        },
+        {
+            "entity_id": "light.kitchen",
+            "last_updated": [later.timestamp()],
+            "state": ["off"],
+        },
+        {
+            "entity_id": "sensor.power",
+            "last_updated": [
+                later.timestamp(),
+                pytest.approx(later.timestamp(), abs=5),
+            ],
+            "state": ["10", "20"],
+        },
+    ]
+
+
 async def test_fetch_period_api_with_no_timestamp(hass, hass_client):
     """Test the fetch period view for history with no timestamp."""
     await hass.async_add_executor_job(init_recorder_component, hass)
@@ -971,3 +1080,28 @@ async def test_entity_ids_limit_via_api_with_skip_initial_state(hass, hass_clien
     assert len(response_json) == 2
     assert response_json[0][0]["entity_id"] == "light.kitchen"
     assert response_json[1][0]["entity_id"] == "light.cow"
+
+
+async def test_statistics_api(hass, hass_client):
+    """Test the statistics view for history."""
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    await async_setup_component(hass, "history", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+    client = await hass_client()
+
+    start = dt_util.utcnow() - timedelta(days=1)
+    with patch(
+        "homeassistant.components.history.statistics.statistics_during_period",
+        return_value={"sensor.power": []},
+    ) as mock_statistics:
+        response = await client.get(
+            f"/api/history/statistics/{start.isoformat()}",
+            params={"statistic_ids": "sensor.power,sensor.energy"},
+        )
+    assert response.status == 200
+    assert await response.json() == {"sensor.power": []}
+    assert mock_statistics.call_args[0][1] == start
+    assert mock_statistics.call_args[0][3] == ["sensor.power", "sensor.energy"]
+
+    response = await client.get("/api/history/statistics/invalid")
+    assert response.status == 400
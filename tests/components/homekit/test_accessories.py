@@ -2,7 +2,9 @@
 
 This includes tests for all mock object types.
 """
-from unittest.mock import Mock, patch
+import asyncio
+import threading
+from unittest.mock import Mock, call, patch
 
 import pytest
 
@@ -634,3 +636,83 @@ def test_home_driver():
 
     mock_unpair.assert_called_with("client_uuid")
     mock_show_msg.assert_called_with("hass", "entry_id", "title (any)", pin, "X-HM://0")
+
+
+async def test_home_driver_coalesces_notifications(hass):
+    """Test HomeDriver only sends the last value of each characteristic."""
+    with patch("pyhap.accessory_driver.AccessoryDriver.__init__"):
+        driver = HomeDriver(hass, "entry_id", "name", "title")
+    driver.tid = threading.current_thread()
+    driver.topics = {"2.9": {"client"}, "2.10": {"client"}}
+
+    with patch("pyhap.accessory_driver.AccessoryDriver.publish") as mock_publish:
+        driver.publish({"aid": 2, "iid": 9, "value": 1})
+        driver.publish({"aid": 2, "iid": 9, "value": 2})
+        driver.publish({"aid": 2, "iid": 10, "value": 1})
+        driver.publish({"aid": 2, "iid": 9, "value": 3})
+        # Values no controller subscribed to are not sent
+        driver.publish({"aid": 2, "iid": 11, "value": 1})
+        assert mock_publish.call_count == 0
+        await hass.async_block_till_done()
+
+        assert mock_publish.call_args_list == [
+            call({"aid": 2, "iid": 9, "value": 3}),
+            call({"aid": 2, "iid": 10, "value": 1}),
+        ]
+        assert driver.notifications_sent == 2
+        assert driver.notifications_suppressed == 2
+
+        # Values set by a controller are sent right away and replace
+        # buffered values
+        mock_publish.reset_mock()
+        driver.publish({"aid": 2, "iid": 9, "value": 4})
+        driver.publish({"aid": 2, "iid": 9, "value": 5}, "client")
+        mock_publish.assert_called_once_with({"aid": 2, "iid": 9, "value": 5}, "client")
+        await hass.async_block_till_done()
+        assert mock_publish.call_count == 1
+        assert driver.notifications_sent == 3
+        assert driver.notifications_suppressed == 3
+
+
+async def test_home_driver_controller_value_from_thread(hass):
+    """Test a controller value from a thread replaces a buffered value."""
+    with patch("pyhap.accessory_driver.AccessoryDriver.__init__"):
+        driver = HomeDriver(hass, "entry_id", "name", "title")
+    driver.tid = None
+    driver.topics = {"2.9": {"client"}}
+
+    with patch("pyhap.accessory_driver.AccessoryDriver.publish") as mock_publish:
+        driver.publish({"aid": 2, "iid": 9, "value": 1})
+        driver.publish({"aid": 2, "iid": 9, "value": 2}, "client")
+        await hass.async_block_till_done()
+
+    mock_publish.assert_called_once_with({"aid": 2, "iid": 9, "value": 2}, "client")
+    assert driver.notifications_sent == 1
+    assert driver.notifications_suppressed == 1
+
+
+async def test_home_driver_notify_window(hass):
+    """Test HomeDriver buffers notifications for the notify window."""
+    with patch("pyhap.accessory_driver.AccessoryDriver.__init__"):
+        driver = HomeDriver(hass, "entry_id", "name", "title", notify_window=0.01)
+    driver.tid = threading.current_thread()
+    driver.topics = {"2.9": {"client"}}
+
+    with patch("pyhap.accessory_driver.AccessoryDriver.publish") as mock_publish:
+        driver.publish({"aid": 2, "iid": 9, "value": 1})
+        await hass.async_block_till_done()
+        driver.publish({"aid": 2, "iid": 9, "value": 2})
+        await hass.async_block_till_done()
+        assert mock_publish.call_count == 0
+
+        await asyncio.sleep(0.05)
+        mock_publish.assert_called_once_with({"aid": 2, "iid": 9, "value": 2})
+        assert driver.notifications_sent == 1
+        assert driver.notifications_suppressed == 1
+
+        # Buffered values are dropped on stop
+        driver.publish({"aid": 2, "iid": 9, "value": 3})
+        with patch("pyhap.accessory_driver.AccessoryDriver.async_stop"):
+            await driver.async_stop()
+        await asyncio.sleep(0.05)
+        assert mock_publish.call_count == 1
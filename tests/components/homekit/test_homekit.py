@@ -28,6 +28,7 @@ from homeassistant.components.homekit.const import (
     BRIDGE_NAME,
     BRIDGE_SERIAL_NUMBER,
     CONF_AUTO_START,
+    DEFAULT_NOTIFY_WINDOW,
     DEFAULT_PORT,
     DOMAIN,
     HOMEKIT,
@@ -145,6 +146,7 @@ async def test_setup_min(hass, mock_zeroconf):
         None,
         entry.entry_id,
         entry.title,
+        DEFAULT_NOTIFY_WINDOW,
     )
 
     # Test auto start enabled
@@ -181,6 +183,7 @@ async def test_setup_auto_start_disabled(hass, mock_zeroconf):
         None,
         entry.entry_id,
         entry.title,
+        DEFAULT_NOTIFY_WINDOW,
     )
 
     # Test auto_start disabled
@@ -245,6 +248,7 @@ async def test_homekit_setup(hass, hk_driver, mock_zeroconf):
         entry.entry_id,
         BRIDGE_NAME,
         entry.title,
+        notify_window=DEFAULT_NOTIFY_WINDOW,
         loop=hass.loop,
         address=IP_ADDRESS,
         port=DEFAULT_PORT,
@@ -285,6 +289,7 @@ async def test_homekit_setup_ip_address(hass, hk_driver, mock_zeroconf):
         entry.entry_id,
         BRIDGE_NAME,
         entry.title,
+        notify_window=DEFAULT_NOTIFY_WINDOW,
         loop=hass.loop,
         address="172.0.0.0",
         port=DEFAULT_PORT,
@@ -324,6 +329,7 @@ async def test_homekit_setup_advertise_ip(hass, hk_driver, mock_zeroconf):
         entry.entry_id,
         BRIDGE_NAME,
         entry.title,
+        notify_window=DEFAULT_NOTIFY_WINDOW,
         loop=hass.loop,
         address="0.0.0.0",
         port=DEFAULT_PORT,
@@ -456,6 +462,28 @@ async def test_homekit_entity_glob_filter(hass, mock_zeroconf):
     assert hass.states.get("light.included_test") in filtered_states
 
 
+async def test_homekit_status_data(hass, mock_zeroconf):
+    """Test the notification counters of each bridge are readable."""
+    entry = await async_init_integration(hass)
+    homekit = _mock_homekit(hass, entry, HOMEKIT_MODE_BRIDGE)
+
+    assert homekit.async_status_data() == {
+        "name": BRIDGE_NAME,
+        "status": STATUS_READY,
+        "notifications_sent": 0,
+        "notifications_suppressed": 0,
+    }
+
+    homekit.driver = Mock(notifications_sent=3, notifications_suppressed=2)
+    homekit.status = STATUS_RUNNING
+    assert homekit.async_status_data() == {
+        "name": BRIDGE_NAME,
+        "status": STATUS_RUNNING,
+        "notifications_sent": 3,
+        "notifications_suppressed": 2,
+    }
+
+
 async def test_homekit_start(hass, hk_driver, mock_zeroconf, device_reg):
     """Test HomeKit start method."""
     entry = await async_init_integration(hass)
@@ -833,6 +861,7 @@ async def test_yaml_updates_update_config_entry_for_name(hass, mock_zeroconf):
         None,
         entry.entry_id,
         entry.title,
+        DEFAULT_NOTIFY_WINDOW,
     )
 
     # Test auto start enabled
@@ -1096,6 +1125,7 @@ async def test_reload(hass, mock_zeroconf):
         None,
         entry.entry_id,
         entry.title,
+        DEFAULT_NOTIFY_WINDOW,
     )
     yaml_path = os.path.join(
         _get_fixtures_base_path(),
@@ -1132,6 +1162,7 @@ async def test_reload(hass, mock_zeroconf):
         None,
         entry.entry_id,
         entry.title,
+        DEFAULT_NOTIFY_WINDOW,
     )
 
 
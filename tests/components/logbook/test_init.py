@@ -1834,6 +1834,123 @@ async def test_context_filter(hass, hass_client):
     assert response.status == 400
 
 
+@pytest.mark.parametrize("slack", [logbook.PAGE_QUERY_SLACK, 0])
+async def test_logbook_pagination(hass, hass_client, slack):
+    """Test the logbook can be fetched in pages.
+
+    Without slack every row of a page is fetched by its own query.
+    """
+    await hass.async_add_executor_job(init_recorder_component, hass)
+    assert await async_setup_component(hass, "logbook", {})
+    assert await async_setup_component(hass, "automation", {})
+    assert await async_setup_component(hass, "script", {})
+    await hass.async_add_executor_job(hass.data[recorder.DATA_INSTANCE].block_till_done)
+
+    start = dt_util.utcnow().date()
+    start_time = dt_util.as_utc(datetime(start.year, start.month, start.day))
+    context = ha.Context()
+    service_context = ha.Context()
+
+    hass.bus.async_fire(
+        EVENT_AUTOMATION_TRIGGERED,
+        {ATTR_NAME: "Mock automation", ATTR_ENTITY_ID: "automation.alarm"},
+        context=context,
+        time_fired=start_time + timedelta(minutes=1),
+    )
+    # Grouped with the automation
+    hass.bus.async_fire(
+        EVENT_SCRIPT_STARTED,
+        {ATTR_NAME: "Mock script", ATTR_ENTITY_ID: "script.mock_script"},
+        context=context,
+        time_fired=start_time + timedelta(minutes=2),
+    )
+    hass.bus.async_fire(
+        logbook.EVENT_LOGBOOK_ENTRY,
+        {
+            logbook.ATTR_NAME: "Alarm",
+            logbook.ATTR_MESSAGE: "is triggered",
+            ATTR_ENTITY_ID: "switch.alarm",
+        },
+        context=context,
+        time_fired=start_time + timedelta(minutes=20),
+    )
+    hass.bus.async_fire(
+        EVENT_CALL_SERVICE,
+        {ATTR_DOMAIN: "light", ATTR_SERVICE: "turn_off"},
+        context=service_context,
+        time_fired=start_time + timedelta(minutes=40),
+    )
+    for minutes, name in ((60, "first"), (80, "second")):
+        hass.bus.async_fire(
+            logbook.EVENT_LOGBOOK_ENTRY,
+            {
+                logbook.ATTR_NAME: name,
+                logbook.ATTR_MESSAGE: "is off",
+                ATTR_ENTITY_ID: "light.kitchen",
+            },
+            context=service_context,
+            time_fired=start_time + timedelta(minutes=minutes),
+        )
+    await _async_commit_and_wait(hass)
+    client = await hass_client()
+
+    params = {"end_time": str(start_time + timedelta(hours=24))}
+    entries = await _async_fetch_logbook(client, dict(params))
+    assert len(entries) == 5
+
+    with patch.object(logbook, "PAGE_QUERY_SLACK", slack):
+        pages = []
+        cursor = None
+        while True:
+            page_params = {**params, "limit": 1}
+            if cursor:
+                page_params["cursor"] = cursor
+            page = await _async_fetch_logbook(client, page_params)
+            pages.append(page["entries"])
+            cursor = page["next_cursor"]
+            if cursor is None:
+                break
+
+        # Events of the same GROUP_BY_MINUTES group are always on the same page
+        assert [len(page) for page in pages] == [2, 1, 1, 1]
+        assert [entry for page in pages for entry in page] == entries
+        assert pages[1][0]["context_entity_id"] == "automation.alarm"
+        assert pages[2][0]["context_service"] == "turn_off"
+        assert pages[3][0]["context_service"] == "turn_off"
+
+        # Paginating a filtered logbook
+        page = await _async_fetch_logbook(
+            client, {**params, "limit": 1, "entity": "light.kitchen"}
+        )
+        assert [entry["name"] for entry in page["entries"]] == ["first"]
+        page = await _async_fetch_logbook(
+            client,
+            {
+                **params,
+                "limit": 1,
+                "entity": "light.kitchen",
+                "cursor": page["next_cursor"],
+            },
+        )
+        assert [entry["name"] for entry in page["entries"]] == ["second"]
+        assert page["next_cursor"] is None
+
+    # Large limits are clamped
+    with patch.object(logbook, "MAX_PAGE_LIMIT", 1):
+        page = await _async_fetch_logbook(client, {**params, "limit": 100000000})
+        assert page["entries"] == entries[:2]
+        assert page["next_cursor"] is not None
+
+    for invalid in (
+        {"limit": 0},
+        {"limit": "one"},
+        {"limit": 1, "cursor": "bad"},
+        {"limit": 1, "cursor": "123_0"},
+    ):
+        response = await client.get("/api/logbook", params=invalid)
+        assert response.status == 400
+
+
 async def _async_fetch_logbook(client, params=None):
     if params is None:
         params = {}
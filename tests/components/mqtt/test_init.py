@@ -332,6 +332,58 @@ async def test_subscribe_topic(hass, mqtt_mock, calls, record_calls):
     assert len(calls) == 1
 
 
+async def test_handle_messages_in_batches(hass, mqtt_mock, calls, record_calls):
+    """Test messages from the client thread are handled in one batch in order."""
+    await mqtt.async_subscribe(hass, "test-topic/#", record_calls)
+    mqtt_client = mqtt_mock()
+
+    with patch.object(
+        hass.loop, "call_soon_threadsafe", wraps=hass.loop.call_soon_threadsafe
+    ) as mock_call_soon:
+        for idx in range(3):
+            mqtt_client._mqtt_on_message(
+                None, None, mqtt.Message(f"test-topic/{idx}", b"payload", 0, False)
+            )
+        assert mock_call_soon.call_count == 1
+
+    await hass.async_block_till_done()
+    assert [args[0].topic for args in calls] == [
+        "test-topic/0",
+        "test-topic/1",
+        "test-topic/2",
+    ]
+    assert mqtt_client.batch_metrics.batches == 1
+    assert mqtt_client.batch_metrics.messages == 3
+    assert mqtt_client.batch_metrics.last_batch_size == 3
+
+
+async def test_failing_subscriber_does_not_drop_batch(
+    hass, mqtt_mock, calls, record_calls, caplog
+):
+    """Test a subscriber that raises does not drop the rest of the batch."""
+
+    @callback
+    def raise_error(msg):
+        raise ValueError("bad subscriber")
+
+    await mqtt.async_subscribe(hass, "bad-topic", raise_error)
+    await mqtt.async_subscribe(hass, "test-topic", record_calls)
+    mqtt_client = mqtt_mock()
+
+    mqtt_client._mqtt_on_message(
+        None, None, mqtt.Message("bad-topic", b"payload", 0, False)
+    )
+    mqtt_client._mqtt_on_message(
+        None, None, mqtt.Message("test-topic", b"payload", 0, False)
+    )
+    await hass.async_block_till_done()
+
+    assert [args[0].topic for args in calls] == ["test-topic"]
+    assert "Error handling message on bad-topic" in caplog.text
+    assert mqtt_client.batch_metrics.batches == 1
+    assert mqtt_client.batch_metrics.messages == 2
+
+
 async def test_subscribe_deprecated(hass, mqtt_mock):
     """Test the subscription of a topic using deprecated callback signature."""
     calls = []
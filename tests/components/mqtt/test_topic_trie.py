@@ -0,0 +1,63 @@
+"""Test the MQTT topic trie."""
+import pytest
+
+from homeassistant.components.mqtt.topic_trie import TopicTrie
+
+
+@pytest.mark.parametrize(
+    "topic_filter,topic,matches",
+    [
+        ("a/b/c", "a/b/c", True),
+        ("a/b/c", "a/b", False),
+        ("a/b", "a/b/c", False),
+        ("a/+/c", "a/b/c", True),
+        ("a/+/c", "a/b/d", False),
+        ("+/+", "a/b", True),
+        ("+", "a/b", False),
+        ("a/#", "a/b/c", True),
+        ("a/#", "a", True),
+        ("#", "a/b/c", True),
+        ("a/+/#", "a/b", True),
+        ("/+", "/finance", True),
+        ("+", "/finance", False),
+        ("#", "$SYS/broker", False),
+        ("+/broker", "$SYS/broker", False),
+        ("$SYS/#", "$SYS/broker", True),
+        ("$SYS/+", "$SYS/broker", True),
+    ],
+)
+def test_match(topic_filter, topic, matches):
+    """Test wildcards follow the MQTT specification."""
+    trie = TopicTrie()
+    trie.add(topic_filter, "value")
+    assert trie.match(topic) == (["value"] if matches else [])
+
+
+def test_add_remove():
+    """Test values are shared per filter and removed again."""
+    trie = TopicTrie()
+    trie.add("a/b", 1)
+    trie.add("a/b", 2)
+    trie.add("a/+", 3)
+    trie.add("a/b/#", 4)
+
+    assert "a/b" in trie
+    assert "a" not in trie
+    assert sorted(trie.match("a/b")) == [1, 2, 3, 4]
+
+    trie.remove("a/b", 1)
+    assert sorted(trie.match("a/b")) == [2, 3, 4]
+    trie.remove("a/b", 2)
+    assert "a/b" not in trie
+    assert sorted(trie.match("a/b")) == [3, 4]
+
+    with pytest.raises(KeyError):
+        trie.remove("a/b", 2)
+    with pytest.raises(KeyError):
+        trie.remove("x/y", 2)
+
+    trie.remove("a/b/#", 4)
+    trie.remove("a/+", 3)
+    assert trie.match("a/b") == []
+    # Empty levels are pruned
+    assert not trie._root.children
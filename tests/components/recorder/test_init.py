@@ -1,7 +1,7 @@
 """The tests for the Recorder component."""
 # pylint: disable=protected-access
 from datetime import datetime, timedelta
-from unittest.mock import patch
+from unittest.mock import Mock, patch
 
 from sqlalchemy.exc import OperationalError
 
@@ -19,7 +19,13 @@ from homeassistant.components.recorder import (
     run_information_from_instance,
     run_information_with_session,
 )
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.const import MAX_ROWS_PER_INSERT
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import (
     EVENT_HOMEASSISTANT_STOP,
@@ -100,17 +106,13 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     state = "restoring_from_db"
     attributes = {"test_attr": 5, "test_attr_10": "nice"}
 
-    def _throw_if_state_in_session(*args, **kwargs):
-        for obj in hass.data[DATA_INSTANCE].event_session:
-            if isinstance(obj, States):
-                raise OperationalError(
-                    "insert the state", "fake params", "forced to fail"
-                )
+    def _throw_if_state_pending(*args, **kwargs):
+        raise OperationalError("insert the state", "fake params", "forced to fail")
 
     with patch("time.sleep"), patch.object(
-        hass.data[DATA_INSTANCE].event_session,
-        "flush",
-        side_effect=_throw_if_state_in_session,
+        hass.data[DATA_INSTANCE],
+        "_insert_pending_states",
+        side_effect=_throw_if_state_pending,
     ):
         hass.states.set(entity_id, "fail", attributes)
         wait_recording_done(hass)
@@ -130,6 +132,75 @@ def test_saving_state_with_exception(hass, hass_recorder, caplog):
     assert "Error saving events" not in caplog.text
 
 
+def test_failed_write_keeps_other_session_objects(hass_recorder):
+    """Test a failed row write only discards the rows of the batch."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    run = RecorderRuns(start=dt_util.utcnow(), created=dt_util.utcnow())
+    write_pending_rows = instance._write_pending_rows
+    insert_pending_states = instance._insert_pending_states
+    calls = []
+
+    def _add_run_and_write():
+        if not calls:
+            instance.event_session.add(run)
+        write_pending_rows()
+
+    def _throw_once(*args):
+        calls.append(args)
+        if len(calls) == 1:
+            raise OperationalError("insert the state", "fake params", "forced to fail")
+        insert_pending_states(*args)
+
+    with patch("time.sleep"), patch.object(
+        instance, "_write_pending_rows", side_effect=_add_run_and_write
+    ), patch.object(instance, "_insert_pending_states", side_effect=_throw_once):
+        hass.states.set("test.one", "on", {})
+        wait_recording_done(hass)
+
+    assert len(calls) == 2
+    with session_scope(hass=hass) as session:
+        assert session.query(RecorderRuns).filter_by(run_id=run.run_id).count() == 1
+        assert session.query(States).filter_by(entity_id="test.one").count() == 1
+
+
+def test_failed_commit_keeps_pending_rows(hass_recorder):
+    """Test rows are kept and written again when the commit fails."""
+    hass = hass_recorder()
+    instance = hass.data[DATA_INSTANCE]
+    hass.states.set("test.one", "on", {"color": "red"})
+    wait_recording_done(hass)
+
+    session = instance.event_session
+    commit = session.commit
+    calls = []
+
+    def _fail_once():
+        calls.append(None)
+        if len(calls) == 1:
+            # A failed commit rolls back the whole transaction
+            session.rollback()
+            raise OperationalError("commit", "fake params", "forced to fail")
+        commit()
+
+    with patch("time.sleep"), patch.object(session, "commit", side_effect=_fail_once):
+        hass.states.set("test.one", "off", {"color": "blue"})
+        wait_recording_done(hass)
+
+    assert len(calls) >= 2
+    with session_scope(hass=hass) as session:
+        on, off = session.query(States).order_by(States.state_id)
+        assert (on.state, off.state) == ("on", "off")
+        assert off.old_state_id == on.state_id
+        assert session.query(Events).filter_by(event_id=off.event_id).count() == 1
+        attributes = (
+            session.query(StateAttributes)
+            .filter_by(attributes_id=off.attributes_id)
+            .one()
+        )
+        assert attributes.shared_attrs == '{"color": "blue"}'
+
+
 def test_saving_event(hass, hass_recorder):
     """Test saving and restoring an event."""
     hass = hass_recorder()
@@ -364,6 +435,7 @@ def test_recorder_setup_failure():
             auto_purge=True,
             keep_days=7,
             commit_interval=1,
+            max_queue_backlog=30000,
             uri="sqlite://",
             db_max_retries=10,
             db_retry_wait=3,
@@ -477,6 +549,72 @@ def test_saving_sets_old_state(hass_recorder):
         assert states[3].old_state_id == states[1].state_id
 
 
+def test_saving_sets_old_state_in_same_commit(hass_recorder):
+    """Test saving links old states that are written in the same commit."""
+    hass = hass_recorder()
+
+    for idx in range(MAX_ROWS_PER_INSERT + 5):
+        hass.states.set("test.one", str(idx), {})
+        hass.bus.fire("test_event")
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States).order_by(States.state_id))
+        assert len(states) == MAX_ROWS_PER_INSERT + 5
+        assert states[0].old_state_id is None
+        for idx, state in enumerate(states[1:], 1):
+            assert state.state == str(idx)
+            assert state.old_state_id == states[idx - 1].state_id
+
+        events = {
+            event.event_id: event
+            for event in session.query(Events).filter_by(event_type="state_changed")
+        }
+        assert len(events) == MAX_ROWS_PER_INSERT + 5
+        for state in states:
+            assert events[state.event_id].time_fired == state.last_updated
+
+        assert session.query(Events).filter_by(event_type="test_event").count() == (
+            MAX_ROWS_PER_INSERT + 5
+        )
+
+
+def test_saving_state_shares_attributes(hass_recorder):
+    """Test states with identical attributes share one attributes row."""
+    hass = hass_recorder()
+
+    attributes = {"test_attr": 5, "test_attr_10": "nice"}
+    hass.states.set("test.one", "on", attributes)
+    hass.states.set("test.two", "on", attributes)
+    wait_recording_done(hass)
+    hass.states.set("test.one", "off", attributes)
+    hass.states.set("test.two", "off", {"test_attr": 6})
+    hass.states.set("test.two", "on", {"test_attr": 6})
+    wait_recording_done(hass)
+    # Identical attributes are found in the database once they
+    # are no longer cached
+    hass.data[DATA_INSTANCE]._state_attributes.clear()
+    hass.states.set("test.three", "on", attributes)
+    wait_recording_done(hass)
+
+    with session_scope(hass=hass) as session:
+        states = list(session.query(States).order_by(States.state_id))
+        assert len(states) == 6
+        assert [state.attributes for state in states] == [None] * 6
+        assert (
+            states[0].attributes_id
+            == states[1].attributes_id
+            == states[2].attributes_id
+            == states[5].attributes_id
+        )
+        assert states[3].attributes_id == states[4].attributes_id
+        assert states[3].attributes_id != states[0].attributes_id
+        assert session.query(StateAttributes).count() == 2
+
+        assert states[0].to_native().attributes == attributes
+        assert states[4].to_native().attributes == {"test_attr": 6}
+
+
 def test_saving_state_with_serializable_data(hass_recorder, caplog):
     """Test saving data that cannot be serialized does not crash."""
     hass = hass_recorder()
@@ -731,3 +869,31 @@ async def test_database_corruption_while_running(hass, tmpdir, caplog):
     hass.bus.async_fire(EVENT_HOMEASSISTANT_STOP)
     await hass.async_block_till_done()
     hass.stop()
+
+
+async def test_queue_backlog_limit(hass, async_setup_recorder_instance, caplog):
+    """Test events are dropped while the queue backlog is over the limit."""
+    instance = await async_setup_recorder_instance(hass, {"max_queue_backlog": 10})
+
+    with patch.object(instance, "queue", Mock(qsize=Mock(return_value=10))):
+        hass.states.async_set("test.dropped", "on", {})
+        await hass.async_block_till_done()
+        assert instance.metrics.events_dropped == 1
+        assert instance.async_get_info()["backlog_exceeded"] is True
+
+    assert "The recorder queue reached the maximum size of 10" in caplog.text
+
+    # Recording resumes only once half of the backlog is written
+    with patch.object(instance, "queue", Mock(qsize=Mock(return_value=5))):
+        hass.states.async_set("test.dropped", "off", {})
+        await hass.async_block_till_done()
+        assert instance.metrics.events_dropped == 2
+
+    hass.states.async_set("test.recorded", "on", {})
+    await async_wait_recording_done(hass, instance)
+
+    assert "Recording resumed after 2 events were dropped" in caplog.text
+    with session_scope(hass=hass) as session:
+        db_states = list(session.query(States))
+        assert len(db_states) == 1
+        assert db_states[0].entity_id == "test.recorded"
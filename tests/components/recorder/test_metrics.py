@@ -0,0 +1,22 @@
+"""The tests for the recorder metrics."""
+from unittest.mock import patch
+
+from homeassistant.components.recorder.metrics import RATE_WINDOW, RecorderMetrics
+
+
+def test_rows_per_second_decays_when_idle():
+    """Test the write rate is computed when read and drops to zero when idle."""
+    with patch("time.monotonic", return_value=100.0):
+        metrics = RecorderMetrics()
+
+    with patch("time.monotonic", return_value=100.0 + RATE_WINDOW):
+        metrics.commit_done(0.1, 50)
+        assert metrics.rows_per_second() == 50 / RATE_WINDOW
+        assert metrics.as_dict(0)["rows_per_second"] == 5.0
+
+    with patch("time.monotonic", return_value=100.0 + RATE_WINDOW * 1.5):
+        assert metrics.rows_per_second() == 50 / RATE_WINDOW
+
+    with patch("time.monotonic", return_value=100.0 + RATE_WINDOW * 3):
+        assert metrics.rows_per_second() == 0.0
+        assert metrics.as_dict(0)["rows_per_second"] == 0.0
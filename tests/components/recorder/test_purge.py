@@ -5,7 +5,12 @@ import json
 from sqlalchemy.orm.session import Session
 
 from homeassistant.components import recorder
-from homeassistant.components.recorder.models import Events, RecorderRuns, States
+from homeassistant.components.recorder.models import (
+    Events,
+    RecorderRuns,
+    StateAttributes,
+    States,
+)
 from homeassistant.components.recorder.purge import purge_old_data
 from homeassistant.components.recorder.util import session_scope
 from homeassistant.const import EVENT_STATE_CHANGED
@@ -52,6 +57,49 @@ async def test_purge_old_states(
         assert states.count() == 2
 
 
+async def test_purge_old_state_attributes(
+    hass: HomeAssistantType, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test deleting state attributes that are no longer used."""
+    instance = await async_setup_recorder_instance(hass)
+
+    utcnow = dt_util.utcnow()
+    eleven_days_ago = utcnow - timedelta(days=11)
+
+    with recorder.session_scope(hass=hass) as session:
+        shared = StateAttributes(shared_attrs='{"shared": true}')
+        purged = StateAttributes(shared_attrs='{"purged": true}')
+        session.add_all([shared, purged])
+        session.flush()
+        for event_id, (timestamp, attributes) in enumerate(
+            (
+                (eleven_days_ago, shared),
+                (eleven_days_ago, purged),
+                (utcnow, shared),
+            ),
+            1000,
+        ):
+            _add_state_and_state_changed_event(
+                session, "sensor.test", "on", timestamp, event_id
+            )
+            session.flush()
+            session.query(States).filter(States.event_id == event_id).update(
+                {"attributes": None, "attributes_id": attributes.attributes_id}
+            )
+
+    with session_scope(hass=hass) as session:
+        assert session.query(StateAttributes).count() == 2
+
+        finished = purge_old_data(instance, 4, repack=False)
+        assert not finished
+
+        state_attributes = session.query(StateAttributes).all()
+        assert len(state_attributes) == 1
+        assert state_attributes[0].shared_attrs == '{"shared": true}'
+        state = session.query(States).one()
+        assert state.to_native().attributes == {"shared": True}
+
+
 async def test_purge_old_events(
     hass: HomeAssistantType, async_setup_recorder_instance: SetupRecorderInstanceT
 ):
@@ -0,0 +1,286 @@
+"""Test long-term statistics."""
+from datetime import datetime, timedelta
+from unittest.mock import patch
+
+from sqlalchemy.exc import OperationalError
+
+from homeassistant.components.recorder import StatisticsTask, statistics
+from homeassistant.components.recorder.models import States, Statistics
+from homeassistant.components.recorder.statistics import (
+    _compile_statistic,
+    compile_statistics,
+    statistics_during_period,
+)
+from homeassistant.components.recorder.util import session_scope
+from homeassistant.helpers.typing import HomeAssistantType
+from homeassistant.util import dt as dt_util
+
+from .common import async_wait_recording_done
+from .conftest import SetupRecorderInstanceT
+
+START = datetime(2021, 5, 1, 10, 0, tzinfo=dt_util.UTC)
+
+
+def test_compile_statistic_time_weighted():
+    """Test the mean is weighted by how long each value was held."""
+    stat = _compile_statistic(
+        START,
+        10.0,
+        [
+            (START + timedelta(minutes=15), 20.0),
+            (START + timedelta(minutes=45), 4.0),
+        ],
+        True,
+    )
+    assert stat == {
+        "mean": (10.0 * 15 + 20.0 * 30 + 4.0 * 15) / 60,
+        "min": 4.0,
+        "max": 20.0,
+        "state": 4.0,
+        "sum": 10.0 + 4.0,
+    }
+
+
+def test_compile_statistic_sum_only_accumulating():
+    """Test the sum is only compiled for sensors that accumulate."""
+    stat = _compile_statistic(
+        START,
+        -5.0,
+        [(START + timedelta(minutes=30), -10.0)],
+        False,
+    )
+    assert stat == {
+        "mean": -7.5,
+        "min": -10.0,
+        "max": -5.0,
+        "state": -10.0,
+        "sum": None,
+    }
+
+
+def test_compile_statistic_skips_non_numeric():
+    """Test non-numeric states are not part of the statistic."""
+    assert _compile_statistic(START, None, [(START, None)], True) is None
+
+    stat = _compile_statistic(
+        START,
+        None,
+        [
+            (START + timedelta(minutes=30), 2.0),
+            (START + timedelta(minutes=40), None),
+        ],
+        True,
+    )
+    assert stat == {"mean": 2.0, "min": 2.0, "max": 2.0, "state": None, "sum": 0.0}
+
+
+async def test_compile_statistics(
+    hass: HomeAssistantType, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test statistics are compiled per hour and carried forward."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+
+    def _add_states():
+        with session_scope(hass=hass) as session:
+            for minutes, entity_id, state in (
+                (0, "sensor.power", "100"),
+                (30, "sensor.power", "200"),
+                (0, "sensor.energy", "10"),
+                (30, "sensor.energy", "5"),
+                (10, "sensor.text", "unknown"),
+                (20, "light.kitchen", "50"),
+            ):
+                timestamp = START + timedelta(minutes=minutes)
+                session.add(
+                    States(
+                        entity_id=entity_id,
+                        domain=entity_id.split(".")[0],
+                        state=state,
+                        attributes="{}",
+                        last_changed=timestamp,
+                        last_updated=timestamp,
+                    )
+                )
+
+    await hass.async_add_executor_job(_add_states)
+    # Only the sum of sensors that accumulate is compiled
+    hass.states.async_set("sensor.energy", "5", {"unit_of_measurement": "kWh"})
+
+    instance.queue.put(StatisticsTask(START))
+    instance.queue.put(StatisticsTask(START + timedelta(hours=1)))
+    await async_wait_recording_done(hass, instance)
+
+    stats = await hass.async_add_executor_job(statistics_during_period, hass, START)
+    assert list(stats) == ["sensor.energy", "sensor.power"]
+    assert stats["sensor.energy"] == [
+        {
+            "statistic_id": "sensor.energy",
+            "start": START.isoformat(),
+            "mean": 7.5,
+            "min": 5.0,
+            "max": 10.0,
+            "state": 5.0,
+            "sum": 5.0,
+        },
+        {
+            "statistic_id": "sensor.energy",
+            "start": (START + timedelta(hours=1)).isoformat(),
+            "mean": 5.0,
+            "min": 5.0,
+            "max": 5.0,
+            "state": 5.0,
+            "sum": 0.0,
+        },
+    ]
+    assert stats["sensor.power"] == [
+        {
+            "statistic_id": "sensor.power",
+            "start": START.isoformat(),
+            "mean": 150.0,
+            "min": 100.0,
+            "max": 200.0,
+            "state": 200.0,
+            "sum": None,
+        },
+        {
+            "statistic_id": "sensor.power",
+            "start": (START + timedelta(hours=1)).isoformat(),
+            "mean": 200.0,
+            "min": 200.0,
+            "max": 200.0,
+            "state": 200.0,
+            "sum": None,
+        },
+    ]
+
+    # Compiling an hour twice does not duplicate rows
+    await hass.async_add_executor_job(compile_statistics, instance, START)
+    with session_scope(hass=hass) as session:
+        assert session.query(Statistics).count() == 4
+
+    stats = await hass.async_add_executor_job(
+        statistics_during_period,
+        hass,
+        START,
+        START + timedelta(hours=1),
+        ["sensor.power"],
+    )
+    assert len(stats["sensor.power"]) == 1
+
+    # After downtime the sensor continues from its last state
+    instance.queue.put(StatisticsTask(START + timedelta(hours=5)))
+    await async_wait_recording_done(hass, instance)
+    stats = await hass.async_add_executor_job(
+        statistics_during_period, hass, START + timedelta(hours=5)
+    )
+    assert stats["sensor.power"] == [
+        {
+            "statistic_id": "sensor.power",
+            "start": (START + timedelta(hours=5)).isoformat(),
+            "mean": 200.0,
+            "min": 200.0,
+            "max": 200.0,
+            "state": 200.0,
+            "sum": None,
+        },
+    ]
+
+
+async def test_compile_statistics_retried_after_error(
+    hass: HomeAssistantType, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test a period that failed to compile is compiled again."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+
+    def _add_state():
+        with session_scope(hass=hass) as session:
+            session.add(
+                States(
+                    entity_id="sensor.power",
+                    domain="sensor",
+                    state="100",
+                    attributes="{}",
+                    last_changed=START,
+                    last_updated=START,
+                )
+            )
+
+    await hass.async_add_executor_job(_add_state)
+
+    last_states_before = statistics._last_states_before
+    calls = []
+
+    def _fail_once(*args):
+        calls.append(args)
+        if len(calls) == 1:
+            raise OperationalError("statement", "params", "forced to fail")
+        return last_states_before(*args)
+
+    with patch("time.sleep"), patch.object(
+        statistics, "_last_states_before", side_effect=_fail_once
+    ):
+        instance.queue.put(StatisticsTask(START + timedelta(hours=1)))
+        await async_wait_recording_done(hass, instance)
+        # The retry is queued behind the first wait
+        await async_wait_recording_done(hass, instance)
+
+    assert len(calls) == 2
+    stats = await hass.async_add_executor_job(statistics_during_period, hass, START)
+    assert stats["sensor.power"][0]["state"] == 100.0
+
+
+async def test_compile_statistics_gives_up(
+    hass: HomeAssistantType,
+    async_setup_recorder_instance: SetupRecorderInstanceT,
+    caplog,
+):
+    """Test a period that keeps failing to compile is given up."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+    instance.db_max_retries = 2
+    calls = []
+
+    def _fail(*args):
+        calls.append(args)
+        raise OperationalError("statement", "params", "forced to fail")
+
+    with patch("time.sleep"), patch.object(
+        statistics, "_last_states_before", side_effect=_fail
+    ):
+        instance.queue.put(StatisticsTask(START))
+        for _ in range(3):
+            await async_wait_recording_done(hass, instance)
+
+    assert len(calls) == 2
+    assert "Giving up compiling statistics" in caplog.text
+
+
+async def test_compile_statistics_last_state_window(
+    hass: HomeAssistantType, async_setup_recorder_instance: SetupRecorderInstanceT
+):
+    """Test sensors only continue from states within keep_days."""
+    instance = await async_setup_recorder_instance(hass)
+    await async_wait_recording_done(hass, instance)
+
+    def _add_state():
+        with session_scope(hass=hass) as session:
+            timestamp = START - timedelta(days=instance.keep_days, hours=1)
+            session.add(
+                States(
+                    entity_id="sensor.power",
+                    domain="sensor",
+                    state="100",
+                    attributes="{}",
+                    last_changed=timestamp,
+                    last_updated=timestamp,
+                )
+            )
+
+    await hass.async_add_executor_job(_add_state)
+    instance.queue.put(StatisticsTask(START))
+    await async_wait_recording_done(hass, instance)
+
+    stats = await hass.async_add_executor_job(statistics_during_period, hass, START)
+    assert stats == {}
@@ -185,6 +185,10 @@ def test_basic_sanity_check(hass_recorder):
 
     assert util.basic_sanity_check(cursor) is True
 
+    # Tables added by later schema versions are not required
+    cursor.execute("DROP TABLE state_attributes;")
+    assert util.basic_sanity_check(cursor) is True
+
     cursor.execute("DROP TABLE states;")
 
     with pytest.raises(sqlite3.DatabaseError):
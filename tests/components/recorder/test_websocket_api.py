@@ -0,0 +1,46 @@
+"""The tests for the recorder websocket API."""
+from homeassistant.setup import async_setup_component
+
+from .common import async_wait_recording_done
+
+from tests.common import async_init_recorder_component
+
+
+async def test_recorder_info(hass, hass_ws_client):
+    """Test getting recorder status."""
+    await async_init_recorder_component(hass)
+    assert await async_setup_component(hass, "websocket_api", {})
+    instance = hass.data["recorder_instance"]
+
+    hass.states.async_set("test.one", "on", {})
+    hass.bus.async_fire("test_event")
+    await async_wait_recording_done(hass, instance)
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "recorder/info"})
+    response = await client.receive_json()
+
+    assert response["success"]
+    info = response["result"]
+    assert info["backlog"] == 0
+    assert info["max_backlog"] == 30000
+    assert info["backlog_exceeded"] is False
+    assert info["recording"] is True
+    assert info["thread_running"] is True
+    assert info["events_dropped"] == 0
+    assert info["rows_written"] >= 2
+    assert info["commits"] >= 1
+
+
+async def test_recorder_info_requires_admin(hass, hass_ws_client, hass_admin_user):
+    """Test recorder status is only available to admins."""
+    hass_admin_user.groups = []
+    await async_init_recorder_component(hass)
+    assert await async_setup_component(hass, "websocket_api", {})
+
+    client = await hass_ws_client(hass)
+    await client.send_json({"id": 1, "type": "recorder/info"})
+    response = await client.receive_json()
+
+    assert not response["success"]
+    assert response["error"]["code"] == "unauthorized"
@@ -1,4 +1,6 @@
 """Tests for WebSocket API commands."""
+from datetime import timedelta
+
 from async_timeout import timeout
 import voluptuous as vol
 
@@ -15,8 +17,14 @@ from homeassistant.helpers import entity
 from homeassistant.helpers.typing import HomeAssistantType
 from homeassistant.loader import async_get_integration
 from homeassistant.setup import async_setup_component
+import homeassistant.util.dt as dt_util
 
-from tests.common import MockEntity, MockEntityPlatform, async_mock_service
+from tests.common import (
+    MockEntity,
+    MockEntityPlatform,
+    async_fire_time_changed,
+    async_mock_service,
+)
 
 
 async def test_call_service(hass, websocket_client):
@@ -311,6 +319,116 @@ async def test_subscribe_unsubscribe_events(hass, websocket_client):
     assert sum(hass.bus.async_listeners().values()) == init_count
 
 
+async def test_subscribe_states(hass, websocket_client):
+    """Test subscribing to the states of entities and domains."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100})
+    hass.states.async_set("switch.fan", "off")
+    hass.states.async_set("sensor.temperature", "20", {"unit": "C"})
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "subscribe_states",
+            "entity_ids": ["switch.fan"],
+            "domains": ["light"],
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["type"] == "event"
+    assert set(msg["event"]) == {"light.kitchen", "switch.fan"}
+    assert msg["event"]["light.kitchen"]["attributes"] == {"brightness": 100}
+
+    hass.states.async_set("sensor.temperature", "21")
+    hass.states.async_set("light.bedroom", "on")
+    await hass.async_block_till_done()
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]) == ["light.bedroom"]
+
+    hass.states.async_remove("switch.fan")
+    await hass.async_block_till_done()
+    msg = await websocket_client.receive_json()
+    assert msg["event"] == {"switch.fan": None}
+
+    await websocket_client.send_json(
+        {"id": 6, "type": "unsubscribe_events", "subscription": 5}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["success"]
+
+
+async def test_subscribe_states_domains_lowercased(hass, websocket_client):
+    """Test the domains to subscribe to are lowercased."""
+    hass.states.async_set("light.kitchen", "on")
+
+    await websocket_client.send_json(
+        {"id": 5, "type": "subscribe_states", "domains": ["Light"]}
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert list(msg["event"]) == ["light.kitchen"]
+
+
+async def test_subscribe_states_attributes_and_interval(hass, websocket_client):
+    """Test subscribing to attributes with a minimum interval."""
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100, "other": 1})
+
+    await websocket_client.send_json(
+        {
+            "id": 5,
+            "type": "subscribe_states",
+            "entity_ids": ["light.kitchen", "light.bedroom"],
+            "attributes": ["brightness"],
+            "min_interval": 10,
+        }
+    )
+
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    msg = await websocket_client.receive_json()
+    assert msg["event"]["light.kitchen"]["state"] == "on"
+    assert msg["event"]["light.kitchen"]["attributes"] == {"brightness": 100}
+
+    # Changes of other attributes are not sent
+    hass.states.async_set("light.kitchen", "on", {"brightness": 100, "other": 2})
+    # Changes within the interval are coalesced
+    hass.states.async_set("light.kitchen", "on", {"brightness": 50, "other": 2})
+    hass.states.async_set("light.kitchen", "on", {"brightness": 20, "other": 2})
+    hass.states.async_set("light.bedroom", "off")
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=11))
+    await hass.async_block_till_done()
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert msg["event"]["light.kitchen"]["attributes"] == {"brightness": 20}
+    assert msg["event"]["light.bedroom"]["state"] == "off"
+
+    await websocket_client.send_json({"id": 6, "type": "ping"})
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+
+
+async def test_subscribe_states_requires_filter(hass, websocket_client):
+    """Test subscribing to states requires entity ids or domains."""
+    await websocket_client.send_json({"id": 5, "type": "subscribe_states"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 5
+    assert not msg["success"]
+    assert msg["error"]["code"] == const.ERR_INVALID_FORMAT
+
+
 async def test_get_states(hass, websocket_client):
     """Test get_states command."""
     hass.states.async_set("greeting.hello", "world")
@@ -772,6 +890,20 @@ async def test_manifest_list(hass, websocket_client):
     ]
 
 
+async def test_integration_import_times(hass, websocket_client):
+    """Test getting the import times of the loaded integrations."""
+    websocket_api = await async_get_integration(hass, "websocket_api")
+
+    await websocket_client.send_json({"id": 6, "type": "integration/import_times"})
+
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 6
+    assert msg["type"] == const.TYPE_RESULT
+    assert msg["success"]
+    assert msg["result"]["websocket_api"] == websocket_api.import_times
+    assert "websocket_api" in msg["result"]["websocket_api"]
+
+
 async def test_manifest_get(hass, websocket_client):
     """Test getting a manifest."""
     hue = await async_get_integration(hass, "hue")
@@ -1,4 +1,5 @@
 """Test Websocket API http module."""
+import asyncio
 from datetime import timedelta
 from unittest.mock import patch
 
@@ -80,3 +81,103 @@ async def test_non_json_message(hass, websocket_client, caplog):
         f"Unable to serialize to JSON. Bad data found at $.result[0](State: test_domain.entity).attributes.bad={bad_data}(<class 'object'>"
         in caplog.text
     )
+
+
+async def test_coalesce_messages(hass, hass_ws_client):
+    """Test messages queued together are written in one frame."""
+    websocket_client = await hass_ws_client()
+
+    await websocket_client.send_json(
+        {
+            "id": 1,
+            "type": "supported_features",
+            "features": {const.FEATURE_COALESCE_MESSAGES: 1},
+        }
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["id"] == 1
+    assert msg["success"]
+
+    await websocket_client.send_json(
+        {"id": 2, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    await websocket_client.send_json({"id": 3, "type": "connection/info"})
+    info = (await websocket_client.receive_json())["result"]
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+    await hass.async_block_till_done()
+
+    msg = await websocket_client.receive_json()
+    assert [(item["id"], item["event"]["data"]) for item in msg] == [
+        (2, {"idx": 0}),
+        (2, {"idx": 1}),
+        (2, {"idx": 2}),
+    ]
+
+    await websocket_client.send_json({"id": 4, "type": "connection/info"})
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+    assert msg["result"]["frames_sent"] == info["frames_sent"] + 2
+    assert msg["result"]["messages_sent"] == info["messages_sent"] + 4
+    assert msg["result"]["peak_pending"] >= 3
+    assert msg["result"]["pending_messages"] == 0
+
+
+async def test_no_coalesce_without_support(hass, websocket_client):
+    """Test messages are written one per frame unless the client opts in."""
+    await websocket_client.send_json(
+        {"id": 1, "type": "subscribe_events", "event_type": "test_event"}
+    )
+    msg = await websocket_client.receive_json()
+    assert msg["success"]
+
+    for idx in range(3):
+        hass.bus.async_fire("test_event", {"idx": idx})
+    await hass.async_block_till_done()
+
+    for idx in range(3):
+        msg = await websocket_client.receive_json()
+        assert msg["id"] == 1
+        assert msg["event"]["data"] == {"idx": idx}
+
+
+async def test_backlog_stays_queued_without_coalesce(hass, hass_ws_client):
+    """Test the backlog of a client that can't coalesce is counted as pending."""
+    orig_handler = http.WebSocketHandler
+    instance = None
+
+    def instantiate_handler(*args):
+        nonlocal instance
+        instance = orig_handler(*args)
+        return instance
+
+    with patch(
+        "homeassistant.components.websocket_api.http.WebSocketHandler",
+        instantiate_handler,
+    ):
+        websocket_client = await hass_ws_client()
+
+    release = asyncio.Event()
+    send_str = instance.wsock.send_str
+
+    async def slow_send_str(data):
+        await release.wait()
+        await send_str(data)
+
+    with patch.object(instance.wsock, "send_str", slow_send_str):
+        for idx in range(3):
+            instance._send_message({"id": idx})
+        for _ in range(3):
+            await asyncio.sleep(0)
+
+        # One message is being written, the others wait in the queue
+        assert instance.pending_messages == 2
+
+        release.set()
+        for idx in range(3):
+            msg = await websocket_client.receive_json()
+            assert msg == {"id": idx}
@@ -200,6 +200,24 @@ async def test_list_devices(zha_client):
         assert device == device2
 
 
+async def test_device_initialization(hass, zha_client):
+    """Test getting the progress of the device initialization."""
+    gateway = hass.data[DATA_ZHA][DATA_ZHA_GATEWAY]
+    await gateway.async_initialize_devices_and_entities()
+    await hass.async_block_till_done()
+
+    await zha_client.send_json({ID: 5, TYPE: "zha/devices/initialization"})
+    msg = await zha_client.receive_json()
+
+    status = msg["result"]
+    assert status["cached_devices"] == len(gateway.devices)
+    assert status["cache_load_time"] is not None
+    assert status["refresh_done"] == status["refresh_total"]
+    assert status["refresh_time"] is not None
+    assert status["refreshing"] is False
+    assert status["refresh_concurrency"] >= 1
+
+
 async def test_device_not_found(zha_client):
     """Test not found response from get device API."""
     await zha_client.send_json(
@@ -10,6 +10,7 @@ import zigpy.zcl.clusters.lighting as lighting
 
 from homeassistant.components.light import DOMAIN as LIGHT_DOMAIN
 from homeassistant.components.zha.core.group import GroupMember
+from homeassistant.components.zha.core.helpers import AdaptiveLimiter
 from homeassistant.components.zha.core.store import TOMBSTONE_LIFETIME
 
 from .common import async_enable_traffic, async_find_group_entity_id, get_zha_gateway
@@ -233,3 +234,34 @@ async def test_cleaning_up_storage(hass, zigpy_dev_basic, zha_dev_basic, hass_st
     await zha_gateway.zha_storage.async_save()
     await hass.async_block_till_done()
     assert not hass_storage["zha.storage"]["data"]["devices"]
+
+
+async def test_adaptive_limiter():
+    """Test the refresh concurrency adapts to latency and errors."""
+    limiter = AdaptiveLimiter(2, 1, 4, target_latency=5, smoothing=1)
+
+    await limiter.acquire()
+    await limiter.acquire()
+    waiter = asyncio.create_task(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+
+    # Fast successful requests raise the limit and wake up waiters
+    limiter.release(1, True)
+    assert limiter.limit == 3
+    await waiter
+    limiter.release(1, True)
+    limiter.release(1, True)
+    assert limiter.limit == 4
+
+    # Slow requests lower the limit, failures halve it
+    await limiter.acquire()
+    limiter.release(10, True)
+    assert limiter.limit == 3
+    await limiter.acquire()
+    limiter.release(1, False)
+    assert limiter.limit == 1
+    await limiter.acquire()
+    limiter.release(1, False)
+    assert limiter.limit == 1
+    assert limiter.latency == 1
@@ -384,6 +384,54 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_indexed(hass, registry):
+    """Test devices are found by area and config entry after changes."""
+    device1 = registry.async_get_or_create(
+        config_entry_id="entry-1", identifiers={("bridgeid", "0123")}
+    )
+    device2 = registry.async_get_or_create(
+        config_entry_id="entry-2", identifiers={("bridgeid", "4567")}
+    )
+    device2 = registry.async_get_or_create(
+        config_entry_id="entry-1", identifiers={("bridgeid", "4567")}
+    )
+
+    assert device_registry.async_entries_for_config_entry(registry, "entry-1") == [
+        device1,
+        device2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "entry-2") == [
+        device2
+    ]
+
+    device1 = registry.async_update_device(device1.id, area_id="area-1")
+    device2 = registry.async_update_device(
+        device2.id, area_id="area-1", remove_config_entry_id="entry-1"
+    )
+    assert device_registry.async_entries_for_area(registry, "area-1") == [
+        device1,
+        device2,
+    ]
+    assert device_registry.async_entries_for_config_entry(registry, "entry-1") == [
+        device1
+    ]
+
+    # The indexes are built when loading
+    registry2 = device_registry.DeviceRegistry(hass)
+    await flush_store(registry._store)
+    await registry2.async_load()
+    assert device_registry.async_entries_for_area(registry2, "area-1") == [
+        device1,
+        device2,
+    ]
+
+    registry.async_clear_area_id("area-1")
+    assert device_registry.async_entries_for_area(registry, "area-1") == []
+
+    registry.async_remove_device(device1.id)
+    assert device_registry.async_entries_for_config_entry(registry, "entry-1") == []
+
+
 async def test_deleted_device_removing_area_id(registry):
     """Make sure we can clear area id of deleted device."""
     entry = registry.async_get_or_create(
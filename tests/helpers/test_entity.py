@@ -744,3 +744,42 @@ async def test_removing_entity_unavailable(hass):
     state = hass.states.get("hello.world")
     assert state is not None
     assert state.state == STATE_UNAVAILABLE
+
+
+async def test_skip_unchanged_writes(hass):
+    """Test writes are skipped when the state and attributes did not change."""
+    ent = MockEntity(name="test", state="on")
+    ent.hass = hass
+    ent.entity_id = "hello.world"
+
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.state == "on"
+    assert ent.writes_skipped == 0
+
+    ent.async_write_ha_state()
+    assert hass.states.get("hello.world") is state
+    assert ent.writes_skipped == 1
+
+    # Changed attributes are written
+    ent._values["capability_attributes"] = {"hello": "world"}
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.attributes["hello"] == "world"
+    assert ent.writes_skipped == 1
+
+    # The state is written again if something else changed it
+    hass.states.async_set("hello.world", "off")
+    ent.async_write_ha_state()
+    state = hass.states.get("hello.world")
+    assert state.state == "on"
+    assert state.attributes["hello"] == "world"
+    assert ent.writes_skipped == 1
+
+    # Forced updates are always written
+    with patch.object(
+        entity.Entity, "force_update", new_callable=PropertyMock, return_value=True
+    ):
+        ent.async_write_ha_state()
+    assert hass.states.get("hello.world") is not state
+    assert ent.writes_skipped == 1
@@ -116,6 +116,11 @@ async def test_set_scan_interval_via_config(mock_track, hass):
         {DOMAIN: {"platform": "platform", "scan_interval": timedelta(seconds=30)}}
     )
 
+    await hass.async_block_till_done()
+    assert not mock_track.called
+
+    # Polling starts within the scan interval
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
     await hass.async_block_till_done()
     assert mock_track.called
     assert timedelta(seconds=30) == mock_track.call_args[0][2]
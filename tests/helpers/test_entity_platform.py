@@ -94,6 +94,139 @@ async def test_polling_updates_entities_with_exception(hass):
     assert len(update_err) == 1
 
 
+async def test_polling_spread_over_interval(hass):
+    """Test polls of large platforms and platforms sharing an interval are spread."""
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=30))
+    other_platform = MockEntityPlatform(
+        hass, platform_name="other", scan_interval=timedelta(seconds=30)
+    )
+    updates = []
+
+    def create_entity(platform_name, number):
+        entity = MockEntity(name=f"{platform_name} {number}", should_poll=True)
+
+        async def async_update():
+            updates.append(entity.name)
+
+        entity.async_update = async_update
+        return entity
+
+    await platform.async_add_entities(
+        [create_entity("test", number) for number in range(25)]
+    )
+    await other_platform.async_add_entities([create_entity("other", 0)])
+    now = dt_util.utcnow()
+
+    async def async_fire_time(seconds):
+        point_in_time = now + timedelta(seconds=seconds)
+        with patch("homeassistant.util.dt.utcnow", return_value=point_in_time):
+            # Timers scheduled for exactly this time are due
+            async_fire_time_changed(hass, point_in_time + timedelta(seconds=0.1))
+            await hass.async_block_till_done()
+
+    # The second platform starts polling part way into the interval
+    await async_fire_time(12)
+    assert updates == ["other 0"]
+    updates.clear()
+
+    # Each round the entities are polled in shards spread over the interval
+    for offset, shard in ((30, range(10)), (40, range(10, 20)), (50, range(20, 25))):
+        await async_fire_time(offset)
+        assert [name for name in updates if name.startswith("test")] == [
+            f"test {number}" for number in shard
+        ]
+        updates.clear()
+
+    assert len(platform.poll_latency) == 25
+    assert platform.skipped_polls == {}
+
+
+async def test_polling_slot_released_on_reset(hass):
+    """Test a reset platform gives its polling offset back."""
+    scan_interval = timedelta(seconds=30)
+    platform = MockEntityPlatform(hass, scan_interval=scan_interval)
+    other_platform = MockEntityPlatform(
+        hass, platform_name="other", scan_interval=scan_interval
+    )
+    await platform.async_add_entities([MockEntity(name="test", should_poll=True)])
+    await other_platform.async_add_entities(
+        [MockEntity(name="other", should_poll=True)]
+    )
+    taken = hass.data[entity_platform.DATA_POLLING_PLATFORMS][scan_interval]
+    assert taken == {0, 1}
+
+    await platform.async_reset()
+    assert taken == {1}
+
+    reloaded_platform = MockEntityPlatform(hass, scan_interval=scan_interval)
+    await reloaded_platform.async_add_entities(
+        [MockEntity(name="test", should_poll=True)]
+    )
+    assert taken == {0, 1}
+
+
+async def test_polling_skips_entities_still_updating(hass, caplog):
+    """Test entities still updating are skipped without blocking the others."""
+    platform = MockEntityPlatform(hass, scan_interval=timedelta(seconds=20))
+    update_done = asyncio.Event()
+    slow_updates = []
+    updates = []
+
+    async def slow_update():
+        slow_updates.append(None)
+        await update_done.wait()
+
+    slow_ent = MockEntity(name="slow", should_poll=True)
+    slow_ent.async_update = slow_update
+    ent = MockEntity(name="fast", should_poll=True)
+
+    async def fast_update():
+        updates.append(None)
+
+    ent.async_update = fast_update
+
+    async def async_run_pending():
+        # Can't block till done while the slow update is pending
+        for _ in range(10):
+            await asyncio.sleep(0)
+
+    await platform.async_add_entities([slow_ent, ent])
+    now = dt_util.utcnow()
+
+    async_fire_time_changed(hass, now + timedelta(seconds=20))
+    await async_run_pending()
+    async_fire_time_changed(hass, now + timedelta(seconds=40))
+    await async_run_pending()
+
+    assert len(slow_updates) == 1
+    assert len(updates) == 2
+    assert platform.skipped_polls == {"test_domain.slow": 1}
+    assert (
+        "Updating test_platform test_domain took longer than the scheduled update "
+        "interval 0:00:20, skipping the update of test_domain.slow" in caplog.text
+    )
+
+    update_done.set()
+    await hass.async_block_till_done()
+    assert "test_domain.slow" in platform.poll_latency
+
+
+async def test_writes_skipped_counted_per_platform(hass):
+    """Test unchanged state writes are counted by the platform."""
+    platform = MockEntityPlatform(hass)
+    ent1 = MockEntity(name="one", state="on")
+    ent2 = MockEntity(name="two", state="on")
+    await platform.async_add_entities([ent1, ent2])
+    assert platform.writes_skipped == 0
+
+    ent1.async_write_ha_state()
+    ent2.async_write_ha_state()
+    ent2.async_write_ha_state()
+    assert ent1.writes_skipped == 1
+    assert ent2.writes_skipped == 2
+    assert platform.writes_skipped == 3
+
+
 async def test_update_state_adds_entities(hass):
     """Test if updating poll entities cause an entity to be added works."""
     component = EntityComponent(_LOGGER, DOMAIN, hass)
@@ -156,6 +289,11 @@ async def test_set_scan_interval_via_platform(mock_track, hass):
 
     component.setup({DOMAIN: {"platform": "platform"}})
 
+    await hass.async_block_till_done()
+    assert not mock_track.called
+
+    # Polling starts within the scan interval
+    async_fire_time_changed(hass, dt_util.utcnow() + timedelta(seconds=30))
     await hass.async_block_till_done()
     assert mock_track.called
     assert timedelta(seconds=30) == mock_track.call_args[0][2]
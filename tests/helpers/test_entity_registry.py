@@ -350,6 +350,57 @@ async def test_removing_area_id(registry):
     assert entry_w_area != entry_wo_area
 
 
+async def test_entries_indexed(hass, registry):
+    """Test entries are found by device, area and config entry after changes."""
+    config_entry = MockConfigEntry(domain="light")
+    entry1 = registry.async_get_or_create(
+        "light", "hue", "1234", device_id="device-1", config_entry=config_entry
+    )
+    entry2 = registry.async_get_or_create(
+        "light", "hue", "5678", device_id="device-1", disabled_by=er.DISABLED_USER
+    )
+
+    assert er.async_entries_for_device(registry, "device-1") == [entry1]
+    assert er.async_entries_for_device(
+        registry, "device-1", include_disabled_entities=True
+    ) == [entry1, entry2]
+    assert er.async_entries_for_config_entry(registry, config_entry.entry_id) == [
+        entry1
+    ]
+
+    registry.async_get_or_create("light", "hue", "1234", device_id="device-2")
+    entry1 = registry.async_update_entity(
+        entry1.entity_id, new_entity_id="light.renamed", area_id="area-1"
+    )
+    assert er.async_entries_for_device(registry, "device-1") == []
+    assert er.async_entries_for_device(registry, "device-2") == [entry1]
+    assert er.async_entries_for_area(registry, "area-1") == [entry1]
+    assert er.async_entries_for_config_entry(registry, config_entry.entry_id) == [
+        entry1
+    ]
+
+    # The indexes are built when loading
+    registry2 = er.EntityRegistry(hass)
+    await flush_store(registry._store)
+    await registry2.async_load()
+    assert [
+        entry.entity_id for entry in er.async_entries_for_area(registry2, "area-1")
+    ] == [entry1.entity_id]
+    assert [
+        entry.entity_id
+        for entry in er.async_entries_for_device(
+            registry2, "device-1", include_disabled_entities=True
+        )
+    ] == [entry2.entity_id]
+
+    registry.async_clear_area_id("area-1")
+    assert er.async_entries_for_area(registry, "area-1") == []
+
+    registry.async_clear_config_entry(config_entry.entry_id)
+    assert er.async_entries_for_config_entry(registry, config_entry.entry_id) == []
+    assert er.async_entries_for_device(registry, "device-2") == []
+
+
 @pytest.mark.parametrize("load_registries", [False])
 async def test_migration(hass):
     """Test migration from old data to new."""
@@ -9,7 +9,7 @@ import jinja2
 import pytest
 
 from homeassistant.components import sun
-from homeassistant.const import MATCH_ALL
+from homeassistant.const import EVENT_STATE_CHANGED, MATCH_ALL
 import homeassistant.core as ha
 from homeassistant.core import callback
 from homeassistant.exceptions import TemplateError
@@ -18,6 +18,7 @@ from homeassistant.helpers.event import (
     TrackStates,
     TrackTemplate,
     TrackTemplateResult,
+    _event_triggers_rerender,
     async_call_later,
     async_track_point_in_time,
     async_track_point_in_utc_time,
@@ -2026,6 +2027,100 @@ async def test_async_track_template_result_multiple_templates(hass):
     ]
 
 
+async def test_async_track_template_result_routes_affected_templates(hass):
+    """Test state changes are only routed to the templates depending on them."""
+    hass.states.async_set("sensor.one", "1")
+    hass.states.async_set("sensor.two", "2")
+
+    template_1 = Template("{{ states('sensor.one') }}")
+    template_2 = Template("{{ states('sensor.two') }}")
+    template_3 = Template("{{ states.light | count }}")
+    template_4 = Template("{{ states('sensor.one') | int + 1 }}")
+
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(event, updates):
+        refresh_runs.append(updates)
+
+    info = async_track_template_result(
+        hass,
+        [
+            TrackTemplate(template_1, None),
+            TrackTemplate(template_2, None),
+            TrackTemplate(template_3, None),
+        ],
+        refresh_listener,
+    )
+    info2 = async_track_template_result(
+        hass, [TrackTemplate(template_4, None)], refresh_listener
+    )
+    await hass.async_block_till_done()
+
+    with patch(
+        "homeassistant.helpers.event._event_triggers_rerender",
+        wraps=_event_triggers_rerender,
+    ) as mock_triggers_rerender:
+        hass.states.async_set("sensor.one", "3")
+        await hass.async_block_till_done()
+
+    assert mock_triggers_rerender.call_count == 2
+    assert refresh_runs == [
+        [TrackTemplateResult(template_1, None, 3)],
+        [TrackTemplateResult(template_4, None, 4)],
+    ]
+
+    refresh_runs = []
+    with patch(
+        "homeassistant.helpers.event._event_triggers_rerender",
+        wraps=_event_triggers_rerender,
+    ) as mock_triggers_rerender:
+        hass.states.async_set("sensor.three", "3")
+        await hass.async_block_till_done()
+
+    assert mock_triggers_rerender.call_count == 0
+    assert refresh_runs == []
+
+    hass.states.async_set("light.one", "on")
+    await hass.async_block_till_done()
+    assert refresh_runs == [[TrackTemplateResult(template_3, None, 1)]]
+
+    info.async_remove()
+    info2.async_remove()
+    await hass.async_block_till_done()
+
+    refresh_runs = []
+    hass.states.async_set("sensor.one", "4")
+    await hass.async_block_till_done()
+    assert refresh_runs == []
+    assert EVENT_STATE_CHANGED not in hass.bus.async_listeners()
+
+
+async def test_async_track_template_result_refresh_unknown_templates(hass):
+    """Test refreshing only templates of another tracker renders nothing."""
+    hass.states.async_set("sensor.one", "1")
+    template_1 = Template("{{ states('sensor.one') }}")
+    other_template = Template("{{ states('sensor.two') }}")
+    refresh_runs = []
+
+    @ha.callback
+    def refresh_listener(event, updates):
+        refresh_runs.append(updates)
+
+    info = async_track_template_result(
+        hass, [TrackTemplate(template_1, None)], refresh_listener
+    )
+    await hass.async_block_till_done()
+
+    hass.states.async_set("sensor.one", "2")
+    info.async_refresh_templates(
+        ha.Event(EVENT_STATE_CHANGED, {"entity_id": "sensor.two"}), [other_template]
+    )
+    assert refresh_runs == []
+
+    info.async_remove()
+
+
 async def test_async_track_template_result_multiple_templates_mixing_domain(hass):
     """Test tracking multiple templates when tracking entities and an entire domain."""
 
@@ -0,0 +1,118 @@
+"""Test the file cache helper."""
+from datetime import timedelta
+import json
+import os
+from unittest.mock import Mock
+
+import pytest
+
+from homeassistant.const import __version__
+from homeassistant.helpers import file_cache
+from homeassistant.util import dt as dt_util
+
+from tests.common import async_fire_time_changed
+
+
+def _parse(path):
+    with open(path) as fil:
+        return json.load(fil)
+
+
+async def test_load_file_cached(hass, hass_storage, tmp_path):
+    """Test parsed files are cached until they change."""
+    path = tmp_path / "data.json"
+    path.write_text('{"hello": "world"}')
+    parse = Mock(side_effect=_parse)
+
+    # Without a loaded cache the file is always parsed
+    assert file_cache.load_file(hass, str(path), parse) == {"hello": "world"}
+    assert parse.call_count == 1
+
+    cache = await file_cache.async_get_file_cache(hass)
+    assert await file_cache.async_get_file_cache(hass) is cache
+
+    for _ in range(2):
+        data = await hass.async_add_executor_job(
+            file_cache.load_file, hass, str(path), parse
+        )
+        await hass.async_block_till_done()
+        assert data == {"hello": "world"}
+    assert parse.call_count == 2
+
+    path.write_text('{"hello": "there"}')
+    os.utime(path, (1000, 1000))
+    data = await hass.async_add_executor_job(cache.load, str(path), parse)
+    await hass.async_block_till_done()
+    assert data == {"hello": "there"}
+    assert parse.call_count == 3
+
+    # Missing files are left to the parser
+    missing = str(tmp_path / "missing.json")
+    assert await hass.async_add_executor_job(cache.load, missing, lambda _: {}) == {}
+    await hass.async_block_till_done()
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=file_cache.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    stored = hass_storage[file_cache.STORAGE_KEY]["data"]
+    assert stored == {
+        "ha_version": __version__,
+        "entries": {str(path): {"mtime": 1000, "size": 18, "data": {"hello": "there"}}},
+    }
+
+
+@pytest.mark.parametrize("version,parsed", [(__version__, 0), ("0.1.0", 1)])
+async def test_stored_cache(hass, hass_storage, tmp_path, version, parsed):
+    """Test the stored cache is used unless Home Assistant was updated."""
+    path = tmp_path / "data.json"
+    path.write_text('{"hello": "world"}')
+    os.utime(path, (1000, 1000))
+    hass_storage[file_cache.STORAGE_KEY] = {
+        "version": file_cache.STORAGE_VERSION,
+        "key": file_cache.STORAGE_KEY,
+        "data": {
+            "ha_version": version,
+            "entries": {
+                str(path): {"mtime": 1000, "size": 18, "data": {"hello": "cache"}}
+            },
+        },
+    }
+    parse = Mock(side_effect=_parse)
+
+    await file_cache.async_get_file_cache(hass)
+    data = await hass.async_add_executor_job(
+        file_cache.load_file, hass, str(path), parse
+    )
+    await hass.async_block_till_done()
+
+    assert data == ({"hello": "cache"} if parsed == 0 else {"hello": "world"})
+    assert parse.call_count == parsed
+
+
+async def test_removed_files_dropped(hass, hass_storage, tmp_path):
+    """Test entries of removed files are dropped and others are kept."""
+    kept = tmp_path / "kept.json"
+    kept.write_text("{}")
+    removed = str(tmp_path / "removed.json")
+    hass_storage[file_cache.STORAGE_KEY] = {
+        "version": file_cache.STORAGE_VERSION,
+        "key": file_cache.STORAGE_KEY,
+        "data": {
+            "ha_version": __version__,
+            "entries": {
+                str(kept): {"mtime": 1000, "size": 2, "data": {}},
+                removed: {"mtime": 1000, "size": 18, "data": {}},
+            },
+        },
+    }
+
+    await file_cache.async_get_file_cache(hass)
+
+    async_fire_time_changed(
+        hass, dt_util.utcnow() + timedelta(seconds=file_cache.SAVE_DELAY)
+    )
+    await hass.async_block_till_done()
+    # Files that were not loaded in this run are kept
+    entries = hass_storage[file_cache.STORAGE_KEY]["data"]["entries"]
+    assert list(entries) == [str(kept)]
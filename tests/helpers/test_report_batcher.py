@@ -0,0 +1,87 @@
+"""Test the report batcher helper."""
+from datetime import timedelta
+import logging
+from unittest.mock import AsyncMock
+
+from homeassistant.helpers.report_batcher import ReportBatcher
+from homeassistant.util.dt import utcnow
+
+from tests.common import async_fire_time_changed
+
+_LOGGER = logging.getLogger(__name__)
+
+
+async def test_reports_batched(hass):
+    """Test reports are coalesced per key and sent in one batch."""
+    send = AsyncMock()
+    batcher = ReportBatcher(hass, _LOGGER, delay=1, function=send)
+
+    batcher.async_add("light.a", 1)
+    batcher.async_add("light.b", 1)
+    batcher.async_add("light.a", 2)
+    await hass.async_block_till_done()
+    assert send.call_count == 0
+
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+
+    send.assert_called_once_with({"light.a": 2, "light.b": 1})
+    assert batcher.batches == 1
+    assert batcher.reports == 2
+    assert batcher.coalesced == 1
+    assert batcher.dropped == 0
+    assert batcher.last_batch_size == 2
+    assert batcher.max_batch_size == 2
+    assert batcher.last_latency is not None
+
+    # The next report starts a new window
+    batcher.async_add("light.a", 3)
+    await batcher.async_flush()
+    assert send.call_count == 2
+    assert send.call_args[0][0] == {"light.a": 3}
+    assert batcher.batches == 2
+    assert batcher.reports == 3
+    assert batcher.last_batch_size == 1
+    assert batcher.max_batch_size == 2
+
+    # Nothing to send
+    await batcher.async_flush()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=2))
+    await hass.async_block_till_done()
+    assert send.call_count == 2
+
+
+async def test_reports_dropped(hass, caplog):
+    """Test failed and cancelled reports are counted as dropped."""
+    send = AsyncMock(side_effect=ValueError)
+    batcher = ReportBatcher(hass, _LOGGER, delay=1, function=send)
+
+    batcher.async_add("light.a", 1)
+    batcher.async_add("light.b", 1)
+    await batcher.async_flush()
+    assert batcher.dropped == 2
+    assert batcher.batches == 0
+    assert "Error sending 2 reports" in caplog.text
+
+    send.side_effect = None
+    batcher.async_add("light.a", 2)
+    batcher.async_cancel()
+    async_fire_time_changed(hass, utcnow() + timedelta(seconds=1))
+    await hass.async_block_till_done()
+    assert send.call_count == 1
+    assert batcher.dropped == 3
+
+
+async def test_failed_reports_dropped(hass):
+    """Test reports the function failed to send are counted as dropped."""
+    send = AsyncMock(return_value=["light.b"])
+    batcher = ReportBatcher(hass, _LOGGER, delay=1, function=send)
+
+    batcher.async_add("light.a", 1)
+    batcher.async_add("light.b", 1)
+    batcher.async_add("light.c", 1)
+    await batcher.async_flush()
+    assert batcher.batches == 1
+    assert batcher.reports == 2
+    assert batcher.dropped == 1
+    assert batcher.last_batch_size == 3
@@ -375,6 +375,42 @@ async def test_extract_entity_ids_from_area(hass, area_mock):
     )
 
 
+async def test_extract_referenced_entity_ids_cached(hass, area_mock):
+    """Test resolved area targets are cached until a registry changes.
+
+    Registry changes are seen right away, without waiting for their events.
+    """
+    call = ha.ServiceCall("light", "turn_on", {"area_id": "test-area"})
+    expected = {"light.in_area", "light.assigned_to_area"}
+
+    assert await service.async_extract_entity_ids(hass, call) == expected
+    assert await service.async_extract_entity_ids(hass, call) == expected
+    cache = hass.data[service.DATA_TARGET_CACHE]
+    assert (cache.hits, cache.misses, cache.invalidations) == (1, 1, 0)
+
+    # Changing the name of an entity does not affect targets
+    entities = ent_reg.async_get(hass)
+    entities.async_update_entity("light.no_area", name="No area")
+    assert await service.async_extract_entity_ids(hass, call) == expected
+    assert (cache.hits, cache.misses, cache.invalidations) == (2, 1, 0)
+
+    entities.async_update_entity("light.no_area", area_id="test-area")
+    assert await service.async_extract_entity_ids(hass, call) == {
+        *expected,
+        "light.no_area",
+    }
+    assert (cache.hits, cache.misses, cache.invalidations) == (2, 2, 1)
+
+    dev_reg.async_get(hass).async_update_device(
+        entities.async_get("light.in_area").device_id, area_id="diff-area"
+    )
+    assert await service.async_extract_entity_ids(hass, call) == {
+        "light.assigned_to_area",
+        "light.no_area",
+    }
+    assert (cache.hits, cache.misses, cache.invalidations) == (2, 3, 2)
+
+
 async def test_async_get_all_descriptions(hass):
     """Test async_get_all_descriptions."""
     group = hass.components.group
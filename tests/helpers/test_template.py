@@ -2118,35 +2118,94 @@ def test_urlencode(hass):
     assert tpl.async_render() == "the%20quick%20brown%20fox%20%3D%20true"
 
 
-async def test_cache_garbage_collection():
-    """Test caching a template."""
+async def test_compiled_template_cache():
+    """Test templates with the same source share the compiled code."""
     template_string = (
         "{% set dict = {'foo': 'x&y', 'bar': 42} %} {{ dict | urlencode }}"
     )
+    env = template._NO_HASS_ENV  # pylint: disable=protected-access
+    start = env.template_cache_info()
+
     tpl = template.Template(
         (template_string),
     )
     tpl.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    info = env.template_cache_info()
+    assert info.misses == start.misses + 1
+    assert info.currsize == start.currsize + 1
 
     tpl2 = template.Template(
         (template_string),
     )
     tpl2.ensure_valid()
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-
-    del tpl
-    assert template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
-    del tpl2
-    assert not template._NO_HASS_ENV.template_cache.get(
-        template_string
-    )  # pylint: disable=protected-access
+    info = env.template_cache_info()
+    assert info.hits == start.hits + 1
+    assert info.misses == start.misses + 1
+
+    # Compiled code outlives the templates using it
+    del tpl, tpl2
+    template.Template(template_string).ensure_valid()
+    assert env.template_cache_info().hits == start.hits + 2
+    assert env.template_cache_info().maxsize == template.COMPILED_TEMPLATE_CACHE_SIZE
+
+
+async def test_render_to_info_memoized(hass):
+    """Test identical templates render once per state change."""
+    hass.states.async_set("sensor.temperature", "20")
+    tpl = template.Template("{{ states('sensor.temperature') }}", hass)
+    tpl2 = template.Template("{{ states('sensor.temperature') }}", hass)
+
+    info = tpl.async_render_to_info()
+    info2 = tpl2.async_render_to_info()
+    memo = hass.data[template._RENDER_MEMO]  # pylint: disable=protected-access
+    assert memo.hits == 1
+    assert info.result() == info2.result() == 20
+    assert info2.template is tpl2
+    assert info2.entities == {"sensor.temperature"}
+    # The memoized render is copied, not shared
+    assert info2.entities is not info.entities
+    assert info2.filter.__self__ is info2
+    assert info2.filter("sensor.temperature")
+
+    # A changed state invalidates the memoized render
+    hass.states.async_set("sensor.temperature", "21")
+    assert tpl2.async_render_to_info().result() == 21
+    assert tpl.async_render_to_info().result() == 21
+    assert memo.hits == 2
+
+    # Different variables are rendered separately
+    tpl3 = template.Template("{{ states(entity) }}", hass)
+    assert tpl3.async_render_to_info({"entity": "sensor.temperature"}).result() == 21
+    assert tpl3.async_render_to_info({"entity": "sensor.other"}).result() == "unknown"
+
+    # Equal variables of different types are rendered separately
+    tpl5 = template.Template("{{ states('sensor.temperature') ~ x }}", hass)
+    assert tpl5.async_render_to_info({"x": 1}).result() == 211
+    assert tpl5.async_render_to_info({"x": True}).result() == "21True"
+    assert tpl5.async_render_to_info({"x": 1.0}).result() == 211.0
+
+    # Renders depending on more than specific entities are not memoized
+    hits = memo.hits
+    for source in (
+        "{{ states.sensor | count }}",
+        "{{ now() }}",
+        "{{ utcnow() }}",
+        "{{ [1, 2] | random }}",
+        "{{ device_entities('abc') }}",
+        "{{ distance(1, 2) }}",
+        "{{ closest(states.sensor.temperature) }}",
+        "{{ relative_time(strptime('2021-01-01', '%Y-%m-%d')) }}",
+    ):
+        tpl4 = template.Template(source, hass)
+        tpl4.async_render_to_info()
+        tpl4.async_render_to_info()
+    assert memo.hits == hits
+
+    # The memo only lives for the current loop iteration
+    await hass.async_block_till_done()
+    hits = memo.hits
+    tpl.async_render_to_info()
+    assert memo.hits == hits
 
 
 def test_is_template_string():
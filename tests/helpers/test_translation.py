@@ -211,7 +211,7 @@ async def test_get_translations_while_loading_components(hass):
     hass.config.components.add("component1")
     load_count = 0
 
-    def mock_load_translation_files(files):
+    def mock_load_translation_files(files, file_cache):
         """Mock load translation files."""
         nonlocal load_count
         load_count += 1
@@ -269,9 +269,9 @@ async def test_translation_merging(hass, caplog):
 
     orig_load_translations = translation.load_translations_files
 
-    def mock_load_translations_files(files):
+    def mock_load_translations_files(files, file_cache):
         """Mock loading."""
-        result = orig_load_translations(files)
+        result = orig_load_translations(files, file_cache)
         result["sensor.season"] = {"state": "bad data"}
         return result
 
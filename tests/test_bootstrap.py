@@ -317,6 +317,108 @@ async def test_setup_after_deps_not_present(hass):
     assert order == ["root", "second_dep"]
 
 
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_not_blocked_by_stage_1(hass, hass_storage, caplog):
+    """Test integrations are set up when their dependencies are done."""
+    assert "cloud" in bootstrap.STAGE_1_INTEGRATIONS
+    order = []
+    cloud_wait = asyncio.Event()
+
+    def gen_domain_setup(domain):
+        async def async_setup(hass, config):
+            if domain == "cloud":
+                # Only finishes when a stage 2 integration is set up
+                await cloud_wait.wait()
+            elif domain == "independent":
+                cloud_wait.set()
+            order.append(domain)
+            return True
+
+        return async_setup
+
+    mock_integration(
+        hass, MockModule(domain="cloud", async_setup=gen_domain_setup("cloud"))
+    )
+    mock_integration(
+        hass,
+        MockModule(domain="independent", async_setup=gen_domain_setup("independent")),
+    )
+    mock_integration(
+        hass,
+        MockModule(
+            domain="after_cloud",
+            async_setup=gen_domain_setup("after_cloud"),
+            partial_manifest={"after_dependencies": ["cloud"]},
+        ),
+    )
+    hass_storage[bootstrap.SETUP_TIMELINE_KEY] = {
+        "version": bootstrap.SETUP_TIMELINE_VERSION,
+        "key": bootstrap.SETUP_TIMELINE_KEY,
+        "data": {
+            "integrations": {"cloud": {"start": 0, "duration": -5, "success": True}},
+            "critical_path": ["cloud"],
+        },
+    }
+
+    await bootstrap._async_set_up_integrations(
+        hass, {"cloud": {}, "independent": {}, "after_cloud": {}}
+    )
+
+    assert order == ["independent", "cloud", "after_cloud"]
+
+    timeline = hass.data[bootstrap.DATA_SETUP_TIMELINE]
+    assert timeline["critical_path"] == ["cloud", "after_cloud"]
+    assert set(timeline["integrations"]) == {"cloud", "independent", "after_cloud"}
+    assert all(info["success"] for info in timeline["integrations"].values())
+    assert (
+        timeline["integrations"]["after_cloud"]["start"]
+        >= timeline["integrations"]["cloud"]["start"]
+        + timeline["integrations"]["cloud"]["duration"]
+    )
+    assert "Setup critical path: cloud" in caplog.text
+    assert "than on the previous start: cloud" in caplog.text
+    assert hass_storage[bootstrap.SETUP_TIMELINE_KEY]["data"] == timeline
+
+
+@pytest.mark.parametrize("load_registries", [False])
+async def test_setup_timeline_after_timeout(hass, hass_storage, caplog):
+    """Test setups that fail or do not finish in time are not successful."""
+    slow_wait = asyncio.Event()
+
+    async def async_setup_slow(hass, config):
+        await slow_wait.wait()
+        return True
+
+    async def async_setup_fails(hass, config):
+        raise ValueError("setup failed")
+
+    mock_integration(hass, MockModule(domain="slow", async_setup=async_setup_slow))
+    mock_integration(hass, MockModule(domain="fails", async_setup=async_setup_fails))
+    mock_integration(
+        hass,
+        MockModule(
+            domain="after_slow", partial_manifest={"after_dependencies": ["slow"]}
+        ),
+    )
+
+    with patch.object(bootstrap, "SETUP_TIMEOUT", 0.1), patch.object(
+        bootstrap, "COOLDOWN_TIME", 0
+    ):
+        await bootstrap._async_set_up_integrations(
+            hass, {"slow": {}, "fails": {}, "after_slow": {}}
+        )
+
+    assert "Setup timed out" in caplog.text
+    integrations = hass.data[bootstrap.DATA_SETUP_TIMELINE]["integrations"]
+    assert integrations["fails"]["success"] is False
+    assert integrations["slow"]["success"] is False
+    assert integrations["after_slow"]["success"] is False
+
+    slow_wait.set()
+    await hass.async_block_till_done()
+    assert integrations["slow"]["success"] is True
+
+
 @pytest.fixture
 def mock_is_virtual_env():
     """Mock enable logging."""
@@ -408,6 +408,48 @@ async def test_eventbus_filtered_listener(hass):
     unsub()
 
 
+async def test_eventbus_entity_listener(hass):
+    """Test we can listen for events of specific entities."""
+    calls = []
+
+    @ha.callback
+    def listener(event):
+        """Mock listener."""
+        calls.append(event)
+
+    unsub = hass.bus.async_listen_entities(
+        "test", ["light.kitchen", "light.bowl"], listener
+    )
+    assert hass.bus.async_listeners()["test"] == 2
+    assert hass.bus.async_entity_listeners("test") == {
+        "light.kitchen": 1,
+        "light.bowl": 1,
+    }
+
+    hass.bus.async_fire("test", {"entity_id": "light.other"})
+    hass.bus.async_fire("test", {"entity_id": ["light.kitchen"]})
+    hass.bus.async_fire("test")
+    hass.bus.async_fire("other", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 0
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    hass.bus.async_fire("test", {"entity_id": "light.bowl"})
+    await hass.async_block_till_done()
+    assert [event.data["entity_id"] for event in calls] == [
+        "light.kitchen",
+        "light.bowl",
+    ]
+
+    unsub()
+    assert "test" not in hass.bus.async_listeners()
+    assert hass.bus.async_entity_listeners("test") == {}
+
+    hass.bus.async_fire("test", {"entity_id": "light.kitchen"})
+    await hass.async_block_till_done()
+    assert len(calls) == 2
+
+
 async def test_eventbus_unsubscribe_listener(hass):
     """Test unsubscribe listener from returned function."""
     calls = []
@@ -627,6 +669,38 @@ async def test_statemachine_entity_ids(hass):
     assert states == ["light.bowl", "switch.ac"]
 
 
+async def test_statemachine_domain_filter(hass):
+    """Test domain filtered queries stay in sync with set and remove."""
+    hass.states.async_set("light.bowl", "on")
+    hass.states.async_set("switch.ac", "off")
+    hass.states.async_set("light.ceiling", "off")
+    hass.states.async_set("light.bowl", "off")
+
+    assert hass.states.async_entity_ids("LIGHT") == ["light.bowl", "light.ceiling"]
+    assert hass.states.async_entity_ids(["switch", "light"]) == [
+        "switch.ac",
+        "light.bowl",
+        "light.ceiling",
+    ]
+    assert hass.states.async_entity_ids_count("light") == 2
+    assert hass.states.async_entity_ids_count(("light", "switch", "fan")) == 3
+    assert hass.states.async_entity_ids(["light", "LIGHT"]) == [
+        "light.bowl",
+        "light.ceiling",
+    ]
+    assert hass.states.async_entity_ids_count(("Light", "light")) == 2
+    assert len(hass.states.async_all(["light", "light"])) == 2
+    assert [state.state for state in hass.states.async_all("light")] == ["off", "off"]
+    assert hass.states.async_all("light")[0] is hass.states.get("light.bowl")
+
+    hass.states.async_remove("light.bowl")
+    assert hass.states.async_entity_ids("light") == ["light.ceiling"]
+    hass.states.async_remove("light.ceiling")
+    assert hass.states.async_entity_ids("light") == []
+    assert hass.states.async_entity_ids_count("light") == 0
+    assert hass.states.async_all("light") == []
+
+
 async def test_statemachine_remove(hass):
     """Test remove method."""
     hass.states.async_set("light.bowl", "on", {})
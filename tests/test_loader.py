@@ -1,11 +1,14 @@
 """Test to verify that we can load components."""
-from unittest.mock import ANY, patch
+import asyncio
+from unittest.mock import ANY, Mock, patch
 
 import pytest
 
 from homeassistant import core, loader
 from homeassistant.components import http, hue
 from homeassistant.components.hue import light as hue_light
+from homeassistant.const import EVENT_HOMEASSISTANT_FINAL_WRITE
+from homeassistant.helpers import file_cache
 
 from tests.common import MockModule, async_mock_service, mock_integration
 
@@ -214,6 +217,88 @@ async def test_get_integration_custom_component(hass, enable_custom_integrations
     assert integration.name == "Test Package"
 
 
+async def test_async_get_component_in_executor(hass, enable_custom_integrations):
+    """Test components and platforms are imported once in the executor."""
+    integration = await loader.async_get_integration(hass, "test_package")
+
+    with patch.object(
+        hass, "async_add_executor_job", wraps=hass.async_add_executor_job
+    ) as mock_executor:
+        components = await asyncio.gather(
+            integration.async_get_component(), integration.async_get_component()
+        )
+        platform = await integration.async_get_platform("const")
+
+    assert components[0] is components[1]
+    assert components[0].DOMAIN == "test_package"
+    assert platform is integration.get_platform("const")
+    assert mock_executor.call_count == 2
+
+    # Imported modules are cached
+    assert await integration.async_get_component() is components[0]
+    assert mock_executor.call_count == 2
+
+    assert set(integration.import_times) == {"test_package", "test_package.const"}
+    assert loader.async_get_import_times(hass) == {
+        "test_package": integration.import_times
+    }
+
+
+async def test_async_get_platform_import_error(hass):
+    """Test import errors are raised to all waiting callers."""
+    integration = await loader.async_get_integration(hass, "test_embedded")
+
+    results = await asyncio.gather(
+        integration.async_get_platform("not_existing"),
+        integration.async_get_platform("not_existing"),
+        return_exceptions=True,
+    )
+    assert all(isinstance(result, ImportError) for result in results)
+
+
+async def test_import_in_event_loop_only_without_loop(hass):
+    """Test only imports that need the event loop are run again in the loop."""
+    integration = await loader.async_get_integration(hass, "test_embedded")
+    module = Mock()
+
+    import_module = Mock(
+        side_effect=[RuntimeError("There is no current event loop in thread"), module]
+    )
+    assert await integration._async_import("needs_loop", import_module) is module
+    assert import_module.call_count == 2
+
+    import_module = Mock(side_effect=RuntimeError("Module failed"))
+    with pytest.raises(RuntimeError, match="Module failed"):
+        await integration._async_import("failing", import_module)
+    assert import_module.call_count == 1
+
+
+async def test_manifests_cached(hass, hass_storage, enable_custom_integrations):
+    """Test resolved manifests are stored in the file cache."""
+    await loader.async_get_integration(hass, "test_package")
+    await loader.async_get_integration(hass, "hue")
+    await hass.async_block_till_done()
+    cache = await file_cache.async_get_file_cache(hass)
+
+    with patch("pathlib.Path.read_text") as mock_read:
+        hass.data.pop(loader.DATA_INTEGRATIONS)
+        hass.data.pop(loader.DATA_CUSTOM_COMPONENTS)
+        integration = await loader.async_get_integration(hass, "test_package")
+        assert (await loader.async_get_integration(hass, "hue")).name == "Philips Hue"
+
+    assert integration.name == "Test Package"
+    assert not mock_read.called
+
+    hass.bus.async_fire(EVENT_HOMEASSISTANT_FINAL_WRITE)
+    await hass.async_block_till_done()
+    entries = hass_storage[file_cache.STORAGE_KEY]["data"]["entries"]
+    assert str(integration.file_path / "manifest.json") in entries
+    # The cached manifest is shared and not changed by the integration
+    cached = cache.load(str(integration.file_path / "manifest.json"), None)
+    assert "is_built_in" not in cached
+    assert integration.manifest == {**cached, "is_built_in": False}
+
+
 def test_integration_properties(hass):
     """Test integration properties."""
     integration = loader.Integration(